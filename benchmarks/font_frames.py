@@ -0,0 +1,61 @@
+"""
+Frame times behind the shared font registry (ui.get_font).
+
+Times the average of --draws draws of GameScreen and BankDetailsScreen at
+SCREEN_WIDTH x SCREEN_HEIGHT with SDL's dummy video driver. It only uses
+APIs that predate the registry, so the before and after numbers come from
+running it on both trees:
+
+    git worktree add /tmp/before 9ea59ae^
+    PYTHONPATH=/tmp/before python benchmarks/font_frames.py
+    PYTHONPATH=. python benchmarks/font_frames.py
+
+For per-screen percentiles of every screen, use moneySmartz.render_bench.
+"""
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import time
+import pygame
+from moneySmartz.game import Game
+from moneySmartz.models import Player, BankAccount
+from moneySmartz.ui import GUIManager
+from moneySmartz.screens import GameScreen, BankDetailsScreen
+
+def build_game():
+    """Build a game with a player who has a bank account with some history."""
+    game = Game()
+    game.player = Player("Sam")
+    game.player.bank_account = BankAccount()
+    for i in range(20):
+        game.player.bank_account.deposit(100 + i)
+    return game
+
+def mean_draw_ms(screen, surface, draws):
+    """Get the average time of one draw of a screen in ms."""
+    screen.draw(surface)  # Warm up
+    start = time.perf_counter()
+    for _ in range(draws):
+        screen.draw(surface)
+    return (time.perf_counter() - start) / draws * 1000
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Average draw time of GameScreen and BankDetailsScreen.")
+    parser.add_argument("--draws", type=int, default=500, help="draws per screen")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    game = build_game()
+    gui_manager = GUIManager(game)
+    game.gui_manager = gui_manager
+
+    for screen_class in (GameScreen, BankDetailsScreen):
+        screen = screen_class(game)
+        gui_manager.set_screen(screen)
+        print(f"{screen_class.__name__:20} {mean_draw_ms(screen, gui_manager.screen, args.draws):.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -3,31 +3,44 @@ Money Smartz: Financial Life Simulator
 
 This is the main entry point for the Money Smartz game.
 It initializes the game and starts the main game loop.
+
+Usage:
+    python main.py                          # GUI
+    python main.py --text                   # Text mode
+    python main.py --text --script FILE     # Text mode answering prompts from FILE (- for stdin)
+    python main.py --profile out.prof       # Profile the session (also writes out.folded)
+    python main.py --profile-sim 100        # Profile 100 simulated lives without the GUI
+    python main.py --metrics-port 9464      # Serve metrics on http://127.0.0.1:9464/metrics
+    python main.py --metrics-file m.jsonl   # Append the metrics as JSON lines on exit
 """
 
-import pygame
+import argparse
+import atexit
 import sys
-from moneySmartz import Game, GUIManager
-from moneySmartz.screens import TitleScreen
+from moneySmartz import Game
 
-def main():
+def run_gui():
     """
-    Main function that initializes and runs the game.
+    Initialize pygame and run the GUI game.
     """
+    import pygame
+    from moneySmartz import GUIManager
+    from moneySmartz.screens import TitleScreen
+
     # Initialize pygame
     pygame.init()
     pygame.font.init()
-    
+
     # Create game instance
     game = Game()
-    
+
     # Create GUI manager
     gui_manager = GUIManager(game)
     game.gui_manager = gui_manager
-    
+
     # Set initial screen
     gui_manager.set_screen(TitleScreen(game))
-    
+
     # Run the game
     try:
         gui_manager.run()
@@ -35,7 +48,82 @@ def main():
         print(f"Error: {e}")
     finally:
         pygame.quit()
-        sys.exit()
+
+def run_text(script=None):
+    """
+    Run the text mode game. script is a file of answers to the prompts, one per line
+    ("-" reads them from stdin); without one the game reads the keyboard.
+    Returns the exit status.
+    """
+    game = Game()
+
+    script_file = None
+    if script == "-":
+        game.script = iter(sys.stdin)
+    elif script:
+        script_file = open(script)
+        game.script = iter(script_file)
+
+    try:
+        game.start_game()
+    except EOFError:
+        print("\nThe input ended before the game did.", file=sys.stderr)
+        return 1
+    finally:
+        if script_file:
+            script_file.close()
+    return 0
+
+def run_simulations(lives):
+    """
+    Simulate lives headlessly, one per seed.
+    """
+    from moneySmartz.simulation import simulate_life
+
+    for seed in range(lives):
+        simulate_life(seed)
+    return 0
+
+def main(argv=None):
+    """
+    Main function that initializes and runs the game.
+    """
+    parser = argparse.ArgumentParser(description="Money Smartz: Financial Life Simulator")
+    parser.add_argument("--text", action="store_true", help="play in the terminal instead of the window")
+    parser.add_argument("--script", metavar="FILE", help="text mode: answer the prompts from FILE, one per line (- for stdin)")
+    parser.add_argument("--profile", metavar="PATH", help="run under cProfile and write the profile to PATH and collapsed stacks next to it")
+    parser.add_argument("--profile-sim", metavar="N", type=int, help="profile N simulated lives instead of playing (default PATH: simulation.prof)")
+    parser.add_argument("--metrics-file", metavar="PATH", help="collect metrics and append them to PATH as JSON lines on exit")
+    parser.add_argument("--metrics-port", metavar="PORT", type=int, help="collect metrics and serve them on http://127.0.0.1:PORT/metrics")
+    args = parser.parse_args(argv)
+
+    if args.script and not args.text:
+        parser.error("--script needs --text")
+
+    if args.metrics_file or args.metrics_port:
+        from moneySmartz import metrics
+        metrics.registry.enable()
+        if args.metrics_port:
+            metrics.start_server(args.metrics_port)
+        if args.metrics_file:
+            atexit.register(metrics.registry.dump_jsonl, args.metrics_file)
+
+    if args.profile_sim is not None:
+        run, run_args = run_simulations, (args.profile_sim,)
+        args.profile = args.profile or "simulation.prof"
+    elif args.text:
+        run, run_args = run_text, (args.script,)
+    else:
+        run, run_args = run_gui, ()
+
+    if not args.profile:
+        return run(*run_args)
+
+    from moneySmartz.profiling import profile_call, folded_path
+    status, summary = profile_call(run, args.profile, *run_args)
+    print(summary, file=sys.stderr)
+    print(f"\nWrote {args.profile} and {folded_path(args.profile)}", file=sys.stderr)
+    return status
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
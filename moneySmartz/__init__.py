@@ -4,13 +4,37 @@ Money Smartz: Financial Life Simulator
 A 2D graphical financial education game inspired by the classic Oregon Trail.
 This game simulates the financial journey of life, from your first bank account
 as a teenager to retirement.
+
+The models and the game engine import without pygame; the UI classes are
+imported on first use.
 """
 
+import importlib
+
 # Export main modules
 from moneySmartz.constants import *
 from moneySmartz.models import Player, BankAccount, Card, Loan, Asset
 from moneySmartz.game import Game
-from moneySmartz.ui import Button, TextInput, Screen, GUIManager
+
+# UI exports, imported on first use (they need pygame)
+_lazy_exports = {
+    "Button": "moneySmartz.ui",
+    "TextInput": "moneySmartz.ui",
+    "Screen": "moneySmartz.ui",
+    "GUIManager": "moneySmartz.ui",
+}
+
+def __getattr__(name):
+    """Import a UI export the first time it is used."""
+    module = _lazy_exports.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_exports))
 
 # Version information
 __version__ = "1.0.0"
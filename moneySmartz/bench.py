@@ -0,0 +1,226 @@
+"""
+Micro-benchmarks for the models and the monthly tick.
+
+Times the model operations (Loan, BankAccount, Card, Asset), the monthly
+finances, random events and a full headless life from 16 to 65 with timeit,
+and measures the memory each operation allocates and keeps with tracemalloc.
+Reports ops/sec and allocations per benchmark as JSON.
+
+Usage:
+    python -m moneySmartz.bench --output bench.json
+    python -m moneySmartz.bench --baseline benchmarks/bench_baseline.json
+
+With --baseline, the exit status is 1 if any benchmark's ops/sec dropped or
+its retained bytes per op grew by more than --threshold.
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import timeit
+import tracemalloc
+from moneySmartz.game import Game
+from moneySmartz.models import Player, BankAccount, Card, Loan, Asset
+from moneySmartz.simulation import simulate_life
+
+ALLOCATION_SLACK_BYTES = 16  # Retained bytes per op ignored when comparing (interpreter noise)
+MAX_TRACED_OPS = 10000  # Ops run under tracemalloc (tracing is ~5x slower)
+
+def mid_life_game():
+    """Build a game in mid-life: a job, savings, a credit card, a car and a house on loans and a family."""
+    game = Game()
+    game.verbose = False
+    game.script = iter(())  # Text-mode events don't wait for Enter
+    player = game.player = Player("Sam")
+    player.age = 35
+    player.education = "College Graduate"
+    player.job = "Software Developer"
+    player.salary = 85000
+    player.bank_account = BankAccount("Savings")
+    player.bank_account.deposit(20000)
+    player.debit_card = Card("Debit")
+    player.credit_card = Card("Credit", 10000)
+    player.credit_card.charge(1500)
+    player.loans.append(Loan("Auto", 18000, 0.05, 5))
+    player.loans.append(Loan("Mortgage", 200000, 0.04, 30))
+    player.assets.append(Asset("Car", "New Economy Car", 18000))
+    player.assets.append(Asset("House", "Mid-size Family Home", 250000))
+    player.family = [{"relation": "Spouse", "age": 34}, {"relation": "Child", "name": "Child 1", "age": 0}]
+    game.current_year = 19
+    return game
+
+# Each benchmark builds fresh state and returns the operation to time
+
+def loan_calculate_payment():
+    return Loan("Mortgage", 200000, 0.04, 30).calculate_payment
+
+def loan_make_payment():
+    loan = Loan("Mortgage", 200000, 0.04, 30)
+    return lambda: loan.make_payment(loan.monthly_payment)
+
+def bank_account_deposit():
+    account = BankAccount()
+    return lambda: account.deposit(100)
+
+def bank_account_withdraw():
+    account = BankAccount()
+    account.balance = 10 ** 12
+    return lambda: account.withdraw(100)
+
+def bank_account_apply_interest():
+    account = BankAccount("Savings")
+    account.deposit(10000)
+    return account.apply_interest
+
+def card_charge():
+    card = Card("Credit", 10 ** 12)
+    return lambda: card.charge(25)
+
+def card_pay():
+    card = Card("Credit", 10 ** 12)
+    card.balance = 10 ** 12
+    return lambda: card.pay(25)
+
+def asset_age_asset():
+    asset = Asset("House", "Mid-size Family Home", 250000)
+    return asset.age_asset
+
+def game_process_monthly_finances():
+    return mid_life_game().process_monthly_finances
+
+def game_trigger_random_event():
+    return mid_life_game().trigger_random_event
+
+def full_life():
+    seeds = iter(range(10 ** 9))
+    return lambda: simulate_life(next(seeds))
+
+BENCHMARKS = {
+    "Loan.calculate_payment": loan_calculate_payment,
+    "Loan.make_payment": loan_make_payment,
+    "BankAccount.deposit": bank_account_deposit,
+    "BankAccount.withdraw": bank_account_withdraw,
+    "BankAccount.apply_interest": bank_account_apply_interest,
+    "Card.charge": card_charge,
+    "Card.pay": card_pay,
+    "Asset.age_asset": asset_age_asset,
+    "Game.process_monthly_finances": game_process_monthly_finances,
+    "Game.trigger_random_event": game_trigger_random_event,
+    "simulate_life": full_life,
+}
+
+def time_benchmark(setup, repeat):
+    """Time an operation with timeit. Returns (calls per timed run, best ops/sec, median ops/sec)."""
+    random.seed(0)
+    timer = timeit.Timer(setup())
+    number, _ = timer.autorange()
+    rates = [number / seconds for seconds in timer.repeat(repeat, number)]
+    return number, max(rates), statistics.median(rates)
+
+def trace_benchmark(setup, number):
+    """
+    Run an operation number times under tracemalloc.
+    Returns (bytes kept per op, blocks kept per op, peak bytes above the start).
+    """
+    random.seed(0)
+    operation = setup()
+    tracemalloc.start()
+    try:
+        gc.collect()
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        for _ in range(number):
+            operation()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        gc.collect()  # Free reference cycles (e.g. a game and its event lambdas) so only kept memory is counted
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # Leave out the snapshots' own bookkeeping
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), "filename")
+    kept_bytes = sum(stat.size_diff for stat in stats)
+    kept_blocks = sum(stat.count_diff for stat in stats)
+    return kept_bytes / number, kept_blocks / number, peak_bytes - start_bytes
+
+def run(repeat=5, names=None):
+    """Run the benchmarks and return the results dict."""
+    results = {}
+    # Text-mode output (random events) is discarded
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for name, setup in BENCHMARKS.items():
+            if names and name not in names:
+                continue
+            number, best, median = time_benchmark(setup, repeat)
+            kept_bytes, kept_blocks, peak_bytes = trace_benchmark(setup, min(number, MAX_TRACED_OPS))
+            results[name] = {
+                "number": number,
+                "ops_per_sec": best,
+                "median_ops_per_sec": median,
+                "kept_bytes_per_op": kept_bytes,
+                "kept_blocks_per_op": kept_blocks,
+                "peak_bytes": peak_bytes,
+            }
+
+    return {
+        "repeat": repeat,
+        "python": sys.version.split()[0],
+        "results": results,
+    }
+
+def compare(current, baseline, threshold=1.25):
+    """
+    Compare results with a baseline.
+    Returns a list of (name, metric, baseline, current) for benchmarks whose
+    ops/sec fell below the baseline divided by threshold, or whose kept bytes
+    per op grew above threshold times the baseline.
+    """
+    regressions = []
+    for name, stats in current["results"].items():
+        base = baseline["results"].get(name)
+        if not base:
+            continue
+        if stats["ops_per_sec"] * threshold < base["ops_per_sec"]:
+            regressions.append((name, "ops_per_sec", base["ops_per_sec"], stats["ops_per_sec"]))
+        if stats["kept_bytes_per_op"] > base["kept_bytes_per_op"] * threshold + ALLOCATION_SLACK_BYTES:
+            regressions.append((name, "kept_bytes_per_op", base["kept_bytes_per_op"], stats["kept_bytes_per_op"]))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for the models and the monthly tick.")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark (the best is reported)")
+    parser.add_argument("--bench", choices=list(BENCHMARKS), action="append", help="only run these benchmarks")
+    parser.add_argument("--output", help="write the results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--threshold", type=float, default=1.25, help="allowed slowdown (or allocation growth) factor against the baseline")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat, args.bench)
+
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for name, metric, base, current in regressions:
+            print(f"REGRESSION {name}: {metric} {base:,.1f} -> {current:,.1f}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No benchmark regressed by more than {args.threshold}x against the baseline.", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,18 @@
+import os
+
 # GUI Constants
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
 
+# Idle frame scheduling
+IDLE_DELAY = 0.5  # Seconds at full FPS after the last input before going idle
+IDLE_CPU_TARGET = 0.01  # Fraction of a CPU to use while idle
+IDLE_MAX_WAIT_MS = 1000  # Longest sleep between idle frames
+
+# Scrolling lists
+SCROLL_STEP = 40  # Pixels per mouse wheel notch
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -19,8 +29,33 @@ YELLOW = (255, 255, 0)
 ORANGE = (255, 165, 0)
 PURPLE = (128, 0, 128)
 
-# Font sizes
+# Fonts
+FONT_FAMILY = 'Arial'
 FONT_SMALL = 18
 FONT_MEDIUM = 24
 FONT_LARGE = 32
-FONT_TITLE = 48
\ No newline at end of file
+FONT_TITLE = 48
+TEXT_CACHE_BYTES = 8 * 1024 * 1024  # Memory budget for cached rendered text
+
+# Fast forward
+FAST_FORWARD_MONTHS = 12  # Months simulated by the fast forward button
+FAST_FORWARD_MONTH_DELAY = 0.05  # Seconds shown per month (0 runs at full speed)
+
+# Autopilot (the GUI hands the rest of the life to a policy)
+AUTOPILOT_POLICY = "default"  # Name in moneySmartz.policies.POLICIES
+AUTOPILOT_MONTH_DELAY = 0.01  # Seconds shown per month
+
+# Recommendations (the life event screens mark the solver's best choice)
+SHOW_RECOMMENDATIONS = True
+SOLVER_ROLLOUTS = 24  # Most sampled lives per choice
+SOLVER_TIME_LIMIT = 2.0  # Seconds before the solver stops sampling
+
+# Monthly history (charts)
+HISTORY_MONTHS = (65 - 16) * 12  # Age 16 to retirement
+
+# Save games
+SAVE_DIR = os.path.join(os.path.expanduser("~"), ".moneySmartz", "saves")
+THUMBNAIL_SIZE = (128, 96)
+
+# Text mode
+CLEAR_SCREEN = "\033[H\033[2J"  # ANSI: cursor home, clear the screen
@@ -0,0 +1,44 @@
+"""
+Drawing in logical coordinates.
+
+The same calls as pygame.draw and Surface.blit, but positions, sizes and
+line widths are logical (see moneySmartz.layout) and are mapped to the
+window when drawing. Blitted surfaces are drawn at their own pixel size, so
+they must already be rendered at the window scale (text from get_font, or
+images scaled once per layout version).
+"""
+
+import pygame
+from moneySmartz.layout import layout
+
+def rect(surface, color, rect, width=0):
+    """Draw a rectangle."""
+    if layout.identity:
+        return pygame.draw.rect(surface, color, rect, width)
+    return pygame.draw.rect(surface, color, layout.rect(rect), layout.length(width))
+
+def circle(surface, color, center, radius, width=0):
+    """Draw a circle."""
+    if layout.identity:
+        return pygame.draw.circle(surface, color, center, radius, width)
+    return pygame.draw.circle(surface, color, layout.point(center), layout.length(radius), layout.length(width))
+
+def line(surface, color, start, end, width=1):
+    """Draw a straight line."""
+    if layout.identity:
+        return pygame.draw.line(surface, color, start, end, width)
+    return pygame.draw.line(surface, color, layout.point(start), layout.point(end), layout.length(width))
+
+def polygon(surface, color, points, width=0):
+    """Draw a polygon."""
+    if layout.identity:
+        return pygame.draw.polygon(surface, color, points, width)
+    return pygame.draw.polygon(surface, color, [layout.point(point) for point in points], layout.length(width))
+
+def blit(surface, source, dest):
+    """Blit a surface at a logical position (a point or the topleft of a rect)."""
+    if layout.identity:
+        return surface.blit(source, dest)
+    if isinstance(dest, pygame.Rect):
+        dest = dest.topleft
+    return surface.blit(source, layout.point(dest))
@@ -1,9 +1,10 @@
 import random
+import sys
 import time
-import os
+from collections import deque
+from moneySmartz import metrics
+from moneySmartz.constants import CLEAR_SCREEN, HISTORY_MONTHS
 from moneySmartz.models import Player, BankAccount, Card, Loan, Asset
-from moneySmartz.screens.life_event_screens import HousingScreen, FamilyPlanningScreen
-from moneySmartz.screens.base_screens import EndGameScreen
 
 class Game:
     """
@@ -16,6 +17,15 @@ class Game:
         self.game_over = False
         self.events = self.initialize_events()
         self.gui_manager = None  # Will be set by the main script
+        self.verbose = True  # Print text-mode messages (disabled for headless runs)
+        self.monthly_hooks = []  # Callables run with the game at the end of each month (see end_month)
+        self.monthly_history = deque(maxlen=HISTORY_MONTHS)  # (cash, bank balance, debt, asset value) after each month
+        self.save_slot = None  # Slot this game was last saved to or loaded from
+        self.script = None  # Iterator of answers for text-mode prompts (None reads the keyboard)
+
+        # Economy (parameter sweeps override these per game)
+        self.auto_deposit_share = 0.8  # Share of income deposited in the bank automatically
+        self.inflation_rate = 0.02  # Yearly increase in living expenses
 
     def initialize_events(self):
         """Initialize the random events that can occur during gameplay."""
@@ -48,7 +58,7 @@ class Game:
         print("\nMake wise financial decisions and see how they affect your life!")
         print("\n" + "=" * 60)
 
-        name = input("\nEnter your name: ")
+        name = self.ask("\nEnter your name: ")
         self.player = Player(name)
 
         print(f"\nWelcome, {self.player.name}! You're a 16-year-old high school student.")
@@ -68,28 +78,14 @@ class Game:
         else:
             print("\nYou decided not to open a bank account yet. You can do this later.")
 
-        input("\nPress Enter to begin your financial journey...")
+        self.pause("\nPress Enter to begin your financial journey...")
         self.game_loop()
 
     def game_loop(self):
         """Main game loop for text mode (legacy)."""
         while not self.game_over:
-            self.current_month += 1
-            if self.current_month > 12:
-                self.current_month = 1
-                self.current_year += 1
-                self.player.age += 1
-
-                # Apply interest to savings
-                if self.player.bank_account and self.player.bank_account.account_type == "Savings":
-                    self.player.bank_account.apply_interest()
-
-                # Age assets
-                for asset in self.player.assets:
-                    asset.age_asset()
-
-            # Process monthly income and expenses
-            self.process_monthly_finances()
+            # Advance the calendar and process monthly income and expenses
+            self.advance_month()
 
             # Random events
             if random.random() < 0.3:  # 30% chance of an event each month
@@ -101,11 +97,68 @@ class Game:
             # Display status and get player action
             self.display_status()
             self.get_player_action()
+            self.end_month()
 
             # Check game over conditions
             if self.player.age >= 65:  # Retirement age
                 self.end_game("retirement")
 
+    def advance_month(self):
+        """
+        Advance the game by one month.
+        Rolls over the year (birthday, savings interest, asset aging),
+        and processes the month's income and expenses. Whoever drives the game
+        calls end_month once the month's random event and decisions are done.
+        """
+        self.current_month += 1
+        if self.current_month > 12:
+            self.current_month = 1
+            self.current_year += 1
+            self.player.age += 1
+
+            # Apply interest to savings
+            if self.player.bank_account and self.player.bank_account.account_type == "Savings":
+                self.player.bank_account.apply_interest()
+
+            # Age assets
+            for asset in self.player.assets:
+                asset.age_asset()
+
+        # Process monthly finances
+        timed = metrics.registry.enabled
+        if timed:
+            start = time.perf_counter()
+        self.process_monthly_finances()
+        if timed:
+            metrics.monthly_finances_seconds.observe(time.perf_counter() - start)
+            metrics.months.inc()
+        self.record_month()
+
+    def end_month(self):
+        """
+        Finish the month: run the monthly hooks, which see the month's
+        finances, random event and life stage decisions.
+        """
+        for hook in self.monthly_hooks:
+            hook(self)
+
+    def record_month(self):
+        """Add the player's cash, bank balance, debt and asset value to the monthly history."""
+        player = self.player
+        bank_balance = player.bank_account.balance if player.bank_account else 0
+
+        debt = player.credit_card.balance if player.credit_card else 0
+        for loan in player.loans:
+            debt += loan.current_balance
+
+        asset_value = 0
+        for asset in player.assets:
+            asset_value += asset.current_value
+
+        self.monthly_history.append((player.cash, bank_balance, debt, asset_value))
+        if metrics.registry.enabled:
+            metrics.net_worth.set(player.cash + bank_balance - debt + asset_value)
+
     def process_monthly_finances(self):
         """Process monthly income and expenses."""
         # Process income
@@ -115,7 +168,7 @@ class Game:
 
             # Auto deposit to bank if account exists
             if self.player.bank_account:
-                deposit_amount = monthly_income * 0.8  # 80% of income goes to bank
+                deposit_amount = monthly_income * self.auto_deposit_share  # 80% of income goes to bank by default
                 self.player.bank_account.deposit(deposit_amount)
                 self.player.cash -= deposit_amount
 
@@ -133,7 +186,13 @@ class Game:
             else:
                 # Missed payment - credit score impact
                 self.player.credit_score -= 30
-                print(f"You missed a payment on your {loan.loan_type} loan. Your credit score has been affected.")
+                if metrics.registry.enabled:
+                    metrics.missed_payments.inc(loan.loan_type)
+                if self.verbose:
+                    print(f"You missed a payment on your {loan.loan_type} loan. Your credit score has been affected.")
+                continue
+            if metrics.registry.enabled:
+                metrics.payments.inc(loan.loan_type)
 
         # Process credit card minimum payments (5% of balance)
         if self.player.credit_card and self.player.credit_card.balance > 0:
@@ -142,31 +201,23 @@ class Game:
             if self.player.cash >= min_payment:
                 self.player.cash -= min_payment
                 self.player.credit_card.pay(min_payment)
+                if metrics.registry.enabled:
+                    metrics.payments.inc("Credit Card")
             elif self.player.bank_account and self.player.bank_account.balance >= min_payment:
                 self.player.bank_account.withdraw(min_payment)
                 self.player.credit_card.pay(min_payment)
+                if metrics.registry.enabled:
+                    metrics.payments.inc("Credit Card")
             else:
                 # Missed payment - credit score impact
                 self.player.credit_score -= 50
-                print("You missed your credit card payment. Your credit score has been severely affected.")
-
-        # Process living expenses
-        living_expenses = 1000  # Base living expenses
-
-        if any(a.asset_type == "House" for a in self.player.assets):
-            living_expenses += 500  # Additional expenses for homeowners
-
-        if any(a.asset_type == "Car" for a in self.player.assets):
-            living_expenses += 200  # Car maintenance and gas
-
-        if self.player.family:
-            living_expenses += 500 * len(self.player.family)  # Additional expenses per family member
-
-        # Adjust for inflation over time (2% per year)
-        inflation_factor = (1.02) ** self.current_year
-        living_expenses *= inflation_factor
+                if metrics.registry.enabled:
+                    metrics.missed_payments.inc("Credit Card")
+                if self.verbose:
+                    print("You missed your credit card payment. Your credit score has been severely affected.")
 
         # Pay living expenses
+        living_expenses = self.monthly_living_expenses()
         if self.player.cash >= living_expenses:
             self.player.cash -= living_expenses
         elif self.player.bank_account and self.player.bank_account.balance >= living_expenses:
@@ -175,17 +226,33 @@ class Game:
             self.player.credit_card.charge(living_expenses)
         else:
             # Couldn't pay living expenses - game over?
-            print("You couldn't afford your living expenses this month!")
+            if metrics.registry.enabled:
+                metrics.missed_payments.inc("Living Expenses")
+            if self.verbose:
+                print("You couldn't afford your living expenses this month!")
             # For now, just reduce credit score
             self.player.credit_score -= 20
 
+    def monthly_living_expenses(self):
+        """Get this month's living expenses (base, home, car and family costs, adjusted for inflation)."""
+        living_expenses = 1000  # Base living expenses
+
+        if any(a.asset_type == "House" for a in self.player.assets):
+            living_expenses += 500  # Additional expenses for homeowners
+
+        if any(a.asset_type == "Car" for a in self.player.assets):
+            living_expenses += 200  # Car maintenance and gas
+
+        if self.player.family:
+            living_expenses += 500 * len(self.player.family)  # Additional expenses per family member
+
+        # Adjust for inflation over time (2% per year by default)
+        inflation_factor = (1 + self.inflation_rate) ** self.current_year
+        return living_expenses * inflation_factor
+
     def trigger_random_event(self):
         """Trigger a random financial event."""
-        # Decide if it's a positive or negative event
-        event_type = "positive" if random.random() < 0.5 else "negative"
-        event = random.choice(self.events[event_type])
-
-        cash_effect = event["cash_effect"]()
+        event, cash_effect = self.roll_random_event()
 
         # Only show events that have an effect
         if cash_effect != 0:
@@ -196,26 +263,52 @@ class Game:
 
             if cash_effect > 0:
                 print(f"You received ${cash_effect}!")
-                self.player.cash += cash_effect
             else:
                 print(f"This costs you ${abs(cash_effect)}.")
 
-                # Handle payment
-                if self.player.cash >= abs(cash_effect):
-                    self.player.cash -= abs(cash_effect)
-                    print("You paid in cash.")
-                elif self.player.bank_account and self.player.bank_account.balance >= abs(cash_effect):
-                    self.player.bank_account.withdraw(abs(cash_effect))
-                    print("You paid using your bank account.")
-                elif self.player.credit_card and (self.player.credit_card.balance + abs(cash_effect)) <= self.player.credit_card.limit:
-                    self.player.credit_card.charge(abs(cash_effect))
-                    print("You paid using your credit card.")
-                else:
-                    print("You couldn't afford this expense! Your credit score has been affected.")
-                    self.player.credit_score -= 15
+            payment_message = self.apply_event_effect(cash_effect)
+            if payment_message:
+                print(payment_message)
 
             print("!" * 60)
-            input("\nPress Enter to continue...")
+            self.pause()
+
+    def roll_random_event(self):
+        """
+        Pick a random financial event and compute its cash effect.
+        Returns a tuple of (event, cash_effect).
+        """
+        # Decide if it's a positive or negative event
+        event_type = "positive" if random.random() < 0.5 else "negative"
+        event = random.choice(self.events[event_type])
+        if metrics.registry.enabled:
+            metrics.random_events.inc(event_type)
+
+        return event, event["cash_effect"]()
+
+    def apply_event_effect(self, cash_effect):
+        """
+        Apply the cash effect of a random event to the player's finances.
+        Expenses are paid from cash, then the bank account, then the credit card.
+        Returns a message describing how an expense was paid, or None for income.
+        """
+        if cash_effect >= 0:
+            self.player.cash += cash_effect
+            return None
+
+        cost = abs(cash_effect)
+        if self.player.cash >= cost:
+            self.player.cash -= cost
+            return "You paid in cash."
+        elif self.player.bank_account and self.player.bank_account.balance >= cost:
+            self.player.bank_account.withdraw(cost)
+            return "You paid using your bank account."
+        elif self.player.credit_card and (self.player.credit_card.balance + cost) <= self.player.credit_card.limit:
+            self.player.credit_card.charge(cost)
+            return "You paid using your credit card."
+        else:
+            self.player.credit_score -= 15
+            return "You couldn't afford this expense! Your credit score has been affected."
 
     def check_life_stage_events(self):
         """Check for and trigger life stage events based on player age."""
@@ -319,7 +412,7 @@ class Game:
             self.player.education = "High School Graduate"
             self.job_opportunity_event()
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def college_graduation_event(self):
         """Handle the college graduation event."""
@@ -340,7 +433,7 @@ class Game:
         print("\nWith your new degree, you have access to better job opportunities.")
         self.job_opportunity_event()
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def job_opportunity_event(self):
         """Handle job opportunities."""
@@ -380,7 +473,7 @@ class Game:
         choice = 0
         while choice < 1 or choice > len(job_options):
             try:
-                choice = int(input(f"\nWhich job would you like to take? (1-{len(job_options)}): "))
+                choice = int(self.ask(f"\nWhich job would you like to take? (1-{len(job_options)}): "))
             except ValueError:
                 print("Please enter a valid number.")
 
@@ -392,7 +485,7 @@ class Game:
         print(f"\nCongratulations! You are now a {self.player.job} earning ${self.player.salary}/year.")
         print(f"Your monthly income is ${self.player.salary/12:.2f}.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def car_purchase_opportunity(self):
         """Handle car purchase opportunity."""
@@ -422,7 +515,7 @@ class Game:
             car_choice = 0
             while car_choice < 1 or car_choice > len(car_options):
                 try:
-                    car_choice = int(input(f"\nWhich car would you like to buy? (1-{len(car_options)}): "))
+                    car_choice = int(self.ask(f"\nWhich car would you like to buy? (1-{len(car_options)}): "))
                 except ValueError:
                     print("Please enter a valid number.")
 
@@ -468,7 +561,7 @@ class Game:
         else:
             print("\nYou've decided not to buy a car at this time.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def house_purchase_opportunity(self):
         """Handle house purchase opportunity."""
@@ -498,7 +591,7 @@ class Game:
             house_choice = 0
             while house_choice < 1 or house_choice > len(house_options):
                 try:
-                    house_choice = int(input(f"\nWhich house would you like to buy? (1-{len(house_options)}): "))
+                    house_choice = int(self.ask(f"\nWhich house would you like to buy? (1-{len(house_options)}): "))
                 except ValueError:
                     print("Please enter a valid number.")
 
@@ -515,7 +608,7 @@ class Game:
             if self.player.cash < down_payment and (not self.player.bank_account or self.player.bank_account.balance < down_payment):
                 print("\nYou don't have enough money for the down payment.")
                 print("You'll need to save up more money before buying a house.")
-                input("\nPress Enter to continue...")
+                self.pause()
                 return
 
             # Down payment options
@@ -558,7 +651,7 @@ class Game:
         else:
             print("\nYou've decided not to buy a house at this time.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def family_planning_opportunity(self):
         """Handle family planning opportunity."""
@@ -608,7 +701,7 @@ class Game:
         else:
             print("\nYou've decided not to start a family at this time.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def display_status(self):
         """Display the player's current status (text mode)."""
@@ -672,89 +765,89 @@ class Game:
         print("\n" + "=" * 60)
 
     def get_player_action(self):
-        """Get the player's next action (text mode)."""
-        actions = ["Continue to next month"]
+        """Get the player's actions for this month until they continue (text mode)."""
+        while True:
+            actions = ["Continue to next month"]
 
-        # Banking actions
-        if not self.player.bank_account:
-            actions.append("Open a bank account")
-        else:
-            actions.append("View bank account")
-            actions.append("Deposit to bank")
-            actions.append("Withdraw from bank")
-
-            if not self.player.debit_card:
-                actions.append("Get a debit card")
-
-        # Credit actions
-        if not self.player.credit_card and self.player.age >= 18:
-            actions.append("Apply for a credit card")
-        elif self.player.credit_card:
-            actions.append("View credit card")
-            if self.player.credit_card.balance > 0:
-                actions.append("Pay credit card")
-
-        # Loan actions
-        if self.player.loans:
-            actions.append("View loans")
-            actions.append("Make extra loan payment")
-
-        # Asset actions
-        if self.player.assets:
-            actions.append("View assets")
-
-        # Job actions
-        if not self.player.job and self.player.age >= 16:
-            actions.append("Look for a job")
-        elif self.player.job and random.random() < 0.1:  # 10% chance of job opportunity each month
-            actions.append("Look for a better job")
-
-        # Display actions
-        print("\nWhat would you like to do?")
-        for i, action in enumerate(actions):
-            print(f"{i+1}. {action}")
+            # Banking actions
+            if not self.player.bank_account:
+                actions.append("Open a bank account")
+            else:
+                actions.append("View bank account")
+                actions.append("Deposit to bank")
+                actions.append("Withdraw from bank")
+
+                if not self.player.debit_card:
+                    actions.append("Get a debit card")
+
+            # Credit actions
+            if not self.player.credit_card and self.player.age >= 18:
+                actions.append("Apply for a credit card")
+            elif self.player.credit_card:
+                actions.append("View credit card")
+                if self.player.credit_card.balance > 0:
+                    actions.append("Pay credit card")
+
+            # Loan actions
+            if self.player.loans:
+                actions.append("View loans")
+                actions.append("Make extra loan payment")
+
+            # Asset actions
+            if self.player.assets:
+                actions.append("View assets")
+
+            # Job actions
+            if not self.player.job and self.player.age >= 16:
+                actions.append("Look for a job")
+            elif self.player.job and random.random() < 0.1:  # 10% chance of job opportunity each month
+                actions.append("Look for a better job")
+
+            # Display actions
+            print("\nWhat would you like to do?")
+            for i, action in enumerate(actions):
+                print(f"{i+1}. {action}")
 
-        # Get player choice
-        choice = 0
-        while choice < 1 or choice > len(actions):
-            try:
-                choice = int(input(f"\nEnter your choice (1-{len(actions)}): "))
-            except ValueError:
-                print("Please enter a valid number.")
+            # Get player choice
+            choice = 0
+            while choice < 1 or choice > len(actions):
+                try:
+                    choice = int(self.ask(f"\nEnter your choice (1-{len(actions)}): "))
+                except ValueError:
+                    print("Please enter a valid number.")
 
-        action = actions[choice-1]
+            action = actions[choice-1]
 
-        # Process action
-        if action == "Continue to next month":
-            return
-        elif action == "Open a bank account":
-            self.open_bank_account()
-        elif action == "View bank account":
-            self.view_bank_account()
-        elif action == "Deposit to bank":
-            self.deposit_to_bank()
-        elif action == "Withdraw from bank":
-            self.withdraw_from_bank()
-        elif action == "Get a debit card":
-            self.get_debit_card()
-        elif action == "Apply for a credit card":
-            self.apply_for_credit_card()
-        elif action == "View credit card":
-            self.view_credit_card()
-        elif action == "Pay credit card":
-            self.pay_credit_card()
-        elif action == "View loans":
-            self.view_loans()
-        elif action == "Make extra loan payment":
-            self.make_extra_loan_payment()
-        elif action == "View assets":
-            self.view_assets()
-        elif action == "Look for a job" or action == "Look for a better job":
-            self.look_for_job()
-
-        # After action, show status again and get another action
-        self.display_status()
-        self.get_player_action()
+            # Process action
+            if action == "Continue to next month":
+                return
+            elif action == "Open a bank account":
+                self.open_bank_account()
+            elif action == "View bank account":
+                self.view_bank_account()
+            elif action == "Deposit to bank":
+                self.deposit_to_bank()
+            elif action == "Withdraw from bank":
+                self.withdraw_from_bank()
+            elif action == "Get a debit card":
+                self.get_debit_card()
+            elif action == "Apply for a credit card":
+                self.apply_for_credit_card()
+            elif action == "View credit card":
+                self.view_credit_card()
+            elif action == "Pay credit card":
+                self.pay_credit_card()
+            elif action == "View loans":
+                self.view_loans()
+            elif action == "Make extra loan payment":
+                self.make_extra_loan_payment()
+            elif action == "View assets":
+                self.view_assets()
+            elif action == "Look for a job" or action == "Look for a better job":
+                self.look_for_job()
+
+            # After action, show status again and get another action
+            self.display_status()
 
     def open_bank_account(self):
         """Open a bank account."""
@@ -779,7 +872,7 @@ class Game:
         deposit = 0
         while deposit <= 0:
             try:
-                deposit = float(input("\nHow much would you like to deposit initially? $"))
+                deposit = float(self.ask("\nHow much would you like to deposit initially? $"))
                 if deposit <= 0:
                     print("Please enter a positive amount.")
                 elif deposit > self.player.cash:
@@ -801,7 +894,7 @@ class Game:
                 self.player.debit_card = Card("Debit")
                 print("\nYou now have a debit card linked to your checking account.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def view_bank_account(self):
         """View bank account details."""
@@ -832,7 +925,7 @@ class Game:
                 elif transaction["type"] == "interest":
                     print(f"  Interest: +${transaction['amount']:.2f}")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def deposit_to_bank(self):
         """Deposit money to bank account."""
@@ -847,7 +940,7 @@ class Game:
         deposit = 0
         while deposit <= 0:
             try:
-                deposit = float(input("\nHow much would you like to deposit? $"))
+                deposit = float(self.ask("\nHow much would you like to deposit? $"))
                 if deposit <= 0:
                     print("Please enter a positive amount.")
                 elif deposit > self.player.cash:
@@ -863,7 +956,7 @@ class Game:
         print(f"Your new account balance is ${self.player.bank_account.balance:.2f}.")
         print(f"Your remaining cash is ${self.player.cash:.2f}.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def withdraw_from_bank(self):
         """Withdraw money from bank account."""
@@ -878,7 +971,7 @@ class Game:
         withdrawal = 0
         while withdrawal <= 0:
             try:
-                withdrawal = float(input("\nHow much would you like to withdraw? $"))
+                withdrawal = float(self.ask("\nHow much would you like to withdraw? $"))
                 if withdrawal <= 0:
                     print("Please enter a positive amount.")
                 elif withdrawal > self.player.bank_account.balance:
@@ -894,7 +987,7 @@ class Game:
         print(f"Your new account balance is ${self.player.bank_account.balance:.2f}.")
         print(f"Your cash is now ${self.player.cash:.2f}.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def get_debit_card(self):
         """Get a debit card for the bank account."""
@@ -910,7 +1003,7 @@ class Game:
 
         print("\nYou now have a debit card linked to your checking account.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def apply_for_credit_card(self):
         """Apply for a credit card."""
@@ -926,12 +1019,12 @@ class Game:
         # Check eligibility
         if self.player.age < 18:
             print("\nSorry, you must be at least 18 years old to apply for a credit card.")
-            input("\nPress Enter to continue...")
+            self.pause()
             return
 
         if not self.player.job:
             print("\nSorry, you need to have a job to apply for a credit card.")
-            input("\nPress Enter to continue...")
+            self.pause()
             return
 
         # Determine credit limit based on credit score and income
@@ -969,7 +1062,7 @@ class Game:
         else:
             print("\nYou've declined the credit card offer.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def view_credit_card(self):
         """View credit card details."""
@@ -1002,7 +1095,7 @@ class Game:
                 elif transaction["type"] == "payment":
                     print(f"  Payment: -${transaction['amount']:.2f}")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def pay_credit_card(self):
         """Make a payment on the credit card."""
@@ -1037,7 +1130,7 @@ class Game:
             payment_amount = 0
             while payment_amount < min_payment or payment_amount > self.player.credit_card.balance:
                 try:
-                    payment_amount = float(input(f"\nEnter payment amount (minimum ${min_payment:.2f}): $"))
+                    payment_amount = float(self.ask(f"\nEnter payment amount (minimum ${min_payment:.2f}): $"))
                     if payment_amount < min_payment:
                         print(f"Payment must be at least the minimum payment of ${min_payment:.2f}.")
                     elif payment_amount > self.player.credit_card.balance:
@@ -1054,7 +1147,7 @@ class Game:
 
         if not payment_methods:
             print("\nYou don't have enough money to make this payment.")
-            input("\nPress Enter to continue...")
+            self.pause()
             return
 
         payment_method = self.get_choice("How would you like to pay?", payment_methods)
@@ -1079,7 +1172,7 @@ class Game:
                 print(f"\nYour on-time payment has improved your credit score by {score_increase} points.")
                 print(f"Your credit score is now {self.player.credit_score}.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def view_loans(self):
         """View loan details."""
@@ -1113,7 +1206,7 @@ class Game:
             if i < len(self.player.loans) - 1:
                 print("\n" + "-" * 40)
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def make_extra_loan_payment(self):
         """Make an extra payment on a loan."""
@@ -1134,7 +1227,7 @@ class Game:
             loan_choice = 0
             while loan_choice < 1 or loan_choice > len(self.player.loans):
                 try:
-                    loan_choice = int(input(f"\nEnter your choice (1-{len(self.player.loans)}): "))
+                    loan_choice = int(self.ask(f"\nEnter your choice (1-{len(self.player.loans)}): "))
                 except ValueError:
                     print("Please enter a valid number.")
 
@@ -1155,7 +1248,7 @@ class Game:
         payment_amount = 0
         while payment_amount <= 0:
             try:
-                payment_amount = float(input("\nHow much extra would you like to pay? $"))
+                payment_amount = float(self.ask("\nHow much extra would you like to pay? $"))
                 if payment_amount <= 0:
                     print("Please enter a positive amount.")
                 elif payment_amount > selected_loan.current_balance:
@@ -1173,7 +1266,7 @@ class Game:
 
         if not payment_methods:
             print("\nYou don't have enough money to make this payment.")
-            input("\nPress Enter to continue...")
+            self.pause()
             return
 
         payment_method = self.get_choice("How would you like to pay?", payment_methods)
@@ -1219,7 +1312,7 @@ class Game:
                 print(f"\nPaying off your loan has improved your credit score by {score_increase} points.")
                 print(f"Your credit score is now {self.player.credit_score}.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def view_assets(self):
         """View asset details."""
@@ -1248,7 +1341,7 @@ class Game:
             if i < len(self.player.assets) - 1:
                 print("\n" + "-" * 40)
 
-        input("\nPress Enter to continue...")
+        self.pause()
 
     def look_for_job(self):
         """Look for a job or a better job."""
@@ -1264,54 +1357,14 @@ class Game:
             print(f"Current Salary: ${current_salary}/year")
 
         # Generate job options based on education and experience
-        job_options = []
-
-        # Base salary multiplier based on years of experience
-        experience_years = max(0, self.player.age - 18)  # Assume working age starts at 18
-        experience_multiplier = 1.0 + (experience_years * 0.03)  # 3% increase per year of experience
-
-        if self.player.education == "High School" or self.player.education == "High School Graduate":
-            job_options = [
-                {"title": "Retail Associate", "salary": int(25000 * experience_multiplier)},
-                {"title": "Food Service Worker", "salary": int(22000 * experience_multiplier)},
-                {"title": "Warehouse Worker", "salary": int(28000 * experience_multiplier)},
-                {"title": "Office Clerk", "salary": int(30000 * experience_multiplier)},
-            ]
-        elif self.player.education == "Trade School":
-            job_options = [
-                {"title": "Electrician", "salary": int(45000 * experience_multiplier)},
-                {"title": "Plumber", "salary": int(48000 * experience_multiplier)},
-                {"title": "HVAC Technician", "salary": int(50000 * experience_multiplier)},
-                {"title": "Automotive Mechanic", "salary": int(42000 * experience_multiplier)},
-            ]
-        elif self.player.education == "College Graduate":
-            job_options = [
-                {"title": "Accountant", "salary": int(60000 * experience_multiplier)},
-                {"title": "Marketing Manager", "salary": int(65000 * experience_multiplier)},
-                {"title": "Software Developer", "salary": int(75000 * experience_multiplier)},
-                {"title": "Financial Analyst", "salary": int(70000 * experience_multiplier)},
-            ]
-        else:  # Default/basic jobs
-            job_options = [
-                {"title": "Retail Associate", "salary": int(25000 * experience_multiplier)},
-                {"title": "Food Service Worker", "salary": int(22000 * experience_multiplier)},
-                {"title": "Warehouse Worker", "salary": int(28000 * experience_multiplier)},
-            ]
-
-        # Add some randomness to salaries (±10%)
-        for job in job_options:
-            job["salary"] = int(job["salary"] * random.uniform(0.9, 1.1))
-
-        # Filter out jobs that don't offer at least 5% more than current salary (if employed)
-        if self.player.job:
-            job_options = [job for job in job_options if job["salary"] >= current_salary * 1.05]
+        job_options = self.generate_job_options()
 
         # If no jobs available after filtering
         if not job_options:
             print("\nAfter searching, you couldn't find any jobs that would be a significant")
             print("improvement over your current position. Keep building your skills and")
             print("try again later!")
-            input("\nPress Enter to continue...")
+            self.pause()
             return
 
         # Display job options
@@ -1325,36 +1378,25 @@ class Game:
         choice = -1
         while choice < 0 or choice > len(job_options):
             try:
-                choice = int(input(f"\nWhich job would you like to apply for? (0-{len(job_options)}): "))
+                choice = int(self.ask(f"\nWhich job would you like to apply for? (0-{len(job_options)}): "))
             except ValueError:
                 print("Please enter a valid number.")
 
         if choice == 0:
             print("\nYou've decided not to change jobs at this time.")
-            input("\nPress Enter to continue...")
+            self.pause()
             return
 
         # Apply for job
         selected_job = job_options[choice-1]
 
         # Job application success chance based on qualifications
-        base_success_chance = 0.7  # 70% base chance
-
-        # Adjust for education
-        if self.player.education == "College Graduate":
-            base_success_chance += 0.2
-        elif self.player.education == "Trade School":
-            base_success_chance += 0.1
-
-        # Adjust for experience
-        base_success_chance += min(0.2, experience_years * 0.01)  # Up to 20% bonus for experience
-
-        # Cap at 95% chance
-        success_chance = min(0.95, base_success_chance)
+        success_chance = self.get_job_success_chance()
 
         print(f"\nYou've applied for the {selected_job['title']} position.")
         print("The hiring manager is reviewing your application...")
-        time.sleep(2)  # Dramatic pause
+        if self.script is None:
+            time.sleep(2)  # Dramatic pause
 
         if random.random() < success_chance:
             print("\nCongratulations! You got the job!")
@@ -1377,11 +1419,100 @@ class Game:
             print("\nUnfortunately, the company decided to go with another candidate.")
             print("Don't be discouraged! Keep improving your skills and try again.")
 
-        input("\nPress Enter to continue...")
+        self.pause()
+
+    def generate_job_options(self):
+        """Generate job options based on the player's education and experience."""
+        job_options = []
+
+        # Current job info
+        current_salary = self.player.salary if self.player.job else 0
+
+        # Base salary multiplier based on years of experience
+        experience_years = max(0, self.player.age - 18)  # Assume working age starts at 18
+        experience_multiplier = 1.0 + (experience_years * 0.03)  # 3% increase per year of experience
+
+        # Generate job options based on education
+        if self.player.education == "High School" or self.player.education == "High School Graduate":
+            job_options = [
+                {"title": "Retail Associate", "salary": int(25000 * experience_multiplier)},
+                {"title": "Food Service Worker", "salary": int(22000 * experience_multiplier)},
+                {"title": "Warehouse Worker", "salary": int(28000 * experience_multiplier)},
+                {"title": "Office Clerk", "salary": int(30000 * experience_multiplier)},
+            ]
+        elif self.player.education == "Trade School":
+            job_options = [
+                {"title": "Electrician", "salary": int(45000 * experience_multiplier)},
+                {"title": "Plumber", "salary": int(48000 * experience_multiplier)},
+                {"title": "HVAC Technician", "salary": int(50000 * experience_multiplier)},
+                {"title": "Automotive Mechanic", "salary": int(42000 * experience_multiplier)},
+            ]
+        elif self.player.education == "College Graduate":
+            job_options = [
+                {"title": "Accountant", "salary": int(60000 * experience_multiplier)},
+                {"title": "Marketing Manager", "salary": int(65000 * experience_multiplier)},
+                {"title": "Software Developer", "salary": int(75000 * experience_multiplier)},
+                {"title": "Financial Analyst", "salary": int(70000 * experience_multiplier)},
+            ]
+        else:  # Default/basic jobs
+            job_options = [
+                {"title": "Retail Associate", "salary": int(25000 * experience_multiplier)},
+                {"title": "Food Service Worker", "salary": int(22000 * experience_multiplier)},
+                {"title": "Warehouse Worker", "salary": int(28000 * experience_multiplier)},
+            ]
+
+        # Add some randomness to salaries (±10%)
+        for job in job_options:
+            job["salary"] = int(job["salary"] * random.uniform(0.9, 1.1))
+
+        # Filter out jobs that don't offer at least 5% more than current salary (if employed)
+        if self.player.job:
+            job_options = [job for job in job_options if job["salary"] >= current_salary * 1.05]
+
+        return job_options
+
+    def get_job_success_chance(self):
+        """Get the chance that a job application succeeds, based on qualifications."""
+        base_success_chance = 0.7  # 70% base chance
+
+        # Adjust for education
+        if self.player.education == "College Graduate":
+            base_success_chance += 0.2
+        elif self.player.education == "Trade School":
+            base_success_chance += 0.1
+
+        # Adjust for experience
+        experience_years = max(0, self.player.age - 18)
+        base_success_chance += min(0.2, experience_years * 0.01)  # Up to 20% bonus for experience
+
+        # Cap at 95% chance
+        return min(0.95, base_success_chance)
 
     def clear_screen(self):
-        """Clear the console screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Clear the console screen with an ANSI escape (only when writing to a terminal)."""
+        if sys.stdout.isatty():
+            sys.stdout.write(CLEAR_SCREEN)
+
+    def ask(self, prompt):
+        """
+        Read the answer to a text-mode prompt.
+        Scripted games take the next line of the script (and echo it);
+        others read the keyboard. Raises EOFError when the script runs out.
+        """
+        if self.script is None:
+            return input(prompt)
+
+        answer = next(self.script, None)
+        if answer is None:
+            raise EOFError("the script ran out of answers")
+        answer = answer.rstrip("\r\n")
+        print(prompt + answer)
+        return answer
+
+    def pause(self, prompt="\nPress Enter to continue..."):
+        """Wait for Enter (text mode). Scripted games don't wait or use up script lines."""
+        if self.script is None:
+            input(prompt)
 
     def get_choice(self, prompt, choices):
         """Get a choice from the player from a list of options."""
@@ -1392,7 +1523,7 @@ class Game:
         selection = 0
         while selection < 1 or selection > len(choices):
             try:
-                selection = int(input(f"\nEnter your choice (1-{len(choices)}): "))
+                selection = int(self.ask(f"\nEnter your choice (1-{len(choices)}): "))
             except ValueError:
                 print("Please enter a valid number.")
 
@@ -1412,30 +1543,17 @@ class Game:
             print("=" * 60)
             print(f"\nYour financial journey has ended after {self.current_year} years.")
 
-        # Calculate net worth
-        cash = self.player.cash
-        bank_balance = self.player.bank_account.balance if self.player.bank_account else 0
-        credit_card_debt = self.player.credit_card.balance if self.player.credit_card else 0
-
-        loan_debt = 0
-        for loan in self.player.loans:
-            loan_debt += loan.current_balance
-
-        asset_value = 0
-        for asset in self.player.assets:
-            asset_value += asset.current_value
-
-        net_worth = cash + bank_balance - credit_card_debt - loan_debt + asset_value
+        summary = self.get_financial_summary()
 
         # Display final stats
         print("\n--- FINAL FINANCIAL SUMMARY ---")
-        print(f"Cash: ${cash:.2f}")
-        print(f"Bank Balance: ${bank_balance:.2f}")
-        print(f"Credit Card Debt: ${credit_card_debt:.2f}")
-        print(f"Loan Debt: ${loan_debt:.2f}")
-        print(f"Asset Value: ${asset_value:.2f}")
-        print(f"Net Worth: ${net_worth:.2f}")
-        print(f"Credit Score: {self.player.credit_score}")
+        print(f"Cash: ${summary['cash']:.2f}")
+        print(f"Bank Balance: ${summary['bank_balance']:.2f}")
+        print(f"Credit Card Debt: ${summary['credit_card_debt']:.2f}")
+        print(f"Loan Debt: ${summary['loan_debt']:.2f}")
+        print(f"Asset Value: ${summary['asset_value']:.2f}")
+        print(f"Net Worth: ${summary['net_worth']:.2f}")
+        print(f"Credit Score: {summary['credit_score']}")
 
         # Family summary
         if self.player.family:
@@ -1447,16 +1565,7 @@ class Game:
                     print(f"{member['relation']}: {member['name']}, Age {member['age'] + self.current_year}")
 
         # Financial rating
-        if net_worth >= 1000000:
-            rating = "Financial Wizard"
-        elif net_worth >= 500000:
-            rating = "Financially Secure"
-        elif net_worth >= 100000:
-            rating = "Financially Stable"
-        elif net_worth >= 0:
-            rating = "Breaking Even"
-        else:
-            rating = "In Debt"
+        rating = summary["rating"]
 
         print(f"\nFinancial Rating: {rating}")
 
@@ -1464,48 +1573,123 @@ class Game:
         print("=" * 60)
 
         self.game_over = True
-        input("\nPress Enter to exit...")
+        self.pause("\nPress Enter to exit...")
+
+    def get_financial_summary(self):
+        """
+        Calculate the player's financial summary.
+        Returns a dict with cash, bank balance, debts, asset value, net worth,
+        credit score and the resulting financial rating.
+        """
+        cash = self.player.cash
+        bank_balance = self.player.bank_account.balance if self.player.bank_account else 0
+        credit_card_debt = self.player.credit_card.balance if self.player.credit_card else 0
+
+        loan_debt = 0
+        for loan in self.player.loans:
+            loan_debt += loan.current_balance
+
+        asset_value = 0
+        for asset in self.player.assets:
+            asset_value += asset.current_value
+
+        net_worth = cash + bank_balance - credit_card_debt - loan_debt + asset_value
+
+        return {
+            "cash": cash,
+            "bank_balance": bank_balance,
+            "credit_card_debt": credit_card_debt,
+            "loan_debt": loan_debt,
+            "asset_value": asset_value,
+            "net_worth": net_worth,
+            "credit_score": self.player.credit_score,
+            "rating": self.get_financial_rating(net_worth),
+        }
+
+    def get_financial_rating(self, net_worth):
+        """Get the end-of-game financial rating for a net worth."""
+        if net_worth >= 1000000:
+            return "Financial Wizard"
+        elif net_worth >= 500000:
+            return "Financially Secure"
+        elif net_worth >= 100000:
+            return "Financially Stable"
+        elif net_worth >= 0:
+            return "Breaking Even"
+        else:
+            return "In Debt"
 
     def end_game_gui(self, reason):
         """End the game and show final stats (GUI version)."""
+        from moneySmartz.screens.base_screens import EndGameScreen
         self.game_over = True
         self.gui_manager.set_screen(EndGameScreen(self, reason))
 
-    def check_life_stage_events_gui(self):
-        """Check for life stage events and show appropriate screens (GUI version)."""
+    def due_life_stage_event(self):
+        """
+        Get the life stage event due this month, or None.
+        Rolls the family planning chance, so call it at most once per month.
+        """
+        event = None
+
         # High school graduation
         if self.player.age == 18 and self.player.education == "High School":
-            from moneySmartz.screens.life_event_screens import HighSchoolGraduationScreen
-            self.gui_manager.set_screen(HighSchoolGraduationScreen(self))
-            return True
+            event = "high_school_graduation"
 
         # College graduation (if went to college)
         elif self.player.age == 22 and self.player.education == "College (In Progress)":
-            from moneySmartz.screens.life_event_screens import CollegeGraduationScreen
-            self.gui_manager.set_screen(CollegeGraduationScreen(self))
-            return True
+            event = "college_graduation"
 
         # First full-time job opportunity
         elif self.player.age == 22 and not self.player.job and self.player.education != "College (In Progress)":
-            from moneySmartz.screens.financial_screens import JobSearchScreen
-            self.gui_manager.set_screen(JobSearchScreen(self))
-            return True
+            event = "job_search"
 
         # Car purchase opportunity
         elif self.player.age == 20 and not any(a.asset_type == "Car" for a in self.player.assets):
-            from moneySmartz.screens.life_event_screens import CarPurchaseScreen
-            self.gui_manager.set_screen(CarPurchaseScreen(self))
-            return True
+            event = "car_purchase"
 
         # House purchase opportunity
         elif self.player.age == 30 and not any(a.asset_type == "House" for a in self.player.assets) and self.player.job:
-            self.gui_manager.set_screen(HousingScreen(self))
-            return True
+            event = "housing"
 
         # Family planning opportunity
         elif self.player.age >= 28 and not self.player.family and self.player.job:
             if random.random() < 0.1:  # 10% chance each year after 28
-                self.gui_manager.set_screen(FamilyPlanningScreen(self))
-                return True
+                event = "family_planning"
+
+        if metrics.registry.enabled:
+            metrics.life_stage_checks.inc()
+            if event:
+                metrics.life_stage_events.inc(event)
+        return event
+
+    def check_life_stage_events_gui(self, event=None):
+        """
+        Check for life stage events and show appropriate screens (GUI version).
+        event, if given, is an event already returned by due_life_stage_event.
+        """
+        if event is None:
+            event = self.due_life_stage_event()
+
+        if event == "high_school_graduation":
+            from moneySmartz.screens.life_event_screens import HighSchoolGraduationScreen
+            self.gui_manager.set_screen(HighSchoolGraduationScreen(self))
+        elif event == "college_graduation":
+            from moneySmartz.screens.life_event_screens import CollegeGraduationScreen
+            self.gui_manager.set_screen(CollegeGraduationScreen(self))
+        elif event == "job_search":
+            from moneySmartz.screens.financial_screens import JobSearchScreen
+            self.gui_manager.set_screen(JobSearchScreen(self))
+        elif event == "car_purchase":
+            from moneySmartz.screens.life_event_screens import CarPurchaseScreen
+            self.gui_manager.set_screen(CarPurchaseScreen(self))
+        elif event == "housing":
+            from moneySmartz.screens.life_event_screens import HousingScreen
+            self.gui_manager.set_screen(HousingScreen(self))
+        elif event == "family_planning":
+            from moneySmartz.screens.life_event_screens import FamilyPlanningScreen
+            self.gui_manager.set_screen(FamilyPlanningScreen(self))
+        else:
+            return False
 
-        return False
+        return True
@@ -0,0 +1,99 @@
+"""
+Resolution-independent layout.
+
+Screens and widgets are laid out in logical coordinates: a SCREEN_WIDTH x
+SCREEN_HEIGHT canvas. The shared layout maps them to the window: it scales
+by the largest factor that fits the window and centers the canvas. The
+mapping only changes when the window is resized; the version number lets
+widgets and caches recompute their window rects and renders once per
+resolution instead of scaling every frame.
+"""
+
+import pygame
+from moneySmartz.constants import *
+
+class Layout:
+    """
+    Maps logical coordinates to window coordinates.
+    """
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        self.version = 0
+        self.resize(width, height)
+
+    def resize(self, width, height):
+        """Lay out for a new window size."""
+        self.size = (width, height)
+        self.scale = min(width / SCREEN_WIDTH, height / SCREEN_HEIGHT)
+        self.offset = ((width - SCREEN_WIDTH * self.scale) / 2, (height - SCREEN_HEIGHT * self.scale) / 2)
+        self.identity = self.scale == 1 and self.offset == (0, 0)
+        self.version += 1
+
+    def x(self, x):
+        """Get the window x of a logical x."""
+        return round(self.offset[0] + x * self.scale)
+
+    def y(self, y):
+        """Get the window y of a logical y."""
+        return round(self.offset[1] + y * self.scale)
+
+    def point(self, point):
+        """Get the window position of a logical point."""
+        return (self.x(point[0]), self.y(point[1]))
+
+    def length(self, length):
+        """Get the window length of a logical length (at least 1 pixel if non-zero)."""
+        if not length:
+            return 0
+        return max(1, round(length * self.scale))
+
+    def rect(self, rect):
+        """Get the window rect of a logical rect. Adjacent rects stay adjacent."""
+        rect = pygame.Rect(rect)
+        left, top = self.x(rect.left), self.y(rect.top)
+        return pygame.Rect(left, top, self.x(rect.right) - left, self.y(rect.bottom) - top)
+
+    def to_logical(self, point):
+        """Get the logical position of a window point (e.g. the mouse)."""
+        return (int((point[0] - self.offset[0]) / self.scale), int((point[1] - self.offset[1]) / self.scale))
+
+    def font_size(self, size):
+        """Get the pixel size to render a font of a logical size at."""
+        return max(1, round(size * self.scale))
+
+# The layout of the game window
+layout = Layout()
+
+class ScaledText(pygame.Surface):
+    """
+    Text rendered at the window scale. get_rect and the size getters are in
+    logical pixels, so screens lay text out in logical coordinates and
+    draw.blit puts it at the matching window position.
+    """
+    def __init__(self, rendered, scale):
+        super().__init__(rendered.get_size(), pygame.SRCALPHA)
+        if rendered.get_colorkey() is not None:
+            rendered = rendered.convert_alpha()
+        self.blit(rendered, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)  # Exact copy onto the transparent surface
+        width, height = rendered.get_size()
+        self.logical_size = (round(width / scale), round(height / scale))
+
+    def get_size(self):
+        return self.logical_size
+
+    def get_width(self):
+        return self.logical_size[0]
+
+    def get_height(self):
+        return self.logical_size[1]
+
+    def get_rect(self, **kwargs):
+        rect = pygame.Rect((0, 0), self.logical_size)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+def scaled_text(rendered):
+    """Wrap a surface rendered at the window scale so it is laid out in logical pixels."""
+    if layout.scale == 1:
+        return rendered
+    return ScaledText(rendered, layout.scale)
@@ -0,0 +1,149 @@
+"""
+Memory growth harness.
+
+Checks that long and repeated sessions don't creep: memory kept by one game
+or one round of screens should be freed before the next, as in a kiosk
+running back-to-back games. With tracemalloc it runs:
+- games: K full headless lives (moneySmartz.simulation);
+- gui: M cycles of screen transitions using SDL's dummy video driver; each
+  cycle starts a new game on the same GUIManager and shows every screen
+  for a few frames of scripted input (as moneySmartz.render_bench does).
+
+After warm-up runs (which fill the font and text caches and import the
+screens), memory is snapshotted after every run. The report gives the
+memory still held at the end per run, the traced memory after each run and
+the allocation sites that grew the most, as JSON.
+
+Usage:
+    python -m moneySmartz.memory_bench
+    python -m moneySmartz.memory_bench --games 200 --cycles 20 --output memory.json
+
+The exit status is 1 if either part keeps more than its threshold of bytes
+per run.
+"""
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+
+MAX_GAME_BYTES = 1024  # Allowed memory kept per headless game
+MAX_CYCLE_BYTES = 16 * 1024  # Allowed memory kept per GUI transition cycle
+TOP_SITES = 10
+GUI_FRAMES = 3  # Frames shown of each screen per cycle
+
+def measure(run_once, runs, warmup, top=TOP_SITES):
+    """
+    Call run_once(index) warmup times, then runs times, under tracemalloc.
+    Returns the results dict for the measured runs.
+    """
+    # Trace the warm-up too, so that freeing what it allocated is counted
+    tracemalloc.start()
+    try:
+        for index in range(warmup):
+            run_once(index)
+        gc.collect()
+        start = tracemalloc.take_snapshot()
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        traced_bytes = []
+        for index in range(warmup, warmup + runs):
+            run_once(index)
+            gc.collect()
+            traced_bytes.append(tracemalloc.get_traced_memory()[0] - start_bytes)
+        end = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # Leave out the snapshots' own bookkeeping and this harness's
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    stats = end.filter_traces(filters).compare_to(start.filter_traces(filters), "lineno")
+    retained = sum(stat.size_diff for stat in stats)
+    return {
+        "runs": runs,
+        "warmup": warmup,
+        "retained_bytes": retained,
+        "retained_bytes_per_run": retained / runs,
+        "traced_bytes_after_each_run": traced_bytes,
+        "top_sites": [
+            {
+                "site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "size_diff": stat.size_diff,
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats[:top] if stat.size_diff > 0
+        ],
+    }
+
+def measure_games(games, warmup=2):
+    """Measure the memory kept by full headless lives."""
+    from moneySmartz.simulation import simulate_life
+    return measure(lambda index: simulate_life(index), games, warmup)
+
+def measure_gui(cycles, warmup=2, frames=GUI_FRAMES):
+    """Measure the memory kept by cycles of screen transitions in new games."""
+    import pygame
+    from moneySmartz.game import Game
+    from moneySmartz.ui import GUIManager
+    from moneySmartz.render_bench import small_game, screen_factories, bench_screen
+
+    pygame.init()
+    gui_manager = GUIManager(Game())
+    factories = screen_factories()
+
+    def cycle(index):
+        base_game = small_game()
+        for name, factory in factories:
+            bench_screen(gui_manager, factory, base_game, frames)
+        gui_manager.return_to_game()
+        gui_manager.current_screen.draw(gui_manager.screen)
+
+    try:
+        return measure(cycle, cycles, warmup)
+    finally:
+        pygame.quit()
+
+def run(games=50, cycles=10):
+    """Run the harness and return the results dict."""
+    return {
+        "python": sys.version.split()[0],
+        "max_game_bytes": MAX_GAME_BYTES,
+        "max_cycle_bytes": MAX_CYCLE_BYTES,
+        "games": measure_games(games),
+        "gui": measure_gui(cycles),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Memory growth harness for repeated headless games and GUI sessions.")
+    parser.add_argument("--games", type=int, default=50, help="headless lives to measure (K)")
+    parser.add_argument("--cycles", type=int, default=10, help="GUI screen transition cycles to measure (M)")
+    parser.add_argument("--max-game-bytes", type=float, default=MAX_GAME_BYTES, help="allowed bytes kept per headless game")
+    parser.add_argument("--max-cycle-bytes", type=float, default=MAX_CYCLE_BYTES, help="allowed bytes kept per GUI cycle")
+    parser.add_argument("--output", help="write the results JSON here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    results = run(args.games, args.cycles)
+    results["max_game_bytes"] = args.max_game_bytes
+    results["max_cycle_bytes"] = args.max_cycle_bytes
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    status = 0
+    for part, limit in (("games", args.max_game_bytes), ("gui", args.max_cycle_bytes)):
+        per_run = results[part]["retained_bytes_per_run"]
+        if per_run > limit:
+            print(f"FAIL {part}: {per_run:,.0f} bytes kept per run > {limit:,.0f}", file=sys.stderr)
+            status = 1
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
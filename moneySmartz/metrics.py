@@ -0,0 +1,236 @@
+"""
+Metrics registry.
+
+Counters, gauges and histograms for engine throughput and gameplay
+signals. The game code updates them behind a check of registry.enabled, so
+while metrics are off (the default) instrumented code pays one attribute
+lookup per site:
+
+    if metrics.registry.enabled:
+        metrics.missed_payments.inc(loan.loan_type)
+
+Metrics can be read in-process (registry.snapshot()), appended to a JSON
+lines file (registry.dump_jsonl(), e.g. on exit) and served over HTTP in
+the Prometheus text format (/metrics) or as JSON (/metrics.json) by
+start_server() (json and http.server are only imported for those).
+"""
+
+import bisect
+import threading
+import time
+
+# Histogram buckets (upper bounds in seconds) for frame and tick times
+FRAME_BUCKETS = (0.001, 0.002, 0.005, 0.010, 0.0167, 0.025, 0.033, 0.050, 0.100, 0.250)
+TICK_BUCKETS = (0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.005)
+
+class Metric:
+    """
+    A named metric with one value per combination of label values.
+    """
+    kind = None
+
+    def __init__(self, name, description, labels=()):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.values = {}  # Label values tuple -> value
+
+    def samples(self):
+        """Get (labels dict, value) for every combination of label values seen."""
+        return [(dict(zip(self.labels, key)), value) for key, value in list(self.values.items())]
+
+    def clear(self):
+        """Forget all values."""
+        self.values.clear()
+
+class Counter(Metric):
+    """
+    A count that only goes up (e.g. months simulated, missed payments).
+    """
+    kind = "counter"
+
+    def inc(self, *labels, amount=1):
+        """Add amount for the given label values."""
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+class Gauge(Metric):
+    """
+    A value that goes up and down (e.g. the player's net worth).
+    """
+    kind = "gauge"
+
+    def set(self, value, *labels):
+        """Set the value for the given label values."""
+        self.values[labels] = value
+
+class Histogram(Metric):
+    """
+    Counts of observations (e.g. frame times) in cumulative buckets, with their sum.
+    """
+    kind = "histogram"
+
+    def __init__(self, name, description, buckets, labels=()):
+        super().__init__(name, description, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, *labels):
+        """Record one observation for the given label values."""
+        state = self.values.get(labels)
+        if state is None:
+            # Bucket counts (the last is +Inf), sum
+            state = self.values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        state[0][bisect.bisect_left(self.buckets, value)] += 1
+        state[1] += value
+
+    def samples(self):
+        """Get (labels dict, {"buckets", "sum", "count"}) for every combination of label values seen."""
+        samples = []
+        for labels, value in super().samples():
+            counts, total = value
+            cumulative, running = [], 0
+            for count in counts:
+                running += count
+                cumulative.append(running)
+            buckets = dict(zip([str(bound) for bound in self.buckets] + ["+Inf"], cumulative))
+            samples.append((labels, {"buckets": buckets, "sum": total, "count": running}))
+        return samples
+
+class Registry:
+    """
+    The set of metrics and whether they are being collected.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.metrics = {}
+
+    def add(self, metric):
+        """Register a metric. Returns it."""
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, description, labels=()):
+        """Register a counter."""
+        return self.add(Counter(name, description, labels))
+
+    def gauge(self, name, description, labels=()):
+        """Register a gauge."""
+        return self.add(Gauge(name, description, labels))
+
+    def histogram(self, name, description, buckets, labels=()):
+        """Register a histogram."""
+        return self.add(Histogram(name, description, buckets, labels))
+
+    def enable(self):
+        """Start collecting metrics."""
+        self.enabled = True
+
+    def disable(self):
+        """Stop collecting metrics (the values collected so far are kept)."""
+        self.enabled = False
+
+    def clear(self):
+        """Reset every metric."""
+        for metric in self.metrics.values():
+            metric.clear()
+
+    def snapshot(self):
+        """Get every metric as a dict of name -> {"type", "description", "samples": [{"labels", "value"}]}."""
+        return {
+            name: {
+                "type": metric.kind,
+                "description": metric.description,
+                "samples": [{"labels": labels, "value": value} for labels, value in metric.samples()],
+            }
+            for name, metric in list(self.metrics.items())
+        }
+
+    def dump_jsonl(self, path):
+        """Append one JSON line per metric sample, all stamped with the current time."""
+        import json
+        timestamp = time.time()
+        with open(path, "a") as f:
+            for name, metric in self.snapshot().items():
+                for sample in metric["samples"]:
+                    record = {"time": timestamp, "metric": name, "type": metric["type"]}
+                    record.update(sample)
+                    f.write(json.dumps(record) + "\n")
+
+    def prometheus_text(self):
+        """Format every metric in the Prometheus text exposition format."""
+        lines = []
+        for name, metric in list(self.metrics.items()):
+            lines.append(f"# HELP {name} {metric.description}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for labels, value in metric.samples():
+                if metric.kind == "histogram":
+                    for bound, count in value["buckets"].items():
+                        lines.append(f"{name}_bucket{format_labels(dict(labels, le=bound))} {count}")
+                    lines.append(f"{name}_sum{format_labels(labels)} {value['sum']}")
+                    lines.append(f"{name}_count{format_labels(labels)} {value['count']}")
+                else:
+                    lines.append(f"{name}{format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+def format_labels(labels):
+    """Format labels as {name="value",...} (empty without labels)."""
+    if not labels:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"') for value in labels.values())
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + "}"
+
+def start_server(port, host="127.0.0.1"):
+    """
+    Serve the metrics over HTTP on a daemon thread and enable collection:
+    /metrics (Prometheus text) and /metrics.json.
+    Returns the server (call shutdown() to stop it).
+    """
+    # Imported here so that importing the game doesn't load the HTTP stack
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body = registry.prometheus_text().encode()
+                content_type = "text/plain; version=0.0.4"
+            elif self.path == "/metrics.json":
+                body = json.dumps(registry.snapshot()).encode()
+                content_type = "application/json"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            """Don't log every scrape."""
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    registry.enable()
+    return server
+
+# The metrics of the game
+registry = Registry()
+
+# Engine
+months = registry.counter("moneysmartz_months_total", "Monthly ticks simulated")
+lives = registry.counter("moneysmartz_lives_total", "Headless lives simulated")
+monthly_finances_seconds = registry.histogram("moneysmartz_monthly_finances_seconds", "Time spent in process_monthly_finances", TICK_BUCKETS)
+random_events = registry.counter("moneysmartz_random_events_total", "Random events rolled", ("kind",))
+life_stage_checks = registry.counter("moneysmartz_life_stage_checks_total", "Monthly checks for a due life stage event")
+life_stage_events = registry.counter("moneysmartz_life_stage_events_total", "Life stage events that came due", ("event",))
+
+# Gameplay
+payments = registry.counter("moneysmartz_payments_total", "Scheduled payments made", ("type",))
+missed_payments = registry.counter("moneysmartz_missed_payments_total", "Scheduled payments missed", ("type",))
+net_worth = registry.gauge("moneysmartz_net_worth", "Net worth of the player after the latest month")
+
+# GUI
+screen_transitions = registry.counter("moneysmartz_screen_transitions_total", "Screens shown", ("screen",))
+frame_seconds = registry.histogram("moneysmartz_frame_seconds", "Time spent handling events, updating and drawing a frame", FRAME_BUCKETS)
@@ -20,6 +20,42 @@ class Player:
         self.assets = []
         self.family = []  # List of family members (spouse, children)
 
+    def to_dict(self):
+        """Serialize the player for saving."""
+        return {
+            "name": self.name,
+            "age": self.age,
+            "education": self.education,
+            "job": self.job,
+            "salary": self.salary,
+            "cash": self.cash,
+            "bank_account": self.bank_account.to_dict() if self.bank_account else None,
+            "debit_card": self.debit_card.to_dict() if self.debit_card else None,
+            "credit_card": self.credit_card.to_dict() if self.credit_card else None,
+            "credit_score": self.credit_score,
+            "loans": [loan.to_dict() for loan in self.loans],
+            "assets": [asset.to_dict() for asset in self.assets],
+            "family": self.family,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Restore a player from saved data."""
+        player = cls(data["name"])
+        player.age = data["age"]
+        player.education = data["education"]
+        player.job = data["job"]
+        player.salary = data["salary"]
+        player.cash = data["cash"]
+        player.bank_account = BankAccount.from_dict(data["bank_account"]) if data["bank_account"] else None
+        player.debit_card = Card.from_dict(data["debit_card"]) if data["debit_card"] else None
+        player.credit_card = Card.from_dict(data["credit_card"]) if data["credit_card"] else None
+        player.credit_score = data["credit_score"]
+        player.loans = [Loan.from_dict(loan) for loan in data["loans"]]
+        player.assets = [Asset.from_dict(asset) for asset in data["assets"]]
+        player.family = data["family"]
+        return player
+
 class BankAccount:
     """
     Represents a bank account that can hold money and earn interest.
@@ -55,6 +91,24 @@ class BankAccount:
             return interest
         return 0
 
+    def to_dict(self):
+        """Serialize the account for saving."""
+        return {
+            "account_type": self.account_type,
+            "balance": self.balance,
+            "interest_rate": self.interest_rate,
+            "transaction_history": self.transaction_history,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Restore an account from saved data."""
+        account = cls(data["account_type"])
+        account.balance = data["balance"]
+        account.interest_rate = data["interest_rate"]
+        account.transaction_history = data["transaction_history"]
+        return account
+
 class Card:
     """
     Represents a payment card (debit or credit).
@@ -90,6 +144,23 @@ class Card:
             return True
         return False
 
+    def to_dict(self):
+        """Serialize the card for saving."""
+        return {
+            "card_type": self.card_type,
+            "limit": self.limit,
+            "balance": self.balance,
+            "transaction_history": self.transaction_history,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Restore a card from saved data."""
+        card = cls(data["card_type"], data["limit"])
+        card.balance = data["balance"]
+        card.transaction_history = data["transaction_history"]
+        return card
+
 class Loan:
     """
     Represents a loan with principal, interest rate, and term.
@@ -138,6 +209,46 @@ class Loan:
         
         return True
 
+    def make_extra_payment(self, amount):
+        """Make an extra payment that goes entirely to principal."""
+        principal_payment = min(amount, self.current_balance)
+        if principal_payment <= 0:
+            return False
+
+        self.current_balance -= principal_payment
+
+        if self.current_balance < 0.01:  # Handle small floating-point errors
+            self.current_balance = 0
+
+        self.payment_history.append({
+            "amount": principal_payment,
+            "interest": 0,
+            "principal": principal_payment
+        })
+
+        return True
+
+    def to_dict(self):
+        """Serialize the loan for saving."""
+        return {
+            "loan_type": self.loan_type,
+            "original_amount": self.original_amount,
+            "current_balance": self.current_balance,
+            "interest_rate": self.interest_rate,
+            "term_years": self.term_years,
+            "monthly_payment": self.monthly_payment,
+            "payment_history": self.payment_history,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Restore a loan from saved data."""
+        loan = cls(data["loan_type"], data["original_amount"], data["interest_rate"], data["term_years"])
+        loan.current_balance = data["current_balance"]
+        loan.monthly_payment = data["monthly_payment"]
+        loan.payment_history = data["payment_history"]
+        return loan
+
 class Asset:
     """
     Represents an asset owned by the player (car, house, etc.).
@@ -171,4 +282,23 @@ class Asset:
     def repair(self, cost):
         """Repair the asset to improve its condition."""
         self.condition = "Good"
-        return cost
\ No newline at end of file
+        return cost
+
+    def to_dict(self):
+        """Serialize the asset for saving."""
+        return {
+            "asset_type": self.asset_type,
+            "name": self.name,
+            "purchase_value": self.purchase_value,
+            "current_value": self.current_value,
+            "condition": self.condition,
+            "age": self.age,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Restore an asset from saved data."""
+        asset = cls(data["asset_type"], data["name"], data["purchase_value"], data["condition"])
+        asset.current_value = data["current_value"]
+        asset.age = data["age"]
+        return asset
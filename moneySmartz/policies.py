@@ -0,0 +1,273 @@
+"""
+Decision policies for automated players.
+
+The headless engine (moneySmartz.simulation) asks a Policy at every point
+where the GUI shows buttons or the text mode asks a question: the bank
+account and debit card, college/trade school/work, which job to take,
+which car and how to pay, which house and where the down payment comes
+from, starting a family and having children, and each month's deposits
+and extra loan payments. Policies only see a read-only StateView of the
+game; the engine applies their decisions with the game's own rules.
+
+Batch runs take a policy by name (see POLICIES) or a Policy instance, and
+the GUI's autopilot plays the rest of a life with one.
+"""
+
+from collections import namedtuple
+
+LoanView = namedtuple("LoanView", ["loan_type", "balance", "interest_rate", "monthly_payment"])
+AssetView = namedtuple("AssetView", ["asset_type", "name", "value"])
+
+class StateView:
+    """
+    A read-only view of a game's state for policies.
+    """
+    __slots__ = ("_game",)
+
+    def __init__(self, game):
+        self._game = game
+
+    @property
+    def age(self):
+        return self._game.player.age
+
+    @property
+    def month(self):
+        return self._game.current_month
+
+    @property
+    def year(self):
+        """Years since the game started."""
+        return self._game.current_year
+
+    @property
+    def education(self):
+        return self._game.player.education
+
+    @property
+    def job(self):
+        """The job title, or None."""
+        return self._game.player.job
+
+    @property
+    def salary(self):
+        return self._game.player.salary
+
+    @property
+    def cash(self):
+        return self._game.player.cash
+
+    @property
+    def credit_score(self):
+        return self._game.player.credit_score
+
+    @property
+    def account_type(self):
+        """The bank account type, or None without an account."""
+        account = self._game.player.bank_account
+        return account.account_type if account else None
+
+    @property
+    def bank_balance(self):
+        account = self._game.player.bank_account
+        return account.balance if account else 0
+
+    @property
+    def has_debit_card(self):
+        return bool(self._game.player.debit_card)
+
+    @property
+    def credit_card_balance(self):
+        card = self._game.player.credit_card
+        return card.balance if card else 0
+
+    @property
+    def credit_card_limit(self):
+        """The credit limit (0 without a credit card)."""
+        card = self._game.player.credit_card
+        return card.limit if card else 0
+
+    @property
+    def loans(self):
+        """The loans as LoanViews, in the game's order (extra_loan_payment indexes this)."""
+        return tuple(
+            LoanView(loan.loan_type, loan.current_balance, loan.interest_rate, loan.monthly_payment)
+            for loan in self._game.player.loans
+        )
+
+    @property
+    def assets(self):
+        return tuple(AssetView(asset.asset_type, asset.name, asset.current_value) for asset in self._game.player.assets)
+
+    @property
+    def family_size(self):
+        """Spouse and children."""
+        return len(self._game.player.family)
+
+    @property
+    def living_expenses(self):
+        """This month's living expenses."""
+        return self._game.monthly_living_expenses()
+
+    @property
+    def net_worth(self):
+        return self._game.get_financial_summary()["net_worth"]
+
+class Policy:
+    """
+    Makes the decisions of an automated player.
+    This base class is the default player the headless engine has always
+    simulated; subclasses override the decisions they make differently.
+    Options are passed as the same dicts the screens use.
+    """
+    name = "default"
+
+    def open_bank_account(self, state):
+        """At 16, open an account with the parents' $50: "Checking", "Savings" or None."""
+        return "Checking"
+
+    def get_debit_card(self, state):
+        """Whether to get a debit card with a new checking account."""
+        return True
+
+    def education(self, state):
+        """At high school graduation: "College", "Trade School" or "Work"."""
+        return "Work"
+
+    def look_for_work(self, state):
+        """Whether to look for a job this month while unemployed (the job search events always do)."""
+        return False
+
+    def choose_job(self, state, job_options):
+        """Which of the job options to apply for, or None."""
+        return max(job_options, key=lambda job: job["salary"])
+
+    def choose_car(self, state, car_options):
+        """Which car to buy, or None to skip."""
+        return min(car_options, key=lambda car: car["value"])
+
+    def car_payment(self, state, car, methods):
+        """How to pay for the car: one of methods ("Cash", "Bank Account", "Auto Loan")."""
+        if state.cash >= car["value"]:
+            return "Cash"
+        if "Bank Account" in methods:
+            return "Bank Account"
+        return "Auto Loan"
+
+    def choose_house(self, state, house_options):
+        """Which house to buy, or None to skip."""
+        return min(house_options, key=lambda house: house["value"])
+
+    def down_payment_source(self, state, house, sources):
+        """Where the down payment comes from: one of sources ("Cash", "Bank Account")."""
+        return sources[0]
+
+    def start_family(self, state, spouse_income):
+        """Whether to start a family (spouse_income is 0 if the spouse doesn't work)."""
+        return True
+
+    def have_children(self, state, children):
+        """Whether to have the children after starting a family."""
+        return True
+
+    def deposit(self, state):
+        """How much cash to deposit in the bank this month."""
+        return 0
+
+    def extra_loan_payment(self, state):
+        """An extra loan payment this month as (index in state.loans, amount), or None."""
+        return None
+
+class FrugalPolicy(Policy):
+    """
+    Avoids debt and spending: works straight after high school, saves in a
+    savings account, only buys the cheapest car outright and keeps the
+    family small.
+    """
+    name = "frugal"
+    cash_buffer_months = 1  # Living expenses kept as cash, the rest is deposited
+
+    def open_bank_account(self, state):
+        return "Savings"
+
+    def look_for_work(self, state):
+        return True
+
+    def choose_car(self, state, car_options):
+        car = min(car_options, key=lambda car: car["value"])
+        if max(state.cash, state.bank_balance) >= car["value"]:
+            return car
+        return None
+
+    def have_children(self, state, children):
+        return False
+
+    def deposit(self, state):
+        return max(0, state.cash - state.living_expenses * self.cash_buffer_months)
+
+class SpenderPolicy(Policy):
+    """
+    Buys the most expensive car on a loan and the most expensive house it
+    can make the down payment on, and never saves beyond the automatic deposits.
+    """
+    name = "spender"
+
+    def look_for_work(self, state):
+        return True
+
+    def choose_car(self, state, car_options):
+        return max(car_options, key=lambda car: car["value"])
+
+    def car_payment(self, state, car, methods):
+        return "Auto Loan"
+
+    def choose_house(self, state, house_options):
+        savings = max(state.cash, state.bank_balance)
+        affordable = [house for house in house_options if house["value"] * 0.2 <= savings]
+        if not affordable:
+            return None
+        return max(affordable, key=lambda house: house["value"])
+
+class DebtAvalanchePolicy(Policy):
+    """
+    Makes the default choices, then puts everything above a few months of
+    living expenses into extra payments on the highest-interest loan.
+    """
+    name = "debt-avalanche"
+    cash_buffer_months = 3
+
+    def extra_loan_payment(self, state):
+        loans = [(loan.interest_rate, index, loan.balance) for index, loan in enumerate(state.loans) if loan.balance > 0]
+        if not loans:
+            return None
+        _, index, balance = max(loans)
+
+        # Pay from whichever of cash and bank has more to spare
+        spare = max(state.cash, state.bank_balance) - state.living_expenses * self.cash_buffer_months
+        amount = min(balance, spare)
+        if amount <= 0:
+            return None
+        return index, amount
+
+class MaxEducationPolicy(Policy):
+    """
+    Goes to college whatever it costs and always takes the best-paying job.
+    """
+    name = "max-education"
+
+    def education(self, state):
+        return "College"
+
+    def look_for_work(self, state):
+        return True
+
+# Reference policies by name
+POLICIES = {policy.name: policy for policy in (Policy, FrugalPolicy, SpenderPolicy, DebtAvalanchePolicy, MaxEducationPolicy)}
+
+def get_policy(policy):
+    """Get a Policy from a name in POLICIES or a Policy instance."""
+    if isinstance(policy, Policy):
+        return policy
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+    return POLICIES[policy]()
@@ -0,0 +1,104 @@
+"""
+In-game frame profiler overlay.
+
+Press F3 during the game to toggle it. While it is shown, GUIManager times
+handle_events, update and draw for every frame and the screen draws into a
+surface that counts blits. The overlay shows those numbers together with
+the number of Font.render calls, the text cache hit rate and a graph of
+recent frame times. While it is hidden the only cost is a counter increment
+per rendered text.
+"""
+
+import pygame
+from collections import deque
+from moneySmartz.constants import *
+
+# Per-frame counters, incremented by the UI code
+counters = {"blits": 0, "font_renders": 0}
+
+class CountingSurface(pygame.Surface):
+    """
+    A surface that counts the blits drawn onto it.
+    """
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Blit a surface and count it."""
+        counters["blits"] += 1
+        return super().blit(source, dest, area, special_flags)
+
+class FrameProfiler:
+    """
+    Collects per-frame timings and counts and draws them as an overlay.
+    """
+    def __init__(self, font, history=120):
+        self.font = font
+        self.visible = False
+        self.frames = deque(maxlen=history)  # (handle_events, update, draw) seconds per frame
+        self.blits = 0
+        self.font_renders = 0
+        self.cache_hits = 0
+        self.cache_lookups = 0
+        self.surface = None
+        self._cache_start = (0, 0)
+
+    def toggle(self):
+        """Show or hide the overlay."""
+        self.visible = not self.visible
+        self.frames.clear()
+
+    def target(self, display):
+        """Get the counting surface the screen draws into this frame."""
+        if self.surface is None or self.surface.get_size() != display.get_size():
+            self.surface = CountingSurface(display.get_size(), 0, display)
+        return self.surface
+
+    def begin_frame(self, text_cache):
+        """Reset the per-frame counters."""
+        counters["blits"] = 0
+        counters["font_renders"] = 0
+        self._cache_start = (text_cache.hits, text_cache.misses)
+
+    def end_frame(self, events_time, update_time, draw_time, text_cache):
+        """Record the timings and counts of the frame that just finished."""
+        self.frames.append((events_time, update_time, draw_time))
+        self.blits = counters["blits"]
+        self.font_renders = counters["font_renders"]
+        hits = text_cache.hits - self._cache_start[0]
+        misses = text_cache.misses - self._cache_start[1]
+        self.cache_hits = hits
+        self.cache_lookups = hits + misses
+
+    def draw(self, surface, screen_name):
+        """Draw the overlay in the top left corner."""
+        panel = pygame.Rect(10, 10, 360, 190)
+        background = pygame.Surface(panel.size, pygame.SRCALPHA)
+        background.fill((0, 0, 0, 210))
+        surface.blit(background, panel)
+
+        events_time, update_time, draw_time = self.frames[-1] if self.frames else (0, 0, 0)
+        hit_rate = self.cache_hits / self.cache_lookups * 100 if self.cache_lookups else 100.0
+        lines = [
+            screen_name,
+            f"events {events_time * 1000:.2f} ms  update {update_time * 1000:.2f} ms  draw {draw_time * 1000:.2f} ms",
+            f"blits {self.blits}  font.render {self.font_renders}",
+            f"text cache hit rate {hit_rate:.0f}% ({self.cache_lookups} lookups)",
+        ]
+        for i, line in enumerate(lines):
+            surface.blit(self.font.render(line, True, WHITE), (panel.left + 8, panel.top + 6 + i * 20))
+
+        # Rolling frame time graph (stacked: events, update, draw; the line is 1/FPS)
+        graph = pygame.Rect(panel.left + 8, panel.top + 92, panel.width - 16, 90)
+        pygame.draw.rect(surface, DARK_GRAY, graph, 1)
+        budget = 1 / FPS
+        scale = graph.height / (2 * budget)  # Full height is two frame budgets
+        budget_y = graph.bottom - int(budget * scale)
+        pygame.draw.line(surface, YELLOW, (graph.left, budget_y), (graph.right - 1, budget_y))
+
+        bar_width = max(1, graph.width // self.frames.maxlen)
+        for i, times in enumerate(self.frames):
+            x = graph.left + i * bar_width
+            y = graph.bottom
+            for seconds, color in zip(times, (LIGHT_BLUE, LIGHT_GREEN, ORANGE)):
+                height = min(int(seconds * scale), y - graph.top)
+                if height > 0:
+                    pygame.draw.rect(surface, color, (x, y - height, bar_width, height))
+                    y -= height
@@ -0,0 +1,125 @@
+"""
+cProfile sessions.
+
+Runs a callable (the GUI loop, the text game or a batch of simulated lives)
+under cProfile and writes:
+- PATH: the raw pstats dump (snakeviz, `python -m pstats PATH`, ...);
+- PATH with a .folded suffix: collapsed stacks ("a;b;c microseconds" per
+  line) for flamegraph.pl, speedscope or inferno;
+- a summary of the functions with the most cumulative time in the game
+  code (game.py, models.py, ui.py and screens/).
+
+cProfile only records caller/callee pairs, not whole stacks, so the
+collapsed stacks are rebuilt from the call graph: a function's time is
+split between the stacks it was called from in proportion to the time each
+caller spent in it. Functions called the same way from everywhere are
+exact; shared helpers are an estimate.
+"""
+
+import cProfile
+import os
+import pstats
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+SUMMARY_FILES = ("game.py", "models.py", "ui.py")  # Plus everything in screens/
+SUMMARY_LIMIT = 25
+MIN_STACK_SECONDS = 1e-6  # Stacks with less time are left out of the collapsed output
+MAX_STACK_DEPTH = 100
+
+def profile_call(func, path, *args, **kwargs):
+    """
+    Run func(*args, **kwargs) under cProfile and write the profile, the
+    collapsed stacks and the summary (see the module docstring).
+    Returns (func's result, the summary text).
+    """
+    profile = cProfile.Profile()
+    try:
+        result = profile.runcall(func, *args, **kwargs)
+    finally:
+        # Keep what was recorded even if the session ended with an error
+        stats = pstats.Stats(profile)
+        stats.dump_stats(path)
+        write_collapsed(stats, folded_path(path))
+    return result, summary(stats)
+
+def folded_path(path):
+    """Get the collapsed stacks path for a profile path (out.prof -> out.folded)."""
+    return os.path.splitext(path)[0] + ".folded"
+
+def function_label(function):
+    """Get a short readable label for a pstats function key (no semicolons, for collapsed stacks)."""
+    filename, line, name = function
+    if filename == "~":  # Built-in
+        return name.replace(";", ",")
+    if filename.startswith(PACKAGE_DIR):
+        filename = "moneySmartz" + filename[len(PACKAGE_DIR):].replace(os.sep, "/")
+    else:
+        filename = os.path.basename(filename)
+    return f"{name} ({filename}:{line})".replace(";", ",")
+
+def collapsed_stacks(stats):
+    """
+    Rebuild collapsed stacks from pstats call graph data.
+    Returns a dict of stack (tuple of function keys, outermost first) -> self seconds.
+    """
+    callees = {}
+    for function, (_, _, _, _, callers) in stats.stats.items():
+        for caller, (_, _, _, edge_cumulative) in callers.items():
+            callees.setdefault(caller, []).append((function, edge_cumulative))
+
+    roots = [function for function, (_, _, _, _, callers) in stats.stats.items() if not callers]
+    stacks = {}
+
+    # Each entry is (stack, seconds of the function on top spent under this stack)
+    pending = [((root,), stats.stats[root][3]) for root in roots]
+    while pending:
+        stack, seconds = pending.pop()
+        function = stack[-1]
+        _, _, self_time, cumulative, _ = stats.stats[function]
+        share = seconds / cumulative if cumulative else 0
+
+        self_seconds = self_time * share
+        if self_seconds >= MIN_STACK_SECONDS:
+            stacks[stack] = stacks.get(stack, 0) + self_seconds
+
+        if len(stack) >= MAX_STACK_DEPTH:
+            continue
+        for callee, edge_cumulative in callees.get(function, ()):
+            callee_seconds = edge_cumulative * share
+            if callee in stack or callee_seconds < MIN_STACK_SECONDS:
+                continue  # Recursion is already counted in the outer call
+            pending.append((stack + (callee,), callee_seconds))
+
+    return stacks
+
+def write_collapsed(stats, path):
+    """Write collapsed stacks ("a;b;c microseconds" per line) for flamegraph tools."""
+    with open(path, "w") as f:
+        for stack, seconds in sorted(collapsed_stacks(stats).items()):
+            microseconds = round(seconds * 1e6)
+            if microseconds:
+                f.write(";".join(function_label(function) for function in stack) + f" {microseconds}\n")
+
+def in_summary(function):
+    """Check whether a function is in the game code the summary covers."""
+    filename = function[0]
+    if not filename.startswith(PACKAGE_DIR):
+        return False
+    relative = os.path.relpath(filename, PACKAGE_DIR)
+    return relative in SUMMARY_FILES or relative.startswith("screens" + os.sep)
+
+def summary(stats, limit=SUMMARY_LIMIT):
+    """Get a text table of the game code functions with the most cumulative time."""
+    rows = []
+    for function, (_, calls, self_time, cumulative, _) in stats.stats.items():
+        if in_summary(function):
+            rows.append((cumulative, self_time, calls, function))
+    rows.sort(key=lambda row: row[0], reverse=True)
+
+    lines = [
+        f"Top {limit} game functions by cumulative time (of {stats.total_tt:.3f} s profiled):",
+        f"{'cumulative s':>12} {'self s':>9} {'calls':>9}  function",
+    ]
+    for cumulative, self_time, calls, function in rows[:limit]:
+        lines.append(f"{cumulative:12.3f} {self_time:9.3f} {calls:9d}  {function_label(function)}")
+    return "\n".join(lines)
@@ -0,0 +1,158 @@
+"""
+Columnar recording of per-month player state.
+
+A TraceRecorder hooks into the end of a game's months and writes each month's
+cash, balances, debts, asset value, net worth, credit score and salary
+straight into preallocated NumPy columns (one row per life, one column per
+month; float64 by default, which keeps money exact to the cent). Full chunks
+are flushed to one .npy file per field, so a batch of 100k lives never holds
+more than one chunk in memory and TraceReader can memory-map the files to
+slice lives or fields without loading everything.
+
+Requires NumPy.
+"""
+
+import os
+import numpy as np
+
+FIELDS = [
+    "cash", "bank_balance", "credit_card_debt", "loan_debt",
+    "asset_value", "net_worth", "credit_score", "salary",
+]
+
+MONTHS_PER_LIFE = (65 - 16) * 12  # Age 16 to retirement
+
+class TraceRecorder:
+    """
+    Records per-month traces for many lives into chunked column files.
+    Call start_life(game) before simulating each life and end_life() after it;
+    close() flushes the last partial chunk.
+    """
+    def __init__(self, directory, lives_per_chunk=1024, months=MONTHS_PER_LIFE, dtype=np.float64, prefix="chunk"):
+        self.directory = directory
+        self.lives_per_chunk = lives_per_chunk
+        self.months = months
+        self.prefix = prefix
+        self.chunks_written = 0
+
+        # Preallocated columns, reused for every chunk
+        self.columns = {field: np.zeros((lives_per_chunk, months), dtype=dtype) for field in FIELDS}
+        self.lengths = np.zeros(lives_per_chunk, dtype=np.int32)
+        self.life_ids = np.zeros(lives_per_chunk, dtype=np.int64)
+
+        self.row = 0
+        self.month = 0
+        self.game = None
+
+        os.makedirs(directory, exist_ok=True)
+
+    def start_life(self, game, life_id=None):
+        """Start recording a life by hooking into the end of the game's months."""
+        self.game = game
+        self.month = 0
+        self.life_ids[self.row] = self.chunks_written * self.lives_per_chunk + self.row if life_id is None else life_id
+        game.monthly_hooks.append(self.record)
+
+    def record(self, game):
+        """Record the current month (monthly hook)."""
+        if self.month >= self.months:
+            return
+
+        player = game.player
+        row = self.row
+        month = self.month
+        columns = self.columns
+
+        cash = player.cash
+        bank_balance = player.bank_account.balance if player.bank_account else 0
+        credit_card_debt = player.credit_card.balance if player.credit_card else 0
+
+        loan_debt = 0
+        for loan in player.loans:
+            loan_debt += loan.current_balance
+
+        asset_value = 0
+        for asset in player.assets:
+            asset_value += asset.current_value
+
+        columns["cash"][row, month] = cash
+        columns["bank_balance"][row, month] = bank_balance
+        columns["credit_card_debt"][row, month] = credit_card_debt
+        columns["loan_debt"][row, month] = loan_debt
+        columns["asset_value"][row, month] = asset_value
+        columns["net_worth"][row, month] = cash + bank_balance - credit_card_debt - loan_debt + asset_value
+        columns["credit_score"][row, month] = player.credit_score
+        columns["salary"][row, month] = player.salary
+
+        self.month = month + 1
+
+    def end_life(self):
+        """Finish the current life and flush the chunk if it is full."""
+        if self.game is not None:
+            self.game.monthly_hooks.remove(self.record)
+            self.game = None
+
+        self.lengths[self.row] = self.month
+        self.row += 1
+        if self.row == self.lives_per_chunk:
+            self.flush()
+
+    def flush(self):
+        """Write the recorded lives of the current chunk and start a new one."""
+        if self.row == 0:
+            return
+
+        chunk_dir = os.path.join(self.directory, f"{self.prefix}_{self.chunks_written:05d}")
+        os.makedirs(chunk_dir, exist_ok=True)
+
+        rows = self.row
+        for field, column in self.columns.items():
+            np.save(os.path.join(chunk_dir, f"{field}.npy"), column[:rows])
+        np.save(os.path.join(chunk_dir, "lengths.npy"), self.lengths[:rows])
+        np.save(os.path.join(chunk_dir, "life_ids.npy"), self.life_ids[:rows])
+
+        # Reset for the next chunk (zeroing keeps shorter lives padded with 0)
+        for column in self.columns.values():
+            column[:rows] = 0
+        self.row = 0
+        self.chunks_written += 1
+
+    def close(self):
+        """Flush any partially filled chunk."""
+        self.flush()
+
+class TraceReader:
+    """
+    Reads traces written by TraceRecorder.
+    Column files are memory-mapped, so slicing only pages in what is used.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self.chunk_dirs = sorted(
+            os.path.join(directory, name) for name in os.listdir(directory)
+            if os.path.isfile(os.path.join(directory, name, "life_ids.npy"))
+        )
+
+        # Map life ids to (chunk, row) using the small per-chunk id arrays
+        self.index = {}
+        for chunk, chunk_dir in enumerate(self.chunk_dirs):
+            for row, life_id in enumerate(np.load(os.path.join(chunk_dir, "life_ids.npy"))):
+                self.index[int(life_id)] = (chunk, row)
+
+    def __len__(self):
+        return len(self.index)
+
+    def column(self, field, chunk):
+        """Get a memory-mapped (lives x months) array of a field for one chunk."""
+        return np.load(os.path.join(self.chunk_dirs[chunk], f"{field}.npy"), mmap_mode="r")
+
+    def columns(self, field):
+        """Iterate over the memory-mapped arrays of a field for every chunk."""
+        for chunk in range(len(self.chunk_dirs)):
+            yield self.column(field, chunk)
+
+    def life(self, life_id, fields=FIELDS):
+        """Get the recorded months of one life as a dict of 1-D arrays."""
+        chunk, row = self.index[life_id]
+        length = int(np.load(os.path.join(self.chunk_dirs[chunk], "lengths.npy"), mmap_mode="r")[row])
+        return {field: np.array(self.column(field, chunk)[row, :length]) for field in fields}
@@ -0,0 +1,241 @@
+"""
+Headless render benchmark.
+
+Builds every screen in moneySmartz.screens on top of synthetic game states
+(a small early-game save and a 49-year save with long histories, many loans
+and assets and a large family), drives scripted input through
+handle_events/update/draw for a number of frames using SDL's dummy video
+driver, and reports p50/p95/p99 frame times per screen as JSON.
+
+Usage:
+    python -m moneySmartz.render_bench --frames 300 --output render.json
+    python -m moneySmartz.render_bench --baseline benchmarks/render_baseline.json
+
+With --baseline, each screen's p95 is compared with the stored result and
+the exit status is 1 if any screen is slower by more than --threshold.
+"""
+
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import copy
+import json
+import random
+import sys
+import time
+import pygame
+from pygame.locals import *
+from moneySmartz.constants import *
+from moneySmartz.game import Game
+from moneySmartz.models import Player, BankAccount, Card, Loan, Asset
+from moneySmartz.simulation import simulate_life
+from moneySmartz.ui import GUIManager
+from moneySmartz.screens.life_event_screens import RecommendingScreen
+
+STATES = ["small", "49_years"]
+LONG_GAME_AGE = 64  # The 49-year state stops short of retirement so the game is still running
+
+def small_game():
+    """Build an early-game state: a checking account, a credit card and one loan."""
+    game = Game()
+    player = game.player = Player("Sam")
+    player.age = 19
+    player.job = "Retail Associate"
+    player.salary = 25000
+    player.bank_account = BankAccount()
+    player.debit_card = Card("Debit")
+    player.credit_card = Card("Credit", 1000)
+    for i in range(20):
+        player.bank_account.deposit(100 + i)
+        player.credit_card.charge(20 + i)
+    player.loans.append(Loan("Auto", 5000, 0.05, 5))
+    for _ in range(6):
+        player.loans[0].make_payment(player.loans[0].monthly_payment)
+    player.assets.append(Asset("Car", "Used Economy Car", 5000))
+    game.current_year = 3
+    return game
+
+def long_game(seed=1):
+    """Build a 49-year state with long histories, many loans and assets and a large family."""
+    game = simulate_life(seed)
+    game.game_over = False
+    player = game.player
+    player.age = LONG_GAME_AGE
+
+    if not player.credit_card:
+        player.credit_card = Card("Credit", 10000)
+    player.credit_card.limit = 10 ** 9
+    for i in range(20000):
+        player.bank_account.deposit(10 + i % 50)
+        player.credit_card.charge(5 + i % 20)
+
+    for i in range(6):
+        loan = Loan(["Student", "Auto", "Mortgage", "Personal"][i % 4], 20000 + i * 10000, 0.04, 30)
+        for _ in range(360):
+            loan.make_payment(loan.monthly_payment)
+        player.loans.append(loan)
+
+    for i in range(10):
+        player.assets.append(Asset("Car" if i % 2 else "House", f"Asset {i + 1}", 10000 * (i + 1)))
+
+    player.family = [{"relation": "Spouse", "age": 0}]
+    player.family += [{"relation": "Child", "name": f"Child {i + 1}", "age": -i} for i in range(8)]
+    return game
+
+def screen_factories():
+    """Get (name, factory) for every screen; factories take a game."""
+    import moneySmartz.screens as screens
+
+    def random_event_screen(game):
+        event = game.events["negative"][0]
+        return screens.RandomEventScreen(game, event, -100)
+
+    def fast_forward_screen(game):
+        from moneySmartz.worker import SimulationWorker
+        return screens.FastForwardScreen(game, SimulationWorker(game, 12))
+
+    factories = []
+    for name in dir(screens):
+        cls = getattr(screens, name)
+        if not (isinstance(cls, type) and name.endswith("Screen")):
+            continue
+        if name == "EndGameScreen":
+            factories.append((name, lambda game, cls=cls: cls(game, "retirement")))
+        elif name == "RandomEventScreen":
+            factories.append((name, random_event_screen))
+        elif name == "FastForwardScreen":
+            factories.append((name, fast_forward_screen))
+        else:
+            factories.append((name, cls))
+    return sorted(factories)
+
+def scripted_mouse_pos(frame):
+    """Get the scripted pointer position for a frame (a diagonal sweep over the window)."""
+    return (frame * 7 % SCREEN_WIDTH, frame * 5 % SCREEN_HEIGHT)
+
+def scripted_events(frame):
+    """Get the synthetic input for a frame: mouse movement, wheel scrolling and typing."""
+    events = [pygame.event.Event(MOUSEMOTION, pos=scripted_mouse_pos(frame), rel=(7, 5), buttons=(0, 0, 0))]
+    if frame % 10 == 0:
+        events.append(pygame.event.Event(MOUSEWHEEL, x=0, y=-1 if frame % 40 < 20 else 1, flipped=False))
+    if frame % 15 == 0:
+        events.append(pygame.event.Event(KEYDOWN, key=K_1, unicode="1", mod=0, scancode=0))
+    return events
+
+def percentile(sorted_times, fraction):
+    """Get a percentile (nearest rank) of sorted frame times."""
+    index = min(len(sorted_times) - 1, max(0, int(round(fraction * len(sorted_times))) - 1))
+    return sorted_times[index]
+
+def bench_screen(gui_manager, factory, base_game, frames):
+    """Time scripted frames of one screen. Returns p50/p95/p99 in ms."""
+    random.seed(0)
+    game = copy.deepcopy(base_game)
+    game.verbose = False
+    game.gui_manager = gui_manager
+    gui_manager.game = game
+    gui_manager.screen_stack = []
+    gui_manager.game_screen = None
+    gui_manager.screen_cache = {}
+
+    screen = factory(game)
+    gui_manager.set_screen(screen)
+    surface = gui_manager.screen
+
+    # Time the screen as it stays, not while its recommendation is solved in the background
+    if isinstance(screen, RecommendingScreen) and screen.advisor:
+        screen.advisor.join()
+
+    # The dummy driver has no pointer, so widgets read the scripted position
+    mouse_pos = [(0, 0)]
+    real_get_pos = pygame.mouse.get_pos
+    pygame.mouse.get_pos = lambda: mouse_pos[0]
+
+    times = []
+    try:
+        for frame in range(frames):
+            mouse_pos[0] = scripted_mouse_pos(frame)
+            events = scripted_events(frame)
+            start = time.perf_counter()
+            screen.handle_events(events)
+            screen.update()
+            screen.draw(surface)
+            times.append(time.perf_counter() - start)
+    finally:
+        pygame.mouse.get_pos = real_get_pos
+
+    times.sort()
+    return {
+        "p50_ms": percentile(times, 0.50) * 1000,
+        "p95_ms": percentile(times, 0.95) * 1000,
+        "p99_ms": percentile(times, 0.99) * 1000,
+    }
+
+def run(frames=300, states=STATES):
+    """Run the benchmark and return the results dict."""
+    pygame.init()
+    gui_manager = GUIManager(Game())
+
+    builders = {"small": small_game, "49_years": long_game}
+    results = {}
+    for state in states:
+        base_game = builders[state]()
+        results[state] = {}
+        for name, factory in screen_factories():
+            results[state][name] = bench_screen(gui_manager, factory, base_game, frames)
+
+    return {
+        "frames": frames,
+        "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "results": results,
+    }
+
+def compare(current, baseline, threshold=1.25, metric="p95_ms"):
+    """
+    Compare results with a baseline.
+    Returns a list of (state, screen, baseline_ms, current_ms) for screens
+    slower than threshold times the baseline.
+    """
+    regressions = []
+    for state, screens in current["results"].items():
+        for name, stats in screens.items():
+            base = baseline["results"].get(state, {}).get(name)
+            if base and stats[metric] > base[metric] * threshold:
+                regressions.append((state, name, base[metric], stats[metric]))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless render benchmark for every screen.")
+    parser.add_argument("--frames", type=int, default=300, help="frames per screen and state")
+    parser.add_argument("--state", choices=STATES, action="append", help="only benchmark these states")
+    parser.add_argument("--output", help="write the results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--threshold", type=float, default=1.25, help="allowed slowdown factor of p95 against the baseline")
+    args = parser.parse_args(argv)
+
+    results = run(args.frames, args.state or STATES)
+
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for state, name, base, current in regressions:
+            print(f"REGRESSION {state} {name}: p95 {base:.3f} ms -> {current:.3f} ms", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No screen slower than {args.threshold}x the baseline p95.", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+"""
+SQLite results warehouse for batch simulations.
+
+Batch and Monte Carlo runs store one row per simulated life (seed, policy,
+parameters and the final summary shown on the end game screen) plus an
+optional per-month time series. Worker processes never touch the database:
+they put finished rows on a queue, and a single writer drains the queue in
+large transactions, which keeps SQLite's one-writer rule and keeps ingest fast.
+"""
+
+import json
+import multiprocessing
+import queue
+import sqlite3
+import threading
+
+RUN_COLUMNS = [
+    "run_id", "seed", "policy", "params", "years",
+    "cash", "bank_balance", "credit_card_debt", "loan_debt", "asset_value",
+    "net_worth", "credit_score", "rating",
+]
+
+MONTHLY_COLUMNS = [
+    "run_id", "month", "age",
+    "cash", "bank_balance", "credit_card_debt", "loan_debt", "asset_value",
+    "net_worth", "credit_score", "salary",
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    seed INTEGER NOT NULL,
+    policy TEXT NOT NULL,
+    params TEXT NOT NULL,
+    years INTEGER,
+    cash REAL,
+    bank_balance REAL,
+    credit_card_debt REAL,
+    loan_debt REAL,
+    asset_value REAL,
+    net_worth REAL,
+    credit_score INTEGER,
+    rating TEXT
+);
+CREATE TABLE IF NOT EXISTS monthly (
+    run_id INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    age INTEGER,
+    cash REAL,
+    bank_balance REAL,
+    credit_card_debt REAL,
+    loan_debt REAL,
+    asset_value REAL,
+    net_worth REAL,
+    credit_score INTEGER,
+    salary REAL,
+    PRIMARY KEY (run_id, month)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_runs_policy ON runs (policy, net_worth);
+CREATE INDEX IF NOT EXISTS idx_runs_rating ON runs (rating);
+CREATE INDEX IF NOT EXISTS idx_runs_net_worth ON runs (net_worth);
+"""
+
+class ResultsStore:
+    """
+    A results database opened in WAL mode.
+    Rows are written with executemany inside a single transaction per batch.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def add_runs(self, rows):
+        """Insert run rows (tuples in RUN_COLUMNS order) in one transaction."""
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT INTO runs ({', '.join(RUN_COLUMNS)}) VALUES ({', '.join('?' * len(RUN_COLUMNS))})",
+                rows
+            )
+
+    def add_monthly(self, rows):
+        """Insert monthly rows (tuples in MONTHLY_COLUMNS order) in one transaction."""
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT INTO monthly ({', '.join(MONTHLY_COLUMNS)}) VALUES ({', '.join('?' * len(MONTHLY_COLUMNS))})",
+                rows
+            )
+
+    def next_run_id(self):
+        """Get the first unused run id."""
+        row = self.connection.execute("SELECT MAX(run_id) FROM runs").fetchone()
+        return (row[0] or 0) + 1
+
+    def count_runs(self):
+        """Get the number of stored runs."""
+        return self.connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def runs_by_policy(self, policy):
+        """Get all runs for a policy, best net worth first."""
+        return self._query("SELECT * FROM runs WHERE policy = ? ORDER BY net_worth DESC", (policy,))
+
+    def runs_by_rating(self, rating):
+        """Get all runs that ended with a financial rating."""
+        return self._query("SELECT * FROM runs WHERE rating = ?", (rating,))
+
+    def runs_by_net_worth(self, low, high):
+        """Get all runs whose final net worth is between low and high."""
+        return self._query("SELECT * FROM runs WHERE net_worth BETWEEN ? AND ? ORDER BY net_worth", (low, high))
+
+    def monthly_series(self, run_id):
+        """Get the per-month time series of a run."""
+        return self._query("SELECT * FROM monthly WHERE run_id = ? ORDER BY month", (run_id,))
+
+    def _query(self, sql, args):
+        cursor = self.connection.execute(sql, args)
+        columns = [description[0] for description in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+class ResultsWriter(threading.Thread):
+    """
+    The single writer for a results database.
+    Drains (run_rows, monthly_rows) batches from a queue and commits them in
+    large transactions. Put None on the queue to flush and stop. If a write
+    fails, the exception is kept in error and the rest of the queue is
+    drained unwritten, so workers putting rows never block.
+    """
+    def __init__(self, path, row_queue, batch_size=50000):
+        super().__init__(daemon=True)
+        self.path = path
+        self.row_queue = row_queue
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self.error = None
+
+    def run(self):
+        """Write batches until the None sentinel arrives."""
+        store = None
+        runs = []
+        monthly = []
+        item = ()
+        try:
+            store = ResultsStore(self.path)
+            while True:
+                try:
+                    item = self.row_queue.get(timeout=0.5)
+                except queue.Empty:
+                    item = ()  # Idle: flush what we have
+
+                if item is None:
+                    break
+                if item:
+                    runs.extend(item[0])
+                    monthly.extend(item[1])
+
+                if len(runs) + len(monthly) >= self.batch_size or (not item and (runs or monthly)):
+                    self._flush(store, runs, monthly)
+                    runs = []
+                    monthly = []
+
+            self._flush(store, runs, monthly)
+        except Exception as e:
+            self.error = e
+            while item is not None:
+                item = self.row_queue.get()
+        finally:
+            if store:
+                store.close()
+
+    def _flush(self, store, runs, monthly):
+        if runs:
+            store.add_runs(runs)
+        if monthly:
+            store.add_monthly(monthly)
+        self.rows_written += len(runs) + len(monthly)
+
+def run_row(run_id, seed, policy, params, summary):
+    """Build a run row from a final summary (see Game.get_financial_summary)."""
+    return (
+        run_id, seed, policy, json.dumps(params or {}, sort_keys=True), summary.get("years"),
+        summary["cash"], summary["bank_balance"], summary["credit_card_debt"],
+        summary["loan_debt"], summary["asset_value"], summary["net_worth"],
+        summary["credit_score"], summary["rating"],
+    )
+
+def monthly_row(run_id, game):
+    """Build a monthly row from the current game state."""
+    summary = game.get_financial_summary()
+    month = game.current_year * 12 + game.current_month - 1  # Months since the game started
+    return (
+        run_id, month, game.player.age,
+        summary["cash"], summary["bank_balance"], summary["credit_card_debt"],
+        summary["loan_debt"], summary["asset_value"], summary["net_worth"],
+        summary["credit_score"], game.player.salary,
+    )
+
+# Queue shared with pool workers (set by _init_worker)
+_worker_queue = None
+
+def _init_worker(row_queue):
+    global _worker_queue
+    _worker_queue = row_queue
+
+def _run_chunk(args):
+    """Simulate a chunk of runs in a worker and queue their rows."""
+    chunk, record_monthly, trace_dir = args
+    from moneySmartz.simulation import simulate_life, run_summary
+
+    recorder = None
+    if trace_dir:
+        from moneySmartz.recorder import TraceRecorder
+        recorder = TraceRecorder(trace_dir, lives_per_chunk=len(chunk), prefix=f"runs_{chunk[0][0]:09d}")
+
+    runs = []
+    monthly = []
+    for run_id, spec in chunk:
+        if record_monthly:
+            def on_month(game, run_id=run_id):
+                monthly.append(monthly_row(run_id, game))
+        else:
+            on_month = None
+
+        policy = spec.get("policy", "default")
+        if recorder:
+            game = simulate_life(spec["seed"], policy, on_month=on_month, recorder=recorder, life_id=run_id, params=spec.get("params"))
+        else:
+            game = simulate_life(spec["seed"], policy, on_month=on_month, params=spec.get("params"))
+        runs.append(run_row(run_id, spec["seed"], getattr(policy, "name", policy), spec.get("params"), run_summary(game)))
+
+    if recorder:
+        recorder.close()
+
+    _worker_queue.put((runs, monthly))
+    return len(runs)
+
+def run_batch(path, specs, processes=None, record_monthly=False, chunk_size=50, trace_dir=None):
+    """
+    Simulate a batch of lives across a process pool and store the results.
+
+    specs is a list of dicts with a "seed" and optional "policy" (a name in
+    moneySmartz.policies.POLICIES or a Policy) and "params" (overrides of
+    moneySmartz.simulation.DEFAULT_PARAMS).
+    If trace_dir is given, per-month traces are also written there as NumPy
+    column files (see moneySmartz.recorder), one chunk per worker task.
+    Returns the number of runs stored.
+    Raises the first exception of a failed chunk once the other chunks are
+    stored, or the writer's exception if storing the rows failed.
+    """
+    store = ResultsStore(path)
+    first_id = store.next_run_id()
+    store.close()
+
+    numbered = list(enumerate(specs, start=first_id))
+    chunks = [(numbered[i:i + chunk_size], record_monthly, trace_dir) for i in range(0, len(numbered), chunk_size)]
+
+    row_queue = multiprocessing.Queue()
+    writer = ResultsWriter(path, row_queue)
+    writer.start()
+
+    pool = multiprocessing.Pool(processes, initializer=_init_worker, initargs=(row_queue,))
+    try:
+        total = sum(pool.imap_unordered(_run_chunk, chunks))
+    finally:
+        # close/join (not terminate), also when a chunk failed, so workers
+        # finish flushing their queue feeders and every finished run is stored
+        pool.close()
+        pool.join()
+        row_queue.put(None)
+        writer.join()
+        row_queue.close()
+        row_queue.join_thread()
+
+    if writer.error:
+        raise writer.error
+    return total
@@ -0,0 +1,318 @@
+"""
+Save slots and the save manifest.
+
+Each slot is stored as its own file. A small manifest file keeps a header
+for every slot (player name, age, year, net worth and a thumbnail), so a load
+menu can list hundreds of saves by reading one file, and the full game state
+is only deserialized when a slot is actually loaded.
+
+Transaction and payment histories, which make up most of a long game's
+save, are kept out of the slot file. They are packed as fixed-size binary
+records into a separate history file, one block per account, card or loan,
+and the slot file only stores each block's offset and record count. Loading
+a slot restores the core state and gives every account a LazyHistory that
+memory-maps its block the first time the history is actually read.
+
+Every save writes its histories to a new, uniquely named history file and
+records that name in the slot file. The slot file and the manifest are
+written to a temporary file first and moved into place with os.replace, so
+replacing the slot file is the single commit point of a save: a crash
+before it leaves the previous save (and its history file) intact, and
+older history files are only deleted after it. A crash never leaves a
+torn save.
+"""
+
+import glob
+import json
+import mmap
+import os
+import struct
+import time
+import uuid
+from collections.abc import MutableSequence
+from moneySmartz.constants import SAVE_DIR, THUMBNAIL_SIZE
+from moneySmartz.models import Player
+
+SAVE_VERSION = 3  # 3: the slot file names its history file
+MANIFEST_FILE = "manifest.json"
+
+# Binary record layout of each kind of history
+HISTORY_FORMATS = {
+    "transaction_history": struct.Struct("<Bd"),  # Type index, amount
+    "payment_history": struct.Struct("<ddd"),     # Amount, interest, principal
+}
+
+def write_atomic(path, data):
+    """Write bytes to a file atomically (temporary file + rename)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def history_owners(player_data):
+    """Get (serialized owner, history key) for every history in serialized player data."""
+    owners = []
+    for key in ("bank_account", "debit_card", "credit_card"):
+        if player_data[key]:
+            owners.append((player_data[key], "transaction_history"))
+    for loan_data in player_data["loans"]:
+        owners.append((loan_data, "payment_history"))
+    return owners
+
+def encode_history(records, key, buffer):
+    """
+    Append a history's records to buffer as a block.
+    Returns the block reference stored in the slot file.
+    """
+    record_format = HISTORY_FORMATS[key]
+    ref = {"offset": len(buffer), "count": 0}
+    types = []
+
+    # Histories that were never read are copied without decoding them
+    if isinstance(records, LazyHistory) and not records.loaded:
+        buffer += records.raw()
+        ref["count"] = records.ref["count"]
+        types = list(records.ref.get("types", []))
+        records = records.pending
+
+    for record in records:
+        if key == "transaction_history":
+            if record["type"] not in types:
+                types.append(record["type"])
+            buffer += record_format.pack(types.index(record["type"]), record["amount"])
+        else:
+            buffer += record_format.pack(record["amount"], record["interest"], record["principal"])
+        ref["count"] += 1
+
+    if key == "transaction_history":
+        ref["types"] = types
+    return ref
+
+def read_history_block(path, ref, key):
+    """Read the raw bytes of a history block through a memory map."""
+    size = ref["count"] * HISTORY_FORMATS[key].size
+    if size == 0:
+        return b""
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[ref["offset"]:ref["offset"] + size]
+
+def decode_history(data, ref, key):
+    """Decode the raw bytes of a history block into records."""
+    if key == "transaction_history":
+        types = ref["types"]
+        return [{"type": types[kind], "amount": amount}
+                for kind, amount in HISTORY_FORMATS[key].iter_unpack(data)]
+    return [{"amount": amount, "interest": interest, "principal": principal}
+            for amount, interest, principal in HISTORY_FORMATS[key].iter_unpack(data)]
+
+class LazyHistory(MutableSequence):
+    """
+    A transaction or payment history whose saved records stay on disk until
+    first read. Appending records and taking the length do not load it.
+    """
+    def __init__(self, path, ref, key):
+        self.path = path
+        self.ref = ref
+        self.key = key
+        self.pending = []  # Records appended since the save was loaded
+        self._records = None
+
+    @property
+    def loaded(self):
+        """Whether the saved records have been read."""
+        return self._records is not None
+
+    def raw(self):
+        """Get the saved block's bytes without decoding them."""
+        return read_history_block(self.path, self.ref, self.key)
+
+    def rebind(self, path, ref):
+        """Point an unread history at its block in a newly written save."""
+        self.path = path
+        self.ref = ref
+        self.pending = []
+
+    def _load(self):
+        if self._records is None:
+            self._records = decode_history(self.raw(), self.ref, self.key) + self.pending
+            self.pending = []
+        return self._records
+
+    def __len__(self):
+        if self._records is None:
+            return self.ref["count"] + len(self.pending)
+        return len(self._records)
+
+    def __getitem__(self, index):
+        return self._load()[index]
+
+    def __setitem__(self, index, value):
+        self._load()[index] = value
+
+    def __delitem__(self, index):
+        del self._load()[index]
+
+    def insert(self, index, value):
+        self._load().insert(index, value)
+
+    def append(self, value):
+        if self._records is None:
+            self.pending.append(value)
+        else:
+            self._records.append(value)
+
+    def __repr__(self):
+        if self._records is None:
+            return f"<LazyHistory {len(self)} records (not loaded)>"
+        return repr(self._records)
+
+class SaveManager:
+    """
+    Manages save slots in a directory, indexed by a manifest.
+    """
+    def __init__(self, directory=SAVE_DIR):
+        self.directory = directory
+        self._manifest = None
+
+    def slot_path(self, slot):
+        """Get the path of a slot's save file."""
+        return os.path.join(self.directory, f"slot_{slot:04d}.json")
+
+    def history_path(self, slot, history_file=None):
+        """
+        Get the path of a slot's history file: history_file as named in the
+        slot file, or the single history file of a version 2 save.
+        """
+        return os.path.join(self.directory, history_file or f"slot_{slot:04d}.hist")
+
+    def new_history_file(self, slot):
+        """Get a unique name for a slot's next history file."""
+        return f"slot_{slot:04d}.{uuid.uuid4().hex}.hist"
+
+    def history_files(self, slot):
+        """Get the paths of every history file of a slot, current or stale."""
+        directory = glob.escape(self.directory)
+        return glob.glob(os.path.join(directory, f"slot_{slot:04d}.hist")) + glob.glob(os.path.join(directory, f"slot_{slot:04d}.*.hist"))
+
+    def thumbnail_path(self, slot):
+        """Get the path of a slot's thumbnail image."""
+        return os.path.join(self.directory, f"slot_{slot:04d}.png")
+
+    def read_manifest(self):
+        """Read the manifest (cached after the first read)."""
+        if self._manifest is None:
+            try:
+                with open(os.path.join(self.directory, MANIFEST_FILE)) as f:
+                    self._manifest = json.load(f)
+            except FileNotFoundError:
+                self._manifest = {"version": SAVE_VERSION, "slots": {}}
+        return self._manifest
+
+    def list_slots(self):
+        """Get the header of every slot, most recently saved first."""
+        slots = self.read_manifest()["slots"].values()
+        return sorted(slots, key=lambda header: header["saved_at"], reverse=True)
+
+    def next_free_slot(self):
+        """Get the lowest unused slot number."""
+        used = {int(slot) for slot in self.read_manifest()["slots"]}
+        slot = 1
+        while slot in used:
+            slot += 1
+        return slot
+
+    def save(self, game, slot, thumbnail=None):
+        """
+        Save a game to a slot and update the manifest.
+        thumbnail, if given, is a pygame Surface (e.g. the current frame)
+        stored as a small preview image.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Move the histories into their own file, leaving block references
+        player_data = game.player.to_dict()
+        history = bytearray()
+        unread = []
+        for owner, key in history_owners(player_data):
+            records = owner[key]
+            owner[key] = encode_history(records, key, history)
+            if isinstance(records, LazyHistory) and not records.loaded:
+                unread.append((records, owner[key]))
+
+        history_file = self.new_history_file(slot)
+        state = {
+            "version": SAVE_VERSION,
+            "current_month": game.current_month,
+            "current_year": game.current_year,
+            "monthly_history": list(game.monthly_history),
+            "history_file": history_file,
+            "player": player_data,
+        }
+        history_path = self.history_path(slot, history_file)
+        write_atomic(history_path, bytes(history))
+        write_atomic(self.slot_path(slot), json.dumps(state).encode("utf-8"))  # Commit point
+
+        # Unread histories now live in the new history file, so the old ones can go
+        for records, ref in unread:
+            records.rebind(history_path, ref)
+        for path in self.history_files(slot):
+            if path != history_path:
+                os.remove(path)
+
+        thumbnail_file = None
+        if thumbnail is not None:
+            import pygame
+            thumbnail_file = os.path.basename(self.thumbnail_path(slot))
+            small = pygame.transform.smoothscale(thumbnail, THUMBNAIL_SIZE)
+            tmp_path = self.thumbnail_path(slot) + ".tmp.png"
+            pygame.image.save(small, tmp_path)
+            os.replace(tmp_path, self.thumbnail_path(slot))
+
+        manifest = self.read_manifest()
+        manifest["slots"][str(slot)] = {
+            "slot": slot,
+            "name": game.player.name,
+            "age": game.player.age,
+            "month": game.current_month,
+            "year": game.current_year + 2023,
+            "net_worth": game.get_financial_summary()["net_worth"],
+            "saved_at": time.time(),
+            "thumbnail": thumbnail_file,
+        }
+        write_atomic(os.path.join(self.directory, MANIFEST_FILE), json.dumps(manifest).encode("utf-8"))
+
+        game.save_slot = slot
+
+    def load(self, slot, game):
+        """
+        Load a slot into a game.
+        Histories are left on disk until they are first read.
+        """
+        with open(self.slot_path(slot)) as f:
+            state = json.load(f)
+
+        if state["version"] >= 2:
+            history_path = self.history_path(slot, state.get("history_file"))
+            for owner, key in history_owners(state["player"]):
+                owner[key] = LazyHistory(history_path, owner[key], key)
+
+        game.current_month = state["current_month"]
+        game.current_year = state["current_year"]
+        game.monthly_history.clear()
+        game.monthly_history.extend(tuple(month) for month in state.get("monthly_history", []))
+        game.player = Player.from_dict(state["player"])
+        game.game_over = False
+        game.save_slot = slot
+
+    def delete(self, slot):
+        """Delete a slot and remove it from the manifest."""
+        for path in [self.slot_path(slot), self.thumbnail_path(slot)] + self.history_files(slot):
+            if os.path.exists(path):
+                os.remove(path)
+
+        manifest = self.read_manifest()
+        if manifest["slots"].pop(str(slot), None) is not None:
+            write_atomic(os.path.join(self.directory, MANIFEST_FILE), json.dumps(manifest).encode("utf-8"))
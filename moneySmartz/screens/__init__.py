@@ -2,45 +2,59 @@
 Screen modules for the Money Smartz game.
 
 This package contains all the screen classes used in the game,
-organized by category.
+organized by category. The screen modules are imported on first use, so
+`from moneySmartz.screens import TitleScreen` only loads base_screens.
 """
 
-# Base screens
-from moneySmartz.screens.base_screens import (
-    TitleScreen,
-    NameInputScreen,
-    IntroScreen,
-    DebitCardScreen,
-    EndGameScreen
-)
-
-# Financial screens
-from moneySmartz.screens.financial_screens import (
-    BankAccountScreen,
-    BankDetailsScreen,
-    DepositScreen,
-    WithdrawScreen,
-    GetDebitCardScreen,
-    CreditCardScreen,
-    CreditCardDetailsScreen,
-    PayCreditCardScreen,
-    LoanDetailsScreen,
-    ExtraLoanPaymentScreen,
-    AssetDetailsScreen,
-    JobSearchScreen
-)
-
-# Game screen
-from moneySmartz.screens.game_screen import GameScreen
-
-# Life event screens
-from moneySmartz.screens.life_event_screens import (
-    HighSchoolGraduationScreen,
-    CollegeGraduationScreen,
-    CarPurchaseScreen,
-    HousingScreen,
-    FamilyPlanningScreen
-)
-
-# Random event screens
-from moneySmartz.screens.random_event_screens import RandomEventScreen
+import importlib
+
+# Screen class -> module it lives in
+_screen_modules = {
+    # Base screens
+    "TitleScreen": "base_screens",
+    "LoadGameScreen": "base_screens",
+    "NameInputScreen": "base_screens",
+    "IntroScreen": "base_screens",
+    "DebitCardScreen": "base_screens",
+    "EndGameScreen": "base_screens",
+
+    # Financial screens
+    "BankAccountScreen": "financial_screens",
+    "BankDetailsScreen": "financial_screens",
+    "DepositScreen": "financial_screens",
+    "WithdrawScreen": "financial_screens",
+    "GetDebitCardScreen": "financial_screens",
+    "CreditCardScreen": "financial_screens",
+    "CreditCardDetailsScreen": "financial_screens",
+    "PayCreditCardScreen": "financial_screens",
+    "LoanDetailsScreen": "financial_screens",
+    "ExtraLoanPaymentScreen": "financial_screens",
+    "AssetDetailsScreen": "financial_screens",
+    "JobSearchScreen": "financial_screens",
+
+    # Game screen
+    "GameScreen": "game_screen",
+    "FastForwardScreen": "game_screen",
+
+    # Life event screens
+    "HighSchoolGraduationScreen": "life_event_screens",
+    "CollegeGraduationScreen": "life_event_screens",
+    "CarPurchaseScreen": "life_event_screens",
+    "HousingScreen": "life_event_screens",
+    "FamilyPlanningScreen": "life_event_screens",
+
+    # Random event screens
+    "RandomEventScreen": "random_event_screens",
+}
+
+def __getattr__(name):
+    """Import a screen class's module the first time the class is used."""
+    module = _screen_modules.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_screen_modules))
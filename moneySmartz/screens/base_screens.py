@@ -2,7 +2,9 @@ import pygame
 import random
 from pygame.locals import *
 from moneySmartz.constants import *
-from moneySmartz.ui import Screen, Button, TextInput
+from moneySmartz.ui import Screen, Button, TextInput, TimeSeriesChart, get_font, render_text, Layer
+from moneySmartz import draw
+from moneySmartz.layout import layout
 
 class TitleScreen(Screen):
     """
@@ -12,8 +14,8 @@ class TitleScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_TITLE)
-        self.subtitle_font = pygame.font.SysFont('Arial', FONT_LARGE)
+        self.title_font = get_font(FONT_TITLE)
+        self.subtitle_font = get_font(FONT_LARGE)
 
         # Buttons
         start_button = Button(
@@ -24,15 +26,23 @@ class TitleScreen(Screen):
             action=self.start_new_game
         )
 
-        quit_button = Button(
+        load_button = Button(
             SCREEN_WIDTH // 2 - 100,
             SCREEN_HEIGHT // 2 + 120,
             200, 50,
+            "Load Game",
+            action=self.load_game
+        )
+
+        quit_button = Button(
+            SCREEN_WIDTH // 2 - 100,
+            SCREEN_HEIGHT // 2 + 190,
+            200, 50,
             "Quit",
             action=self.quit_game
         )
 
-        self.buttons = [start_button, quit_button]
+        self.buttons = [start_button, load_button, quit_button]
 
         # Background
         self.bg_color = LIGHT_BLUE
@@ -51,10 +61,19 @@ class TitleScreen(Screen):
         from moneySmartz.screens.base_screens import NameInputScreen
         self.game.gui_manager.set_screen(NameInputScreen(self.game))
 
+    def load_game(self):
+        """Open the load game menu."""
+        from moneySmartz.screens.base_screens import LoadGameScreen
+        self.game.gui_manager.set_screen(LoadGameScreen(self.game))
+
     def quit_game(self):
         """Quit the game."""
         self.game.gui_manager.running = False
 
+    def is_animating(self):
+        """The money background moves every frame."""
+        return True
+
     def update(self):
         """Update the title animation."""
         # Move title down to target position
@@ -81,26 +100,172 @@ class TitleScreen(Screen):
             size = random.randint(10, 30)
             alpha = random.randint(20, 100)
 
-            dollar_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-            pygame.draw.circle(dollar_surface, (0, 200, 0, alpha), (size//2, size//2), size//2)
+            pixels = layout.length(size)  # Drawn at window scale
+            dollar_surface = pygame.Surface((pixels, pixels), pygame.SRCALPHA)
+            pygame.draw.circle(dollar_surface, (0, 200, 0, alpha), (pixels // 2, pixels // 2), pixels // 2)
+            draw.blit(surface, dollar_surface, (x, y))
 
-            font = pygame.font.SysFont('Arial', size)
-            text = font.render("$", True, WHITE)
-            text_rect = text.get_rect(center=(size//2, size//2))
-            dollar_surface.blit(text, text_rect)
-
-            surface.blit(dollar_surface, (x, y))
+            font = get_font(size)
+            text = render_text(font, "$", True, WHITE)
+            text_rect = text.get_rect(center=(x + size // 2, y + size // 2))
+            draw.blit(surface, text, text_rect)
 
         # Title
-        title_surface = self.title_font.render("MONEY SMARTZ", True, GREEN)
+        title_surface = render_text(self.title_font, "MONEY SMARTZ", True, GREEN)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, self.title_y))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
         # Subtitle with fade-in
-        subtitle_surface = self.subtitle_font.render("Financial Life Simulator", True, (0, 100, 0))
+        subtitle_surface = render_text(self.subtitle_font, "Financial Life Simulator", True, (0, 100, 0))
         subtitle_surface.set_alpha(self.subtitle_alpha)
         subtitle_rect = subtitle_surface.get_rect(center=(SCREEN_WIDTH // 2, self.title_y + 60))
-        surface.blit(subtitle_surface, subtitle_rect)
+        draw.blit(surface, subtitle_surface, subtitle_rect)
+
+        # Draw buttons
+        for button in self.buttons:
+            button.draw(surface)
+
+class LoadGameScreen(Screen):
+    """
+    Screen listing saved games.
+    Only the save manifest is read to build the list; a slot's full state
+    is loaded when it is chosen.
+    """
+    def __init__(self, game):
+        super().__init__(game)
+
+        # Fonts
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
+
+        # Saved games (headers only)
+        from moneySmartz.saves import SaveManager
+        self.save_manager = SaveManager()
+        self.slots = self.save_manager.list_slots()
+
+        # Paging
+        self.page = 0
+        self.slots_per_page = 5
+
+        # Thumbnails of slots that have been shown (loaded on demand)
+        self.thumbnails = {}
+
+        self.create_buttons()
+
+    def create_buttons(self):
+        """Create the buttons for the current page."""
+        self.buttons = []
+
+        page_slots = self.slots[self.page * self.slots_per_page:(self.page + 1) * self.slots_per_page]
+        for i, header in enumerate(page_slots):
+            load_button = Button(
+                SCREEN_WIDTH - 220,
+                130 + i * 110 + 25,
+                150, 50,
+                "Load",
+                action=lambda slot=header["slot"]: self.load_slot(slot)
+            )
+            self.buttons.append(load_button)
+
+        if self.page > 0:
+            prev_button = Button(
+                50,
+                SCREEN_HEIGHT - 80,
+                150, 50,
+                "Previous",
+                action=self.previous_page
+            )
+            self.buttons.append(prev_button)
+
+        if (self.page + 1) * self.slots_per_page < len(self.slots):
+            next_button = Button(
+                SCREEN_WIDTH - 200,
+                SCREEN_HEIGHT - 80,
+                150, 50,
+                "Next",
+                action=self.next_page
+            )
+            self.buttons.append(next_button)
+
+        back_button = Button(
+            SCREEN_WIDTH // 2 - 100,
+            SCREEN_HEIGHT - 80,
+            200, 50,
+            "Back",
+            action=self.go_back
+        )
+        self.buttons.append(back_button)
+
+    def previous_page(self):
+        """Show the previous page of saves."""
+        self.page -= 1
+        self.create_buttons()
+
+    def next_page(self):
+        """Show the next page of saves."""
+        self.page += 1
+        self.create_buttons()
+
+    def load_slot(self, slot):
+        """Load the chosen slot and continue the game."""
+        self.save_manager.load(slot, self.game)
+        self.game.gui_manager.return_to_game()
+
+    def go_back(self):
+        """Go back to the title screen."""
+        from moneySmartz.screens.base_screens import TitleScreen
+        self.game.gui_manager.set_screen(TitleScreen(self.game))
+
+    def get_thumbnail(self, header):
+        """Get a slot's thumbnail surface, loading and scaling it to the window once per layout."""
+        key = (header["slot"], layout.version)
+        if key not in self.thumbnails:
+            thumbnail = None
+            if header["thumbnail"]:
+                try:
+                    thumbnail = pygame.image.load(self.save_manager.thumbnail_path(header["slot"])).convert()
+                    if layout.scale != 1:
+                        thumbnail = pygame.transform.smoothscale(thumbnail, (layout.length(THUMBNAIL_SIZE[0]), layout.length(THUMBNAIL_SIZE[1])))
+                except (pygame.error, FileNotFoundError):
+                    thumbnail = None
+            self.thumbnails[key] = thumbnail
+        return self.thumbnails[key]
+
+    def draw(self, surface):
+        """Draw the load game screen."""
+        # Background
+        surface.fill(WHITE)
+
+        # Title
+        title_surface = render_text(self.title_font, "Load Game", True, BLACK)
+        title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 60))
+        draw.blit(surface, title_surface, title_rect)
+
+        if not self.slots:
+            empty_surface = render_text(self.text_font, "No saved games yet.", True, BLACK)
+            empty_rect = empty_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+            draw.blit(surface, empty_surface, empty_rect)
+
+        page_slots = self.slots[self.page * self.slots_per_page:(self.page + 1) * self.slots_per_page]
+        for i, header in enumerate(page_slots):
+            y = 130 + i * 110
+
+            # Thumbnail
+            thumbnail_rect = pygame.Rect(50, y, THUMBNAIL_SIZE[0], THUMBNAIL_SIZE[1])
+            thumbnail = self.get_thumbnail(header)
+            if thumbnail:
+                draw.blit(surface, thumbnail, thumbnail_rect)
+            else:
+                draw.rect(surface, LIGHT_GRAY, thumbnail_rect)
+            draw.rect(surface, BLACK, thumbnail_rect, 2)  # Border
+
+            # Header details
+            name_surface = render_text(self.text_font, f"Slot {header['slot']}: {header['name']}", True, BLACK)
+            draw.blit(surface, name_surface, (200, y + 10))
+
+            details = f"Age {header['age']} - {header['month']}/{header['year']} - Net Worth: ${header['net_worth']:.2f}"
+            details_surface = render_text(self.text_font, details, True, GREEN if header['net_worth'] >= 0 else RED)
+            draw.blit(surface, details_surface, (200, y + 50))
 
         # Draw buttons
         for button in self.buttons:
@@ -114,7 +279,7 @@ class NameInputScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
+        self.title_font = get_font(FONT_LARGE)
 
         # Text input
         self.name_input = TextInput(
@@ -124,6 +289,7 @@ class NameInputScreen(Screen):
             font_size=FONT_MEDIUM,
             max_length=20
         )
+        self.widgets = [self.name_input]
 
         # Buttons
         start_button = Button(
@@ -169,9 +335,9 @@ class NameInputScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Enter Your Name", True, BLACK)
+        title_surface = render_text(self.title_font, "Enter Your Name", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
         # Draw text input
         self.name_input.draw(surface)
@@ -188,8 +354,8 @@ class IntroScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Buttons
         open_account_button = Button(
@@ -220,8 +386,7 @@ class IntroScreen(Screen):
 
     def skip_bank_account(self):
         """Skip opening a bank account and continue."""
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def draw(self, surface):
         """Draw the intro screen."""
@@ -229,9 +394,9 @@ class IntroScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render(f"Welcome, {self.game.player.name}!", True, BLACK)
+        title_surface = render_text(self.title_font, f"Welcome, {self.game.player.name}!", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
         # Introduction text
         intro_lines = [
@@ -245,9 +410,9 @@ class IntroScreen(Screen):
         ]
 
         for i, line in enumerate(intro_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
-            surface.blit(text_surface, text_rect)
+            draw.blit(surface, text_surface, text_rect)
 
         # Draw buttons
         for button in self.buttons:
@@ -261,8 +426,8 @@ class DebitCardScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Buttons
         get_card_button = Button(
@@ -287,13 +452,11 @@ class DebitCardScreen(Screen):
         """Get a debit card and continue."""
         from moneySmartz.models import Card
         self.game.player.debit_card = Card("Debit")
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def skip_debit_card(self):
         """Skip getting a debit card and continue."""
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def draw(self, surface):
         """Draw the debit card screen."""
@@ -301,27 +464,27 @@ class DebitCardScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Congratulations!", True, BLACK)
+        title_surface = render_text(self.title_font, "Congratulations!", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
         # Card image (simple rectangle)
         card_rect = pygame.Rect(SCREEN_WIDTH // 2 - 125, 150, 250, 150)
-        pygame.draw.rect(surface, BLUE, card_rect)
-        pygame.draw.rect(surface, BLACK, card_rect, 2)  # Border
+        draw.rect(surface, BLUE, card_rect)
+        draw.rect(surface, BLACK, card_rect, 2)  # Border
 
         # Card text
-        card_title = self.text_font.render("CHECKING ACCOUNT", True, WHITE)
+        card_title = render_text(self.text_font, "CHECKING ACCOUNT", True, WHITE)
         card_title_rect = card_title.get_rect(center=(SCREEN_WIDTH // 2, 180))
-        surface.blit(card_title, card_title_rect)
+        draw.blit(surface, card_title, card_title_rect)
 
-        card_name = self.text_font.render(self.game.player.name, True, WHITE)
+        card_name = render_text(self.text_font, self.game.player.name, True, WHITE)
         card_name_rect = card_name.get_rect(center=(SCREEN_WIDTH // 2, 220))
-        surface.blit(card_name, card_name_rect)
+        draw.blit(surface, card_name, card_name_rect)
 
-        card_number = self.text_font.render("**** **** **** 1234", True, WHITE)
+        card_number = render_text(self.text_font, "**** **** **** 1234", True, WHITE)
         card_number_rect = card_number.get_rect(center=(SCREEN_WIDTH // 2, 260))
-        surface.blit(card_number, card_number_rect)
+        draw.blit(surface, card_number, card_number_rect)
 
         # Explanation text
         text_lines = [
@@ -334,9 +497,9 @@ class DebitCardScreen(Screen):
         ]
 
         for i, line in enumerate(text_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 350 + i * 30))
-            surface.blit(text_surface, text_rect)
+            draw.blit(surface, text_surface, text_rect)
 
         # Draw buttons
         for button in self.buttons:
@@ -351,41 +514,35 @@ class EndGameScreen(Screen):
         self.reason = reason
 
         # Fonts
-        self.title_font = pygame.font.SysFont('Arial', FONT_TITLE)
-        self.subtitle_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_TITLE)
+        self.subtitle_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Calculate final stats
-        self.cash = self.game.player.cash
-        self.bank_balance = self.game.player.bank_account.balance if self.game.player.bank_account else 0
-        self.credit_card_debt = self.game.player.credit_card.balance if self.game.player.credit_card else 0
-
-        self.loan_debt = 0
-        for loan in self.game.player.loans:
-            self.loan_debt += loan.current_balance
-
-        self.asset_value = 0
-        for asset in self.game.player.assets:
-            self.asset_value += asset.current_value
-
-        self.net_worth = self.cash + self.bank_balance - self.credit_card_debt - self.loan_debt + self.asset_value
+        summary = self.game.get_financial_summary()
+        self.cash = summary["cash"]
+        self.bank_balance = summary["bank_balance"]
+        self.credit_card_debt = summary["credit_card_debt"]
+        self.loan_debt = summary["loan_debt"]
+        self.asset_value = summary["asset_value"]
+        self.net_worth = summary["net_worth"]
 
         # Financial rating
-        if self.net_worth >= 1000000:
-            self.rating = "Financial Wizard"
-            self.rating_color = GREEN
-        elif self.net_worth >= 500000:
-            self.rating = "Financially Secure"
-            self.rating_color = LIGHT_GREEN
-        elif self.net_worth >= 100000:
-            self.rating = "Financially Stable"
-            self.rating_color = BLUE
-        elif self.net_worth >= 0:
-            self.rating = "Breaking Even"
-            self.rating_color = YELLOW
-        else:
-            self.rating = "In Debt"
-            self.rating_color = RED
+        self.rating = summary["rating"]
+        self.rating_color = {
+            "Financial Wizard": GREEN,
+            "Financially Secure": LIGHT_GREEN,
+            "Financially Stable": BLUE,
+            "Breaking Even": YELLOW,
+            "In Debt": RED,
+        }[self.rating]
+
+        # Lifetime breakdown, one point per month
+        self.breakdown_chart = TimeSeriesChart(
+            520, 195, 480, 210,
+            [("Cash", GREEN), ("Bank", BLUE), ("Debt", RED), ("Assets", ORANGE)],
+        )
+        self.breakdown_chart.extend(self.game.monthly_history)
 
         # Buttons
         quit_button = Button(
@@ -398,6 +555,9 @@ class EndGameScreen(Screen):
 
         self.buttons = [quit_button]
 
+        # The final summary never changes, so it is painted once
+        self.background = Layer(self.draw_background)
+
     def quit_game(self):
         """Quit the game."""
         self.game.gui_manager.running = False
@@ -405,18 +565,24 @@ class EndGameScreen(Screen):
     def draw_text(self, surface, text, x, y, center=False, is_title=False):
         """Helper method to draw text."""
         font = self.title_font if is_title else self.text_font
-        text_surface = font.render(text, True, BLACK)
+        text_surface = render_text(font, text, True, BLACK)
         if center:
             text_rect = text_surface.get_rect(center=(x, y))
         else:
             text_rect = text_surface.get_rect(topleft=(x, y))
-        surface.blit(text_surface, text_rect)
+        draw.blit(surface, text_surface, text_rect)
 
     def draw(self, surface):
         """Draw the end game screen."""
-        # Background
-        surface.fill(WHITE)
+        # Final summary
+        self.background.draw(surface)
 
+        # Draw buttons
+        for button in self.buttons:
+            button.draw(surface)
+
+    def draw_background(self, surface):
+        """Draw the static summary layer."""
         # Title
         if self.reason == "retirement":
             title = "CONGRATULATIONS ON YOUR RETIREMENT!"
@@ -425,18 +591,18 @@ class EndGameScreen(Screen):
             title = "GAME OVER"
             subtitle = f"Your financial journey has ended after {self.game.current_year} years."
 
-        title_surface = self.title_font.render(title, True, BLUE)
+        title_surface = render_text(self.title_font, title, True, BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 60))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
-        subtitle_surface = self.subtitle_font.render(subtitle, True, BLACK)
+        subtitle_surface = render_text(self.subtitle_font, subtitle, True, BLACK)
         subtitle_rect = subtitle_surface.get_rect(center=(SCREEN_WIDTH // 2, 110))
-        surface.blit(subtitle_surface, subtitle_rect)
+        draw.blit(surface, subtitle_surface, subtitle_rect)
 
         # Financial summary
-        summary_title = self.subtitle_font.render("FINAL FINANCIAL SUMMARY", True, BLACK)
-        summary_rect = summary_title.get_rect(center=(SCREEN_WIDTH // 2, 170))
-        surface.blit(summary_title, summary_rect)
+        summary_title = render_text(self.subtitle_font, "FINAL FINANCIAL SUMMARY", True, BLACK)
+        summary_rect = summary_title.get_rect(center=(SCREEN_WIDTH // 4 + 20, 170))
+        draw.blit(surface, summary_title, summary_rect)
 
         summary_items = [
             f"Cash: ${self.cash:.2f}",
@@ -449,15 +615,21 @@ class EndGameScreen(Screen):
         ]
 
         for i, item in enumerate(summary_items):
-            text_surface = self.text_font.render(item, True, BLACK)
-            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 210 + i * 30))
-            surface.blit(text_surface, text_rect)
+            text_surface = render_text(self.text_font, item, True, BLACK)
+            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 4 + 20, 210 + i * 30))
+            draw.blit(surface, text_surface, text_rect)
+
+        # Lifetime breakdown
+        chart_title = render_text(self.subtitle_font, "LIFETIME BREAKDOWN", True, BLACK)
+        chart_rect = chart_title.get_rect(center=(self.breakdown_chart.rect.centerx, 170))
+        draw.blit(surface, chart_title, chart_rect)
+        self.breakdown_chart.draw(surface)
 
         # Family summary
         if self.game.player.family:
-            family_title = self.subtitle_font.render("FAMILY", True, BLACK)
+            family_title = render_text(self.subtitle_font, "FAMILY", True, BLACK)
             family_rect = family_title.get_rect(center=(SCREEN_WIDTH // 2, 430))
-            surface.blit(family_title, family_rect)
+            draw.blit(surface, family_title, family_rect)
 
             y_pos = 470
             for member in self.game.player.family:
@@ -466,25 +638,21 @@ class EndGameScreen(Screen):
                 else:
                     text = f"{member['relation']}: {member['name']}, Age {member['age'] + self.game.current_year}"
 
-                text_surface = self.text_font.render(text, True, BLACK)
+                text_surface = render_text(self.text_font, text, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                surface.blit(text_surface, text_rect)
+                draw.blit(surface, text_surface, text_rect)
                 y_pos += 30
 
         # Financial rating
-        rating_title = self.subtitle_font.render("Financial Rating:", True, BLACK)
+        rating_title = render_text(self.subtitle_font, "Financial Rating:", True, BLACK)
         rating_rect = rating_title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 180))
-        surface.blit(rating_title, rating_rect)
+        draw.blit(surface, rating_title, rating_rect)
 
-        rating_text = self.title_font.render(self.rating, True, self.rating_color)
+        rating_text = render_text(self.title_font, self.rating, True, self.rating_color)
         rating_text_rect = rating_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 140))
-        surface.blit(rating_text, rating_text_rect)
+        draw.blit(surface, rating_text, rating_text_rect)
 
         # Thank you message
-        thanks_text = self.text_font.render("Thank you for playing MONEY SMARTZ!", True, BLACK)
+        thanks_text = render_text(self.text_font, "Thank you for playing MONEY SMARTZ!", True, BLACK)
         thanks_rect = thanks_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 110))
-        surface.blit(thanks_text, thanks_rect)
-
-        # Draw buttons
-        for button in self.buttons:
-            button.draw(surface)
+        draw.blit(surface, thanks_text, thanks_rect)
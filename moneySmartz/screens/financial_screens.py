@@ -2,9 +2,74 @@ import pygame
 import random
 from pygame.locals import *
 from moneySmartz.constants import *
-from moneySmartz.ui import Screen, Button, TextInput
+from moneySmartz.ui import Screen, Button, TextInput, ScrollList, get_font, render_text
+from moneySmartz import draw
 from moneySmartz.models import BankAccount, Card, Loan, Asset
 
+class HistoryControls:
+    """
+    Filter and jump controls under a history list: a button cycling through
+    the filters, Oldest and Newest buttons, and an entry number to go to.
+    filters is a list of (label, predicate) pairs; a None predicate shows
+    every entry.
+    """
+    def __init__(self, get_list, filters, y=595):
+        self.get_list = get_list  # The screen can swap its list (e.g. for another loan)
+        self.filters = filters
+        self.filter_index = 0
+
+        self.filter_button = Button(100, y, 220, 40, f"Show: {filters[0][0]}", font_size=FONT_SMALL, action=self.next_filter)
+        self.jump_input = TextInput(580, y, 100, 40, font_size=FONT_SMALL, max_length=6)
+        self.buttons = [
+            self.filter_button,
+            Button(330, y, 110, 40, "Oldest", font_size=FONT_SMALL, action=self.oldest),
+            Button(450, y, 110, 40, "Newest", font_size=FONT_SMALL, action=self.newest),
+            Button(690, y, 120, 40, "Go to #", font_size=FONT_SMALL, action=self.jump),
+        ]
+        self.widgets = [self.jump_input]
+
+    def reset(self):
+        """Go back to the first filter and clear the entry number (a new visit)."""
+        self.filter_index = 0
+        self.filter_button.text = f"Show: {self.filters[0][0]}"
+        self.jump_input.text = ""
+        self.jump_input.active = False
+        self.jump_input.dirty = True
+        self.apply()
+
+    def next_filter(self):
+        """Show the next filter's entries."""
+        self.filter_index = (self.filter_index + 1) % len(self.filters)
+        self.filter_button.text = f"Show: {self.filters[self.filter_index][0]}"
+        self.apply()
+
+    def apply(self):
+        """Apply the current filter to the list."""
+        self.get_list().set_filter(self.filters[self.filter_index][1])
+
+    def oldest(self):
+        """Jump to the first entry shown."""
+        self.get_list().scroll_to(0)
+
+    def newest(self):
+        """Jump to the last entry shown."""
+        self.get_list().scroll_to_end()
+
+    def jump(self):
+        """Jump to the entry number typed in (or the next one shown)."""
+        try:
+            number = int(self.jump_input.text)
+        except ValueError:
+            return
+        self.get_list().scroll_to_item(number)
+
+    def update(self, events):
+        """Type an entry number; Enter jumps to it."""
+        entered = self.jump_input.active and any(event.type == KEYDOWN and event.key == K_RETURN for event in events)
+        self.jump_input.update(events)
+        if entered:
+            self.jump()
+
 class BankAccountScreen(Screen):
     """
     Screen for opening a bank account.
@@ -13,8 +78,8 @@ class BankAccountScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Account type selection
         self.selected_account_type = "Checking"
@@ -65,6 +130,7 @@ class BankAccountScreen(Screen):
             max_length=10,
             initial_text="50"
         )
+        self.widgets = [self.deposit_input]
 
     def select_checking(self):
         """Select checking account type."""
@@ -99,16 +165,14 @@ class BankAccountScreen(Screen):
                 from moneySmartz.screens.base_screens import DebitCardScreen
                 self.game.gui_manager.set_screen(DebitCardScreen(self.game))
             else:
-                from moneySmartz.screens.game_screen import GameScreen
-                self.game.gui_manager.set_screen(GameScreen(self.game))
+                self.game.gui_manager.return_to_game()
         except ValueError:
             # Invalid input, do nothing
             pass
 
     def go_back(self):
         """Go back to the game screen."""
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def handle_events(self, events):
         """Handle pygame events."""
@@ -121,9 +185,9 @@ class BankAccountScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Open a Bank Account", True, BLACK)
+        title_surface = render_text(self.title_font, "Open a Bank Account", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
         # Explanation text
         text_lines = [
@@ -136,9 +200,9 @@ class BankAccountScreen(Screen):
         ]
 
         for i, line in enumerate(text_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
-            surface.blit(text_surface, text_rect)
+            draw.blit(surface, text_surface, text_rect)
 
         # Draw deposit input
         self.deposit_input.draw(surface)
@@ -155,12 +219,17 @@ class BankDetailsScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
-        # Transaction history scroll
-        self.scroll_position = 0
-        self.max_visible_transactions = 10
+        # Transaction history
+        self.history_list = ScrollList(
+            100, 280,
+            SCREEN_WIDTH - 200, 300,
+            self.game.player.bank_account.transaction_history,
+            self.format_transaction
+        )
+        self.widgets = [self.history_list]
 
         # Buttons
         back_button = Button(
@@ -189,20 +258,36 @@ class BankDetailsScreen(Screen):
 
         self.buttons = [back_button, scroll_up_button, scroll_down_button]
 
+    def on_resume(self):
+        """Start a new visit at the top of the history."""
+        self.history_list.scroll_to(0)
+
+    def handle_events(self, events):
+        """Handle pygame events."""
+        super().handle_events(events)
+        self.history_list.update(events)
+
     def scroll_up(self):
         """Scroll transaction history up."""
-        if self.scroll_position > 0:
-            self.scroll_position -= 1
+        self.history_list.scroll_by(-self.history_list.row_height)
 
     def scroll_down(self):
         """Scroll transaction history down."""
-        if self.scroll_position < max(0, len(self.game.player.bank_account.transaction_history) - self.max_visible_transactions):
-            self.scroll_position += 1
+        self.history_list.scroll_by(self.history_list.row_height)
+
+    def format_transaction(self, transaction):
+        """Get the text and color of a transaction row."""
+        if transaction["type"] == "deposit":
+            return f"Deposit: +${transaction['amount']:.2f}", GREEN
+        elif transaction["type"] == "withdrawal":
+            return f"Withdrawal: -${transaction['amount']:.2f}", RED
+        elif transaction["type"] == "interest":
+            return f"Interest: +${transaction['amount']:.2f}", BLUE
+        return f"{transaction['type']}: ${transaction['amount']:.2f}", BLACK
 
     def go_back(self):
         """Go back to the game screen."""
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def draw(self, surface):
         """Draw the bank details screen."""
@@ -210,9 +295,9 @@ class BankDetailsScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Bank Account Details", True, BLACK)
+        title_surface = render_text(self.title_font, "Bank Account Details", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
         # Account info
         account_type = self.game.player.bank_account.account_type
@@ -235,48 +320,22 @@ class BankDetailsScreen(Screen):
             info_lines.append("You have a debit card linked to this account.")
 
         for i, line in enumerate(info_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 100 + i * 30))
-            surface.blit(text_surface, text_rect)
+            draw.blit(surface, text_surface, text_rect)
 
         # Transaction history
-        history_title = self.title_font.render("Transaction History", True, BLACK)
+        history_title = render_text(self.title_font, "Transaction History", True, BLACK)
         history_rect = history_title.get_rect(center=(SCREEN_WIDTH // 2, 250))
-        surface.blit(history_title, history_rect)
+        draw.blit(surface, history_title, history_rect)
 
         # Draw transaction list
         if self.game.player.bank_account.transaction_history:
-            # Draw scrollable area background
-            scroll_area = pygame.Rect(100, 280, SCREEN_WIDTH - 200, 300)
-            pygame.draw.rect(surface, LIGHT_GRAY, scroll_area)
-            pygame.draw.rect(surface, BLACK, scroll_area, 2)  # Border
-
-            # Get visible transactions
-            visible_transactions = self.game.player.bank_account.transaction_history[
-                self.scroll_position:self.scroll_position + self.max_visible_transactions
-            ]
-
-            for i, transaction in enumerate(visible_transactions):
-                if transaction["type"] == "deposit":
-                    text = f"Deposit: +${transaction['amount']:.2f}"
-                    color = GREEN
-                elif transaction["type"] == "withdrawal":
-                    text = f"Withdrawal: -${transaction['amount']:.2f}"
-                    color = RED
-                elif transaction["type"] == "interest":
-                    text = f"Interest: +${transaction['amount']:.2f}"
-                    color = BLUE
-                else:
-                    text = f"{transaction['type']}: ${transaction['amount']:.2f}"
-                    color = BLACK
-
-                text_surface = self.text_font.render(text, True, color)
-                text_rect = text_surface.get_rect(midleft=(120, 300 + i * 30))
-                surface.blit(text_surface, text_rect)
+            self.history_list.draw(surface)
         else:
-            no_transactions = self.text_font.render("No transactions yet.", True, BLACK)
+            no_transactions = render_text(self.text_font, "No transactions yet.", True, BLACK)
             no_transactions_rect = no_transactions.get_rect(center=(SCREEN_WIDTH // 2, 320))
-            surface.blit(no_transactions, no_transactions_rect)
+            draw.blit(surface, no_transactions, no_transactions_rect)
 
         # Draw buttons
         for button in self.buttons:
@@ -290,8 +349,8 @@ class DepositScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Amount input
         self.amount_input = TextInput(
@@ -301,6 +360,7 @@ class DepositScreen(Screen):
             font_size=FONT_MEDIUM,
             max_length=10
         )
+        self.widgets = [self.amount_input]
 
         # Buttons
         deposit_button = Button(
@@ -354,8 +414,7 @@ class DepositScreen(Screen):
 
     def go_back(self):
         """Go back to the game screen."""
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def handle_events(self, events):
         """Handle pygame events."""
@@ -368,9 +427,9 @@ class DepositScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Deposit to Bank", True, BLACK)
+        title_surface = render_text(self.title_font, "Deposit to Bank", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
         # Info text
         info_lines = [
@@ -381,18 +440,18 @@ class DepositScreen(Screen):
         ]
 
         for i, line in enumerate(info_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
-            surface.blit(text_surface, text_rect)
+            draw.blit(surface, text_surface, text_rect)
 
         # Draw amount input
         self.amount_input.draw(surface)
 
         # Draw status message
         if self.status_message:
-            status_surface = self.text_font.render(self.status_message, True, self.status_color)
+            status_surface = render_text(self.text_font, self.status_message, True, self.status_color)
             status_rect = status_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
-            surface.blit(status_surface, status_rect)
+            draw.blit(surface, status_surface, status_rect)
 
         # Draw buttons
         for button in self.buttons:
@@ -406,8 +465,8 @@ class WithdrawScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Amount input
         self.amount_input = TextInput(
@@ -417,6 +476,7 @@ class WithdrawScreen(Screen):
             font_size=FONT_MEDIUM,
             max_length=10
         )
+        self.widgets = [self.amount_input]
 
         # Buttons
         withdraw_button = Button(
@@ -470,8 +530,7 @@ class WithdrawScreen(Screen):
 
     def go_back(self):
         """Go back to the game screen."""
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def handle_events(self, events):
         """Handle pygame events."""
@@ -484,9 +543,9 @@ class WithdrawScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Withdraw from Bank", True, BLACK)
+        title_surface = render_text(self.title_font, "Withdraw from Bank", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
         # Info text
         info_lines = [
@@ -497,18 +556,18 @@ class WithdrawScreen(Screen):
         ]
 
         for i, line in enumerate(info_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
-            surface.blit(text_surface, text_rect)
+            draw.blit(surface, text_surface, text_rect)
 
         # Draw amount input
         self.amount_input.draw(surface)
 
         # Draw status message
         if self.status_message:
-            status_surface = self.text_font.render(self.status_message, True, self.status_color)
+            status_surface = render_text(self.text_font, self.status_message, True, self.status_color)
             status_rect = status_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
-            surface.blit(status_surface, status_rect)
+            draw.blit(surface, status_surface, status_rect)
 
         # Draw buttons
         for button in self.buttons:
@@ -522,8 +581,8 @@ class GetDebitCardScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Buttons
         get_card_button = Button(
@@ -547,13 +606,11 @@ class GetDebitCardScreen(Screen):
     def get_debit_card(self):
         """Get a debit card and go back to the game screen."""
         self.game.player.debit_card = Card("Debit")
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def go_back(self):
         """Go back to the game screen."""
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def draw(self, surface):
         """Draw the debit card screen."""
@@ -561,27 +618,27 @@ class GetDebitCardScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Get a Debit Card", True, BLACK)
+        title_surface = render_text(self.title_font, "Get a Debit Card", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
         # Card image (simple rectangle)
         card_rect = pygame.Rect(SCREEN_WIDTH // 2 - 125, 150, 250, 150)
-        pygame.draw.rect(surface, BLUE, card_rect)
-        pygame.draw.rect(surface, BLACK, card_rect, 2)  # Border
+        draw.rect(surface, BLUE, card_rect)
+        draw.rect(surface, BLACK, card_rect, 2)  # Border
 
         # Card text
-        card_title = self.text_font.render("DEBIT", True, WHITE)
+        card_title = render_text(self.text_font, "DEBIT", True, WHITE)
         card_title_rect = card_title.get_rect(center=(SCREEN_WIDTH // 2, 180))
-        surface.blit(card_title, card_title_rect)
+        draw.blit(surface, card_title, card_title_rect)
 
-        card_name = self.text_font.render(self.game.player.name, True, WHITE)
+        card_name = render_text(self.text_font, self.game.player.name, True, WHITE)
         card_name_rect = card_name.get_rect(center=(SCREEN_WIDTH // 2, 220))
-        surface.blit(card_name, card_name_rect)
+        draw.blit(surface, card_name, card_name_rect)
 
-        card_number = self.text_font.render("**** **** **** 1234", True, WHITE)
+        card_number = render_text(self.text_font, "**** **** **** 1234", True, WHITE)
         card_number_rect = card_number.get_rect(center=(SCREEN_WIDTH // 2, 260))
-        surface.blit(card_number, card_number_rect)
+        draw.blit(surface, card_number, card_number_rect)
 
         # Explanation text
         text_lines = [
@@ -592,9 +649,9 @@ class GetDebitCardScreen(Screen):
         ]
 
         for i, line in enumerate(text_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 350 + i * 30))
-            surface.blit(text_surface, text_rect)
+            draw.blit(surface, text_surface, text_rect)
 
         # Draw buttons
         for button in self.buttons:
@@ -609,9 +666,9 @@ class CreditCardScreen(Screen):
     """
     def __init__(self, game):
         super().__init__(game)
-        self.font = pygame.font.SysFont('Arial', FONT_MEDIUM)
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE, bold=True)
-        self.small_font = pygame.font.SysFont('Arial', FONT_SMALL)
+        self.font = get_font(FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE, bold=True)
+        self.small_font = get_font(FONT_SMALL)
         self.message = ""
         self.message_color = BLACK
         self.approved = False
@@ -632,8 +689,7 @@ class CreditCardScreen(Screen):
         self.check_eligibility()
 
     def go_back(self):
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def check_eligibility(self):
         # Check if player is eligible for a credit card
@@ -703,27 +759,27 @@ class CreditCardScreen(Screen):
 
     def view_card_details(self):
         from moneySmartz.screens.financial_screens import CreditCardDetailsScreen
-        self.game.gui_manager.set_screen(CreditCardDetailsScreen(self.game))
+        self.game.gui_manager.push_cached_screen(CreditCardDetailsScreen, self.game.player.credit_card)
 
     def draw(self, surface):
         surface.fill(WHITE)
 
         # Draw header
         header_rect = pygame.Rect(0, 0, SCREEN_WIDTH, 80)
-        pygame.draw.rect(surface, PURPLE, header_rect)
+        draw.rect(surface, PURPLE, header_rect)
 
-        header_text = self.title_font.render("CREDIT CARD APPLICATION", True, WHITE)
+        header_text = render_text(self.title_font, "CREDIT CARD APPLICATION", True, WHITE)
         header_rect = header_text.get_rect(center=(SCREEN_WIDTH // 2, 40))
-        surface.blit(header_text, header_rect)
+        draw.blit(surface, header_text, header_rect)
 
         # Draw player info
         info_y = 100
-        credit_score_text = self.font.render(f"Your Credit Score: {self.game.player.credit_score}", True, BLACK)
-        surface.blit(credit_score_text, (50, info_y))
+        credit_score_text = render_text(self.font, f"Your Credit Score: {self.game.player.credit_score}", True, BLACK)
+        draw.blit(surface, credit_score_text, (50, info_y))
 
         if self.game.player.job:
-            income_text = self.font.render(f"Annual Income: ${self.game.player.salary}", True, BLACK)
-            surface.blit(income_text, (50, info_y + 30))
+            income_text = render_text(self.font, f"Annual Income: ${self.game.player.salary}", True, BLACK)
+            draw.blit(surface, income_text, (50, info_y + 30))
 
         # Draw message
         message_lines = []
@@ -740,32 +796,32 @@ class CreditCardScreen(Screen):
             message_lines.append(' '.join(current_line))
 
         for i, line in enumerate(message_lines):
-            message_text = self.font.render(line, True, self.message_color)
+            message_text = render_text(self.font, line, True, self.message_color)
             message_rect = message_text.get_rect(center=(SCREEN_WIDTH // 2, 180 + i * 30))
-            surface.blit(message_text, message_rect)
+            draw.blit(surface, message_text, message_rect)
 
         # If approved, draw the credit card
         if self.approved:
             card_rect = pygame.Rect(SCREEN_WIDTH // 2 - 125, 250, 250, 150)
-            pygame.draw.rect(surface, PURPLE, card_rect)
-            pygame.draw.rect(surface, BLACK, card_rect, 2)  # Border
+            draw.rect(surface, PURPLE, card_rect)
+            draw.rect(surface, BLACK, card_rect, 2)  # Border
 
             # Card text
-            card_title = self.font.render("CREDIT CARD", True, WHITE)
+            card_title = render_text(self.font, "CREDIT CARD", True, WHITE)
             card_title_rect = card_title.get_rect(center=(SCREEN_WIDTH // 2, 280))
-            surface.blit(card_title, card_title_rect)
+            draw.blit(surface, card_title, card_title_rect)
 
-            card_name = self.font.render(self.game.player.name, True, WHITE)
+            card_name = render_text(self.font, self.game.player.name, True, WHITE)
             card_name_rect = card_name.get_rect(center=(SCREEN_WIDTH // 2, 320))
-            surface.blit(card_name, card_name_rect)
+            draw.blit(surface, card_name, card_name_rect)
 
-            card_number = self.font.render("**** **** **** 1234", True, WHITE)
+            card_number = render_text(self.font, "**** **** **** 1234", True, WHITE)
             card_number_rect = card_number.get_rect(center=(SCREEN_WIDTH // 2, 350))
-            surface.blit(card_number, card_number_rect)
+            draw.blit(surface, card_number, card_number_rect)
 
-            limit_text = self.small_font.render(f"Credit Limit: ${self.credit_limit:.2f}", True, WHITE)
+            limit_text = render_text(self.small_font, f"Credit Limit: ${self.credit_limit:.2f}", True, WHITE)
             limit_rect = limit_text.get_rect(center=(SCREEN_WIDTH // 2, 380))
-            surface.blit(limit_text, limit_rect)
+            draw.blit(surface, limit_text, limit_rect)
 
         # Draw buttons
         for button in self.buttons:
@@ -777,15 +833,87 @@ class CreditCardDetailsScreen(Screen):
     """
     def __init__(self, game):
         super().__init__(game)
-        self.buttons = [Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 50, "Back", action=self.go_back)]
+
+        # Title
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
+
+        # Transaction history
+        self.history_list = ScrollList(
+            100, 280,
+            SCREEN_WIDTH - 200, 300,
+            self.game.player.credit_card.transaction_history,
+            self.format_transaction,
+            numbered=True
+        )
+        self.controls = HistoryControls(lambda: self.history_list, [
+            ("All", None),
+            ("Charges", lambda transaction: transaction["type"] == "charge"),
+            ("Payments", lambda transaction: transaction["type"] == "payment"),
+        ])
+        self.widgets = [self.history_list] + self.controls.widgets
+
+        self.buttons = [Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 50, "Back", action=self.go_back)] + self.controls.buttons
+
+    def on_resume(self):
+        """Start a new visit with every transaction shown, at the top."""
+        self.controls.reset()
+
+    def handle_events(self, events):
+        """Handle pygame events."""
+        super().handle_events(events)
+        self.history_list.update(events)
+        self.controls.update(events)
+
+    def format_transaction(self, transaction):
+        """Get the text and color of a transaction row."""
+        if transaction["type"] == "charge":
+            return f"Charge: +${transaction['amount']:.2f}", RED
+        elif transaction["type"] == "payment":
+            return f"Payment: -${transaction['amount']:.2f}", GREEN
+        return f"{transaction['type']}: ${transaction['amount']:.2f}", BLACK
 
     def go_back(self):
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def draw(self, surface):
+        """Draw the credit card details screen."""
         surface.fill(WHITE)
-        # This would be implemented with credit card details display
+
+        # Title
+        title_surface = render_text(self.title_font, "Credit Card Details", True, BLACK)
+        title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
+        draw.blit(surface, title_surface, title_rect)
+
+        # Card info
+        card = self.game.player.credit_card
+        info_lines = [
+            f"Balance: ${card.balance:.2f}",
+            f"Credit Limit: ${card.limit:.2f}",
+            f"Available Credit: ${card.limit - card.balance:.2f}"
+        ]
+
+        for i, line in enumerate(info_lines):
+            text_surface = render_text(self.text_font, line, True, BLACK)
+            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 100 + i * 30))
+            draw.blit(surface, text_surface, text_rect)
+
+        # Transaction history
+        history_title = render_text(self.title_font, "Transaction History", True, BLACK)
+        history_rect = history_title.get_rect(center=(SCREEN_WIDTH // 2, 250))
+        draw.blit(surface, history_title, history_rect)
+
+        if card.transaction_history:
+            self.history_list.draw(surface)
+        else:
+            no_transactions = render_text(self.text_font, "No transactions yet.", True, BLACK)
+            no_transactions_rect = no_transactions.get_rect(center=(SCREEN_WIDTH // 2, 320))
+            draw.blit(surface, no_transactions, no_transactions_rect)
+
+        # Draw buttons and history controls
+        self.controls.jump_input.draw(surface)
+        for button in self.buttons:
+            button.draw(surface)
 
 class PayCreditCardScreen(Screen):
     """
@@ -796,8 +924,7 @@ class PayCreditCardScreen(Screen):
         self.buttons = [Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 50, "Back", action=self.go_back)]
 
     def go_back(self):
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def draw(self, surface):
         surface.fill(WHITE)
@@ -805,19 +932,119 @@ class PayCreditCardScreen(Screen):
 
 class LoanDetailsScreen(Screen):
     """
-    Screen for viewing loan details.
+    Screen for viewing loan details and the payment history of one loan at a time.
     """
     def __init__(self, game):
         super().__init__(game)
-        self.buttons = [Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 50, "Back", action=self.go_back)]
+
+        # Title
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
+
+        # Payment history filters (the loan is looked up when filtering, so they follow select_loan)
+        self.controls = HistoryControls(lambda: self.history_list, [
+            ("All", None),
+            ("Regular", lambda payment: not self.is_extra_payment(payment)),
+            ("Extra", self.is_extra_payment),
+        ])
+
+        # Selected loan
+        self.loan_index = 0
+        self.select_loan(0)
+
+        self.buttons = [Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 50, "Back", action=self.go_back)] + self.controls.buttons
+
+        if len(self.game.player.loans) > 1:
+            next_button = Button(
+                SCREEN_WIDTH - 220,
+                SCREEN_HEIGHT - 80,
+                200, 50,
+                "Next Loan",
+                action=self.next_loan
+            )
+            self.buttons.append(next_button)
+
+    def select_loan(self, index):
+        """Show the payment history of a loan."""
+        self.loan_index = index
+        self.history_list = ScrollList(
+            100, 280,
+            SCREEN_WIDTH - 200, 300,
+            self.game.player.loans[index].payment_history,
+            self.format_payment,
+            numbered=True
+        )
+        self.controls.apply()  # Keep the current filter
+        self.widgets = [self.history_list] + self.controls.widgets
+
+    def next_loan(self):
+        """Show the next loan."""
+        self.select_loan((self.loan_index + 1) % len(self.game.player.loans))
+
+    def on_resume(self):
+        """Start a new visit on the first loan with every payment shown, at the top."""
+        if self.loan_index != 0:
+            self.select_loan(0)
+        self.controls.reset()
+
+    def is_extra_payment(self, payment):
+        """Whether a payment was an extra payment rather than the selected loan's monthly payment."""
+        return abs(payment["amount"] - self.game.player.loans[self.loan_index].monthly_payment) >= 0.01
+
+    def handle_events(self, events):
+        """Handle pygame events."""
+        super().handle_events(events)
+        self.history_list.update(events)
+        self.controls.update(events)
+
+    def format_payment(self, payment):
+        """Get the text and color of a payment row."""
+        text = f"Payment: ${payment['amount']:.2f} (Interest: ${payment['interest']:.2f}, Principal: ${payment['principal']:.2f})"
+        return text, BLACK
 
     def go_back(self):
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def draw(self, surface):
+        """Draw the loan details screen."""
         surface.fill(WHITE)
-        # This would be implemented with loan details display
+
+        # Title
+        loan = self.game.player.loans[self.loan_index]
+        title_text = f"{loan.loan_type} Loan ({self.loan_index + 1} of {len(self.game.player.loans)})"
+        title_surface = render_text(self.title_font, title_text, True, BLACK)
+        title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
+        draw.blit(surface, title_surface, title_rect)
+
+        # Loan info
+        info_lines = [
+            f"Original Amount: ${loan.original_amount:.2f}",
+            f"Current Balance: ${loan.current_balance:.2f}",
+            f"Interest Rate: {loan.interest_rate * 100:.2f}% for {loan.term_years} years",
+            f"Monthly Payment: ${loan.monthly_payment:.2f}"
+        ]
+
+        for i, line in enumerate(info_lines):
+            text_surface = render_text(self.text_font, line, True, BLACK)
+            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 100 + i * 30))
+            draw.blit(surface, text_surface, text_rect)
+
+        # Payment history
+        history_title = render_text(self.title_font, "Payment History", True, BLACK)
+        history_rect = history_title.get_rect(center=(SCREEN_WIDTH // 2, 250))
+        draw.blit(surface, history_title, history_rect)
+
+        if loan.payment_history:
+            self.history_list.draw(surface)
+        else:
+            no_payments = render_text(self.text_font, "No payments yet.", True, BLACK)
+            no_payments_rect = no_payments.get_rect(center=(SCREEN_WIDTH // 2, 320))
+            draw.blit(surface, no_payments, no_payments_rect)
+
+        # Draw buttons and history controls
+        self.controls.jump_input.draw(surface)
+        for button in self.buttons:
+            button.draw(surface)
 
 class ExtraLoanPaymentScreen(Screen):
     """
@@ -828,8 +1055,7 @@ class ExtraLoanPaymentScreen(Screen):
         self.buttons = [Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 50, "Back", action=self.go_back)]
 
     def go_back(self):
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def draw(self, surface):
         surface.fill(WHITE)
@@ -844,8 +1070,7 @@ class AssetDetailsScreen(Screen):
         self.buttons = [Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 50, "Back", action=self.go_back)]
 
     def go_back(self):
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def draw(self, surface):
         surface.fill(WHITE)
@@ -859,8 +1084,8 @@ class JobSearchScreen(Screen):
         super().__init__(game)
 
         # Title and fonts
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Generate job options based on education and experience
         self.job_options = self.generate_job_options()
@@ -888,71 +1113,12 @@ class JobSearchScreen(Screen):
 
     def generate_job_options(self):
         """Generate job options based on player's education and experience."""
-        job_options = []
-
-        # Current job info
-        current_salary = self.game.player.salary if self.game.player.job else 0
-
-        # Base salary multiplier based on years of experience
-        experience_years = max(0, self.game.player.age - 18)  # Assume working age starts at 18
-        experience_multiplier = 1.0 + (experience_years * 0.03)  # 3% increase per year of experience
-
-        # Generate job options based on education
-        if self.game.player.education == "High School" or self.game.player.education == "High School Graduate":
-            job_options = [
-                {"title": "Retail Associate", "salary": int(25000 * experience_multiplier)},
-                {"title": "Food Service Worker", "salary": int(22000 * experience_multiplier)},
-                {"title": "Warehouse Worker", "salary": int(28000 * experience_multiplier)},
-                {"title": "Office Clerk", "salary": int(30000 * experience_multiplier)},
-            ]
-        elif self.game.player.education == "Trade School":
-            job_options = [
-                {"title": "Electrician", "salary": int(45000 * experience_multiplier)},
-                {"title": "Plumber", "salary": int(48000 * experience_multiplier)},
-                {"title": "HVAC Technician", "salary": int(50000 * experience_multiplier)},
-                {"title": "Automotive Mechanic", "salary": int(42000 * experience_multiplier)},
-            ]
-        elif self.game.player.education == "College Graduate":
-            job_options = [
-                {"title": "Accountant", "salary": int(60000 * experience_multiplier)},
-                {"title": "Marketing Manager", "salary": int(65000 * experience_multiplier)},
-                {"title": "Software Developer", "salary": int(75000 * experience_multiplier)},
-                {"title": "Financial Analyst", "salary": int(70000 * experience_multiplier)},
-            ]
-        else:  # Default/basic jobs
-            job_options = [
-                {"title": "Retail Associate", "salary": int(25000 * experience_multiplier)},
-                {"title": "Food Service Worker", "salary": int(22000 * experience_multiplier)},
-                {"title": "Warehouse Worker", "salary": int(28000 * experience_multiplier)},
-            ]
-
-        # Add some randomness to salaries (±10%)
-        for job in job_options:
-            job["salary"] = int(job["salary"] * random.uniform(0.9, 1.1))
-
-        # Filter out jobs that don't offer at least 5% more than current salary (if employed)
-        if self.game.player.job:
-            job_options = [job for job in job_options if job["salary"] >= current_salary * 1.05]
-
-        return job_options
+        return self.game.generate_job_options()
 
     def apply_for_job(self, job):
         """Apply for the selected job."""
         # Job application success chance based on qualifications
-        base_success_chance = 0.7  # 70% base chance
-
-        # Adjust for education
-        if self.game.player.education == "College Graduate":
-            base_success_chance += 0.2
-        elif self.game.player.education == "Trade School":
-            base_success_chance += 0.1
-
-        # Adjust for experience
-        experience_years = max(0, self.game.player.age - 18)
-        base_success_chance += min(0.2, experience_years * 0.01)  # Up to 20% bonus for experience
-
-        # Cap at 95% chance
-        success_chance = min(0.95, base_success_chance)
+        success_chance = self.game.get_job_success_chance()
 
         # Determine if application is successful
         if random.random() < success_chance:
@@ -979,8 +1145,7 @@ class JobSearchScreen(Screen):
 
     def go_back(self):
         """Go back to the game screen."""
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def draw(self, surface):
         """Draw the job search screen."""
@@ -988,41 +1153,41 @@ class JobSearchScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Job Search", True, BLACK)
+        title_surface = render_text(self.title_font, "Job Search", True, BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
         # Current job info
         current_job_text = f"Current Job: {self.game.player.job if self.game.player.job else 'Unemployed'}"
-        current_job_surface = self.text_font.render(current_job_text, True, BLACK)
+        current_job_surface = render_text(self.text_font, current_job_text, True, BLACK)
         current_job_rect = current_job_surface.get_rect(center=(SCREEN_WIDTH // 2, 100))
-        surface.blit(current_job_surface, current_job_rect)
+        draw.blit(surface, current_job_surface, current_job_rect)
 
         if self.game.player.job:
             salary_text = f"Current Salary: ${self.game.player.salary}/year"
-            salary_surface = self.text_font.render(salary_text, True, BLACK)
+            salary_surface = render_text(self.text_font, salary_text, True, BLACK)
             salary_rect = salary_surface.get_rect(center=(SCREEN_WIDTH // 2, 130))
-            surface.blit(salary_surface, salary_rect)
+            draw.blit(surface, salary_surface, salary_rect)
 
         # Available jobs or no jobs message
         if self.job_options:
-            jobs_title = self.text_font.render("Available Job Opportunities:", True, BLACK)
+            jobs_title = render_text(self.text_font, "Available Job Opportunities:", True, BLACK)
             jobs_title_rect = jobs_title.get_rect(center=(SCREEN_WIDTH // 2, 180))
-            surface.blit(jobs_title, jobs_title_rect)
+            draw.blit(surface, jobs_title, jobs_title_rect)
 
-            jobs_subtitle = self.text_font.render("Click on a job to apply", True, BLACK)
+            jobs_subtitle = render_text(self.text_font, "Click on a job to apply", True, BLACK)
             jobs_subtitle_rect = jobs_subtitle.get_rect(center=(SCREEN_WIDTH // 2, 210))
-            surface.blit(jobs_subtitle, jobs_subtitle_rect)
+            draw.blit(surface, jobs_subtitle, jobs_subtitle_rect)
         else:
             no_jobs_text = "No better job opportunities available at this time."
-            no_jobs_surface = self.text_font.render(no_jobs_text, True, BLACK)
+            no_jobs_surface = render_text(self.text_font, no_jobs_text, True, BLACK)
             no_jobs_rect = no_jobs_surface.get_rect(center=(SCREEN_WIDTH // 2, 200))
-            surface.blit(no_jobs_surface, no_jobs_rect)
+            draw.blit(surface, no_jobs_surface, no_jobs_rect)
 
             advice_text = "Keep building your skills and try again later!"
-            advice_surface = self.text_font.render(advice_text, True, BLACK)
+            advice_surface = render_text(self.text_font, advice_text, True, BLACK)
             advice_rect = advice_surface.get_rect(center=(SCREEN_WIDTH // 2, 230))
-            surface.blit(advice_surface, advice_rect)
+            draw.blit(surface, advice_surface, advice_rect)
 
         # Status message
         if self.status_message:
@@ -1041,9 +1206,9 @@ class JobSearchScreen(Screen):
                 lines.append(' '.join(current_line))
 
             for i, line in enumerate(lines):
-                status_surface = self.text_font.render(line, True, self.status_color)
+                status_surface = render_text(self.text_font, line, True, self.status_color)
                 status_rect = status_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 150 + i * 30))
-                surface.blit(status_surface, status_rect)
+                draw.blit(surface, status_surface, status_rect)
 
         # Draw buttons
         for button in self.buttons:
@@ -1,8 +1,11 @@
 import pygame
 import random
+from itertools import islice
 from pygame.locals import *
 from moneySmartz.constants import *
-from moneySmartz.ui import Screen, Button
+from moneySmartz.ui import Screen, Button, TimeSeriesChart, get_font, render_text
+from moneySmartz import draw
+from moneySmartz.worker import SimulationWorker, RUNNING, PAUSED
 
 class GameScreen(Screen):
     """
@@ -10,12 +13,91 @@ class GameScreen(Screen):
     """
     def __init__(self, game):
         super().__init__(game)
+        self.save_message = ""
+
+        # 10% chance of a better job opportunity, rolled once per month
+        self.better_job_offer = self.roll_better_job_offer()
+
+        # Background simulation while fast forwarding
+        self.worker = None
+
+        # Random event screen, reused for every event
+        self.event_screen = None
+
+        # Net worth over the game, one point per month
+        self.net_worth_chart = TimeSeriesChart(690, 455, 314, 125, [("Net Worth", BLUE)])
+        self.widgets = [self.net_worth_chart]
+        self.update_chart()
+
         self.create_buttons()
 
+    def roll_better_job_offer(self):
+        """Roll for this month's better job opportunity."""
+        return bool(self.game.player.job) and random.random() < 0.1
+
+    def button_state(self):
+        """Get the player state that decides which buttons are shown."""
+        player = self.game.player
+        return (
+            bool(player.bank_account),
+            bool(player.debit_card),
+            bool(player.credit_card),
+            bool(player.credit_card and player.credit_card.balance > 0),
+            bool(player.loans),
+            bool(player.assets),
+            bool(player.job),
+            player.age >= 16,
+            player.age >= 18,
+            self.better_job_offer,
+        )
+
+    def on_resume(self):
+        """Refresh after returning from another screen."""
+        self.save_message = ""
+        if self.worker and self.continue_fast_forward():
+            return
+        self.update_chart()
+        self.refresh()
+
+    def update_chart(self):
+        """Add the months played since the chart was last updated."""
+        history = self.game.monthly_history
+        chart = self.net_worth_chart
+        if len(history) < len(chart):
+            chart.clear()
+        for cash, bank_balance, debt, asset_value in islice(history, len(chart), None):
+            chart.append((cash + bank_balance - debt + asset_value,))
+
+    def refresh(self):
+        """Rebuild the buttons only if the state they depend on changed."""
+        if self.button_state() != self.buttons_state:
+            self.create_buttons()
+
     def create_buttons(self):
         """Create the buttons for the game screen."""
         # Clear existing buttons
         self.buttons = []
+        self.buttons_state = self.button_state()
+
+        # Fast forward button (always present)
+        fast_forward_button = Button(
+            SCREEN_WIDTH - 220,
+            SCREEN_HEIGHT - 180,
+            200, 50,
+            "Fast Forward 1 Year",
+            action=self.fast_forward
+        )
+        self.buttons.append(fast_forward_button)
+
+        # Autopilot button (always present)
+        autopilot_button = Button(
+            460,
+            SCREEN_HEIGHT - 90,
+            200, 50,
+            "Autopilot to Retirement",
+            action=self.autopilot
+        )
+        self.buttons.append(autopilot_button)
 
         # Continue button (always present)
         continue_button = Button(
@@ -27,6 +109,16 @@ class GameScreen(Screen):
         )
         self.buttons.append(continue_button)
 
+        # Save button (always present)
+        save_button = Button(
+            SCREEN_WIDTH - 220,
+            SCREEN_HEIGHT - 120,
+            200, 50,
+            "Save Game",
+            action=self.save_game
+        )
+        self.buttons.append(save_button)
+
         # Banking buttons
         if not self.game.player.bank_account:
             bank_button = Button(
@@ -146,7 +238,7 @@ class GameScreen(Screen):
                 action=self.look_for_job
             )
             self.buttons.append(job_button)
-        elif self.game.player.job and random.random() < 0.1:  # 10% chance of job opportunity each month
+        elif self.game.player.job and self.better_job_offer:
             better_job_button = Button(
                 460, 
                 SCREEN_HEIGHT - 210,
@@ -158,30 +250,28 @@ class GameScreen(Screen):
 
     def continue_to_next_month(self):
         """Continue to the next month."""
-        # Increment month
-        self.game.current_month += 1
-        if self.game.current_month > 12:
-            self.game.current_month = 1
-            self.game.current_year += 1
-            self.game.player.age += 1
-
-            # Apply interest to savings
-            if self.game.player.bank_account and self.game.player.bank_account.account_type == "Savings":
-                self.game.player.bank_account.apply_interest()
-
-            # Age assets
-            for asset in self.game.player.assets:
-                asset.age_asset()
+        # Advance the calendar and process monthly finances
+        self.game.advance_month()
+        self.update_chart()
 
-        # Process monthly finances
-        self.game.process_monthly_finances()
-
-        # Random events
+        # Random events (applied now, shown once this month's screen is decided)
+        event_screen = None
         if random.random() < 0.3:  # 30% chance of an event each month
-            self.game.trigger_random_event()
+            event, cash_effect = self.game.roll_random_event()
+            if cash_effect != 0:
+                from moneySmartz.screens.random_event_screens import RandomEventScreen
+                if self.event_screen is None:
+                    self.event_screen = RandomEventScreen(self.game, event, cash_effect)
+                else:
+                    self.event_screen.show_event(event, cash_effect)
+                event_screen = self.event_screen
 
-        # Life stage events based on age
+        # Life stage events based on age (their screens decide later)
         life_event_triggered = self.game.check_life_stage_events_gui()
+        self.game.end_month()
+
+        # New month, new chance of a better job
+        self.better_job_offer = self.roll_better_job_offer()
 
         # If no life event was triggered, refresh the game screen
         if not life_event_triggered:
@@ -190,67 +280,112 @@ class GameScreen(Screen):
                 self.game.end_game_gui("retirement")
             else:
                 # Refresh buttons (in case player status changed)
-                self.create_buttons()
+                self.save_message = ""
+                self.refresh()
+
+        # Show the event on top of whatever screen comes next
+        if event_screen:
+            self.game.gui_manager.push_screen(event_screen)
+
+    def fast_forward(self):
+        """Simulate the next year on a worker thread, showing its progress."""
+        self.worker = SimulationWorker(self.game, FAST_FORWARD_MONTHS)
+        self.worker.start()
+        self.game.gui_manager.push_screen(FastForwardScreen(self.game, self.worker))
+
+    def autopilot(self):
+        """Hand the rest of the life to a policy, showing its progress until retirement."""
+        from moneySmartz.policies import get_policy
+        months = max(0, (65 - self.game.player.age) * 12)  # Up to retirement age
+        self.worker = SimulationWorker(self.game, months, AUTOPILOT_MONTH_DELAY, policy=get_policy(AUTOPILOT_POLICY))
+        self.worker.start()
+        self.game.gui_manager.push_screen(FastForwardScreen(self.game, self.worker, title="AUTOPILOT"))
+
+    def continue_fast_forward(self):
+        """
+        Resume a fast forward paused for a life stage event, or wrap up a
+        finished one. Returns True if another screen was shown.
+        """
+        worker = self.worker
+        if not worker.finished():
+            worker.resume()
+            self.game.gui_manager.push_screen(FastForwardScreen(self.game, worker))
+            return True
+
+        self.worker = None
+        self.better_job_offer = self.roll_better_job_offer()
+        if self.game.player.age >= 65:  # Retirement age
+            self.game.end_game_gui("retirement")
+            return True
+        return False
+
+    def save_game(self):
+        """Save the game to its slot (or a new slot), with the current frame as thumbnail."""
+        from moneySmartz.saves import SaveManager
+        save_manager = SaveManager()
+        slot = self.game.save_slot or save_manager.next_free_slot()
+        save_manager.save(self.game, slot, thumbnail=self.game.gui_manager.screen)
+        self.save_message = f"Game saved to slot {slot}."
 
     def open_bank_account(self):
         """Open a bank account screen."""
         from moneySmartz.screens.financial_screens import BankAccountScreen
-        self.game.gui_manager.set_screen(BankAccountScreen(self.game))
+        self.game.gui_manager.push_screen(BankAccountScreen(self.game))
 
     def view_bank_account(self):
         """View bank account details."""
         from moneySmartz.screens.financial_screens import BankDetailsScreen
-        self.game.gui_manager.set_screen(BankDetailsScreen(self.game))
+        self.game.gui_manager.push_cached_screen(BankDetailsScreen, self.game.player.bank_account)
 
     def deposit_to_bank(self):
         """Deposit money to bank account."""
         from moneySmartz.screens.financial_screens import DepositScreen
-        self.game.gui_manager.set_screen(DepositScreen(self.game))
+        self.game.gui_manager.push_screen(DepositScreen(self.game))
 
     def withdraw_from_bank(self):
         """Withdraw money from bank account."""
         from moneySmartz.screens.financial_screens import WithdrawScreen
-        self.game.gui_manager.set_screen(WithdrawScreen(self.game))
+        self.game.gui_manager.push_screen(WithdrawScreen(self.game))
 
     def get_debit_card(self):
         """Get a debit card."""
         from moneySmartz.screens.financial_screens import GetDebitCardScreen
-        self.game.gui_manager.set_screen(GetDebitCardScreen(self.game))
+        self.game.gui_manager.push_screen(GetDebitCardScreen(self.game))
 
     def apply_for_credit_card(self):
         """Apply for a credit card."""
         from moneySmartz.screens.financial_screens import CreditCardScreen
-        self.game.gui_manager.set_screen(CreditCardScreen(self.game))
+        self.game.gui_manager.push_screen(CreditCardScreen(self.game))
 
     def view_credit_card(self):
         """View credit card details."""
         from moneySmartz.screens.financial_screens import CreditCardDetailsScreen
-        self.game.gui_manager.set_screen(CreditCardDetailsScreen(self.game))
+        self.game.gui_manager.push_cached_screen(CreditCardDetailsScreen, self.game.player.credit_card)
 
     def pay_credit_card(self):
         """Make a payment on the credit card."""
         from moneySmartz.screens.financial_screens import PayCreditCardScreen
-        self.game.gui_manager.set_screen(PayCreditCardScreen(self.game))
+        self.game.gui_manager.push_screen(PayCreditCardScreen(self.game))
 
     def view_loans(self):
         """View loan details."""
         from moneySmartz.screens.financial_screens import LoanDetailsScreen
-        self.game.gui_manager.set_screen(LoanDetailsScreen(self.game))
+        self.game.gui_manager.push_cached_screen(LoanDetailsScreen, tuple(self.game.player.loans))
 
     def make_extra_loan_payment(self):
         """Make an extra payment on a loan."""
         from moneySmartz.screens.financial_screens import ExtraLoanPaymentScreen
-        self.game.gui_manager.set_screen(ExtraLoanPaymentScreen(self.game))
+        self.game.gui_manager.push_screen(ExtraLoanPaymentScreen(self.game))
 
     def view_assets(self):
         """View asset details."""
         from moneySmartz.screens.financial_screens import AssetDetailsScreen
-        self.game.gui_manager.set_screen(AssetDetailsScreen(self.game))
+        self.game.gui_manager.push_cached_screen(AssetDetailsScreen, tuple(self.game.player.assets))
 
     def look_for_job(self):
         """Look for a job or a better job."""
         from moneySmartz.screens.financial_screens import JobSearchScreen
-        self.game.gui_manager.set_screen(JobSearchScreen(self.game))
+        self.game.gui_manager.push_screen(JobSearchScreen(self.game))
 
     def draw(self, surface):
         """Draw the game screen."""
@@ -258,20 +393,20 @@ class GameScreen(Screen):
         surface.fill(WHITE)
 
         # Header
-        pygame.draw.rect(surface, BLUE, (0, 0, SCREEN_WIDTH, 80))
+        draw.rect(surface, BLUE, (0, 0, SCREEN_WIDTH, 80))
 
         # Title
-        title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        title_surface = title_font.render(f"MONTH: {self.game.current_month}/YEAR: {self.game.current_year + 2023}", True, WHITE)
+        title_font = get_font(FONT_LARGE)
+        title_surface = render_text(title_font, f"MONTH: {self.game.current_month}/YEAR: {self.game.current_year + 2023}", True, WHITE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 25))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
-        age_surface = title_font.render(f"AGE: {self.game.player.age}", True, WHITE)
+        age_surface = render_text(title_font, f"AGE: {self.game.player.age}", True, WHITE)
         age_rect = age_surface.get_rect(center=(SCREEN_WIDTH // 2, 55))
-        surface.blit(age_surface, age_rect)
+        draw.blit(surface, age_surface, age_rect)
 
         # Player info section
-        info_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        info_font = get_font(FONT_MEDIUM)
 
         # Name and education
         self.draw_text(surface, f"Name: {self.game.player.name}", 20, 100)
@@ -343,11 +478,19 @@ class GameScreen(Screen):
         else:
             net_worth_color = RED
 
-        net_worth_font = pygame.font.SysFont('Arial', FONT_LARGE)
+        net_worth_font = get_font(FONT_LARGE)
         net_worth_text = f"NET WORTH: ${net_worth:.2f}"
-        net_worth_surface = net_worth_font.render(net_worth_text, True, net_worth_color)
+        net_worth_surface = render_text(net_worth_font, net_worth_text, True, net_worth_color)
         net_worth_rect = net_worth_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 330))
-        surface.blit(net_worth_surface, net_worth_rect)
+        draw.blit(surface, net_worth_surface, net_worth_rect)
+        self.net_worth_chart.draw(surface)
+
+        # Save confirmation
+        if self.save_message:
+            save_font = get_font(FONT_SMALL)
+            save_surface = render_text(save_font, self.save_message, True, GREEN)
+            save_rect = save_surface.get_rect(center=(SCREEN_WIDTH - 120, SCREEN_HEIGHT - 135))
+            draw.blit(surface, save_surface, save_rect)
 
         # Draw buttons
         for button in self.buttons:
@@ -355,6 +498,94 @@ class GameScreen(Screen):
 
     def draw_text(self, surface, text, x, y, is_title=False):
         """Helper method to draw text."""
-        font = pygame.font.SysFont('Arial', FONT_LARGE if is_title else FONT_MEDIUM)
-        text_surface = font.render(text, True, BLACK)
-        surface.blit(text_surface, (x, y))
+        font = get_font(FONT_LARGE if is_title else FONT_MEDIUM)
+        text_surface = render_text(font, text, True, BLACK)
+        draw.blit(surface, text_surface, (x, y))
+
+class FastForwardScreen(Screen):
+    """
+    Shows the progress of a fast forward while a SimulationWorker simulates
+    the months in the background. While the worker runs, this screen only
+    reads the worker's latest snapshot, never the game itself.
+    """
+    def __init__(self, game, worker, title="FAST FORWARD"):
+        super().__init__(game)
+        self.worker = worker
+        self.title = title
+        self.snapshot = None
+        self.font = get_font(FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE, bold=True)
+
+        cancel_button = Button(
+            SCREEN_WIDTH // 2 - 100,
+            SCREEN_HEIGHT - 100,
+            200, 60,
+            "Cancel",
+            action=self.worker.cancel
+        )
+        self.buttons = [cancel_button]
+
+    def is_animating(self):
+        """Keep drawing new snapshots while the worker runs."""
+        return self.worker.state == RUNNING
+
+    def update(self):
+        """Pick up the latest snapshot and react when the worker pauses or stops."""
+        snapshot = self.worker.snapshot
+        if snapshot is not self.snapshot:
+            self.snapshot = snapshot
+            self.mark_dirty()
+
+        if self.worker.state == PAUSED:
+            # Hand control to the life stage screen; the game screen resumes the worker afterwards
+            self.game.check_life_stage_events_gui(self.worker.life_event)
+        elif self.worker.finished():
+            self.worker.join()
+            self.game.gui_manager.pop_screen()
+
+    def draw(self, surface):
+        """Draw the progress bar and the latest snapshot."""
+        surface.fill(WHITE)
+        snapshot = self.snapshot or self.worker.snapshot
+
+        # Header
+        draw.rect(surface, BLUE, (0, 0, SCREEN_WIDTH, 80))
+        title_surface = render_text(self.title_font, self.title, True, WHITE)
+        draw.blit(surface, title_surface, title_surface.get_rect(center=(SCREEN_WIDTH // 2, 40)))
+
+        # Progress bar
+        bar_rect = pygame.Rect(SCREEN_WIDTH // 2 - 300, 140, 600, 40)
+        done = snapshot.months_done / snapshot.months_total if snapshot.months_total else 1
+        draw.rect(surface, LIGHT_GRAY, bar_rect)
+        draw.rect(surface, GREEN, (bar_rect.left, bar_rect.top, int(bar_rect.width * done), bar_rect.height))
+        draw.rect(surface, BLACK, bar_rect, 2)  # Border
+
+        progress_surface = render_text(self.font, f"Month {snapshot.months_done} of {snapshot.months_total}", True, BLACK)
+        draw.blit(surface, progress_surface, progress_surface.get_rect(center=(SCREEN_WIDTH // 2, 210)))
+
+        # Current state
+        lines = [
+            f"Month {snapshot.month}/{snapshot.year + 2023} - Age {snapshot.age}",
+            f"Cash: ${snapshot.cash:.2f}   Bank: ${snapshot.bank_balance:.2f}",
+            f"Debt: ${snapshot.debt:.2f}   Assets: ${snapshot.asset_value:.2f}",
+        ]
+        for i, line in enumerate(lines):
+            line_surface = render_text(self.font, line, True, BLACK)
+            draw.blit(surface, line_surface, line_surface.get_rect(center=(SCREEN_WIDTH // 2, 270 + i * 30)))
+
+        net_worth_color = GREEN if snapshot.net_worth >= 0 else RED
+        net_worth_surface = render_text(get_font(FONT_LARGE), f"NET WORTH: ${snapshot.net_worth:.2f}", True, net_worth_color)
+        draw.blit(surface, net_worth_surface, net_worth_surface.get_rect(center=(SCREEN_WIDTH // 2, 380)))
+
+        # Recent random events
+        if snapshot.events:
+            events_title = render_text(self.font, "Recent events:", True, BLACK)
+            draw.blit(surface, events_title, events_title.get_rect(center=(SCREEN_WIDTH // 2, 440)))
+            for i, (name, cash_effect) in enumerate(reversed(snapshot.events)):
+                color = GREEN if cash_effect > 0 else RED
+                event_surface = render_text(self.font, f"{name}: {'+' if cash_effect > 0 else '-'}${abs(cash_effect)}", True, color)
+                draw.blit(surface, event_surface, event_surface.get_rect(center=(SCREEN_WIDTH // 2, 475 + i * 30)))
+
+        # Draw buttons
+        for button in self.buttons:
+            button.draw(surface)
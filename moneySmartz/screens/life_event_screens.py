@@ -2,19 +2,93 @@ import pygame
 import random
 from pygame.locals import *
 from moneySmartz.constants import *
-from moneySmartz.ui import Screen, Button, TextInput
+from moneySmartz.ui import Screen, Button, TextInput, get_font, render_text, Layer
+from moneySmartz import draw
 from moneySmartz.models import Loan, Asset, Card
 
-class HighSchoolGraduationScreen(Screen):
+def recommended_method(recommendation, name):
+    """Get the recommended way to pay for the car or house called name, or None."""
+    if recommendation is None:
+        return None
+    if recommendation.choice and recommendation.choice[0] == name:
+        return recommendation.choice[1]
+    values = {option[1]: value for option, (value, _) in recommendation.values.items() if option and option[0] == name}
+    return max(values, key=values.get) if values else None
+
+def mark_recommended(button):
+    """Highlight a button as the recommended choice."""
+    button.color = GREEN
+    button.hover_color = LIGHT_GREEN
+    return button
+
+def draw_recommended(surface, font, buttons):
+    """Label the recommended buttons."""
+    for button in buttons:
+        label_surface = render_text(font, "Recommended", True, GREEN)
+        label_rect = label_surface.get_rect(midleft=(button.rect.right + 10, button.rect.centery))
+        draw.blit(surface, label_surface, label_rect)
+
+class RecommendingScreen(Screen):
+    """
+    Base class for life stage screens that mark the solver's recommended
+    choice. The recommendation is solved on a background thread, so the
+    choices are shown at once, a thinking indicator runs meanwhile, and
+    show_recommendation marks the buttons when it arrives.
+    """
+    event = None  # The life stage event the screen decides
+
+    def start_recommendation(self):
+        """Start solving the screen's decision (if recommendations are on)."""
+        self.recommendation = None
+        self.recommended = []
+        self.advisor = None
+        if SHOW_RECOMMENDATIONS:
+            from moneySmartz.solver import solver, RecommendationWorker
+            self.advisor = RecommendationWorker(solver, self.game, self.event).start()
+
+    def stop_recommendation(self):
+        """Cancel a solve still running; call before leaving the screen, as the solve shares the random number generator."""
+        if self.advisor:
+            self.advisor.cancel()
+            self.advisor = None
+
+    def show_recommendation(self):
+        """Mark the recommended buttons (self.recommendation is set)."""
+        pass
+
+    def update(self):
+        """Mark the recommended choice once the solve has finished."""
+        if self.advisor and self.advisor.done():
+            self.recommendation = self.advisor.recommendation
+            self.advisor = None
+            if self.recommendation:
+                self.show_recommendation()
+            self.mark_dirty()
+
+    def is_animating(self):
+        """The thinking indicator animates while the solve runs."""
+        return self.advisor is not None
+
+    def draw_thinking(self, surface, font):
+        """Draw the thinking indicator while the solve runs."""
+        if self.advisor:
+            dots = "." * (pygame.time.get_ticks() // 300 % 4)
+            thinking_surface = render_text(font, f"Finding the best choice{dots}", True, DARK_GRAY)
+            draw.blit(surface, thinking_surface, (20, SCREEN_HEIGHT - 40))
+
+class HighSchoolGraduationScreen(RecommendingScreen):
     """
     Screen for high school graduation event.
     """
+    event = "high_school_graduation"
+
     def __init__(self, game):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
+        self.background = Layer(self.draw_background)
 
         # Buttons
         college_button = Button(
@@ -43,8 +117,18 @@ class HighSchoolGraduationScreen(Screen):
 
         self.buttons = [college_button, trade_button, work_button]
 
+        # Recommended choice
+        self.start_recommendation()
+
+    def show_recommendation(self):
+        """Mark the recommended education."""
+        college_button, trade_button, work_button = self.buttons
+        choices = {"College": college_button, "Trade School": trade_button, "Work": work_button}
+        self.recommended = [mark_recommended(choices[self.recommendation.choice])]
+
     def go_to_college(self):
         """Choose to go to college."""
+        self.stop_recommendation()
         # Check if player can afford college
         annual_cost = 20000
         if self.game.player.cash >= annual_cost:
@@ -60,11 +144,11 @@ class HighSchoolGraduationScreen(Screen):
         self.game.player.education = "College (In Progress)"
 
         # Return to game screen
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def go_to_trade_school(self):
         """Choose to go to trade school."""
+        self.stop_recommendation()
         # Check if player can afford trade school
         cost = 10000
         if self.game.player.cash >= cost:
@@ -79,11 +163,11 @@ class HighSchoolGraduationScreen(Screen):
         self.game.player.education = "Trade School"
 
         # Return to game screen
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def start_working(self):
         """Choose to start working full-time."""
+        self.stop_recommendation()
         self.game.player.education = "High School Graduate"
 
         # Go to job search screen
@@ -92,27 +176,35 @@ class HighSchoolGraduationScreen(Screen):
 
     def draw(self, surface):
         """Draw the high school graduation screen."""
-        # Background
-        surface.fill(WHITE)
+        # Static artwork and text
+        self.background.draw(surface)
 
+        # Draw buttons
+        for button in self.buttons:
+            button.draw(surface)
+        draw_recommended(surface, self.text_font, self.recommended)
+        self.draw_thinking(surface, self.text_font)
+
+    def draw_background(self, surface):
+        """Draw the static background layer."""
         # Title
-        title_surface = self.title_font.render("HIGH SCHOOL GRADUATION", True, BLUE)
+        title_surface = render_text(self.title_font, "HIGH SCHOOL GRADUATION", True, BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
         # Graduation cap image (simple triangle and rectangle)
         cap_center_x = SCREEN_WIDTH // 2
         cap_center_y = 180
 
         # Draw cap
-        pygame.draw.rect(surface, BLACK, (cap_center_x - 50, cap_center_y - 10, 100, 20))
+        draw.rect(surface, BLACK, (cap_center_x - 50, cap_center_y - 10, 100, 20))
 
         # Draw tassel
-        pygame.draw.line(surface, YELLOW, (cap_center_x + 40, cap_center_y), (cap_center_x + 60, cap_center_y + 30), 5)
-        pygame.draw.circle(surface, YELLOW, (cap_center_x + 60, cap_center_y + 40), 10)
+        draw.line(surface, YELLOW, (cap_center_x + 40, cap_center_y), (cap_center_x + 60, cap_center_y + 30), 5)
+        draw.circle(surface, YELLOW, (cap_center_x + 60, cap_center_y + 40), 10)
 
         # Draw top
-        pygame.draw.polygon(surface, BLACK, [
+        draw.polygon(surface, BLACK, [
             (cap_center_x - 50, cap_center_y - 10),
             (cap_center_x + 50, cap_center_y - 10),
             (cap_center_x, cap_center_y - 60)
@@ -135,13 +227,9 @@ class HighSchoolGraduationScreen(Screen):
         ]
 
         for i, line in enumerate(text_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 250 + i * 30))
-            surface.blit(text_surface, text_rect)
-
-        # Draw buttons
-        for button in self.buttons:
-            button.draw(surface)
+            draw.blit(surface, text_surface, text_rect)
 
 class CollegeGraduationScreen(Screen):
     """
@@ -151,8 +239,8 @@ class CollegeGraduationScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Buttons
         continue_button = Button(
@@ -183,23 +271,23 @@ class CollegeGraduationScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("COLLEGE GRADUATION", True, BLUE)
+        title_surface = render_text(self.title_font, "COLLEGE GRADUATION", True, BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
         # Graduation cap image (simple triangle and rectangle)
         cap_center_x = SCREEN_WIDTH // 2
         cap_center_y = 180
 
         # Draw cap
-        pygame.draw.rect(surface, BLACK, (cap_center_x - 50, cap_center_y - 10, 100, 20))
+        draw.rect(surface, BLACK, (cap_center_x - 50, cap_center_y - 10, 100, 20))
 
         # Draw tassel
-        pygame.draw.line(surface, YELLOW, (cap_center_x + 40, cap_center_y), (cap_center_x + 60, cap_center_y + 30), 5)
-        pygame.draw.circle(surface, YELLOW, (cap_center_x + 60, cap_center_y + 40), 10)
+        draw.line(surface, YELLOW, (cap_center_x + 40, cap_center_y), (cap_center_x + 60, cap_center_y + 30), 5)
+        draw.circle(surface, YELLOW, (cap_center_x + 60, cap_center_y + 40), 10)
 
         # Draw top
-        pygame.draw.polygon(surface, BLACK, [
+        draw.polygon(surface, BLACK, [
             (cap_center_x - 50, cap_center_y - 10),
             (cap_center_x + 50, cap_center_y - 10),
             (cap_center_x, cap_center_y - 60)
@@ -218,24 +306,26 @@ class CollegeGraduationScreen(Screen):
         ]
 
         for i, line in enumerate(text_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, True, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 250 + i * 30))
-            surface.blit(text_surface, text_rect)
+            draw.blit(surface, text_surface, text_rect)
 
         # Draw buttons
         for button in self.buttons:
             button.draw(surface)
 
-class CarPurchaseScreen(Screen):
+class CarPurchaseScreen(RecommendingScreen):
     """
     Screen for car purchase opportunity.
     """
+    event = "car_purchase"
+
     def __init__(self, game):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Car options
         self.car_options = [
@@ -254,12 +344,21 @@ class CarPurchaseScreen(Screen):
         # State (0 = car selection, 1 = payment selection, 2 = confirmation)
         self.state = 0
 
+        # Recommended car and payment method
+        self.start_recommendation()
+
         # Create car selection buttons
         self.create_car_buttons()
 
+    def show_recommendation(self):
+        """Mark the recommended car or payment method."""
+        self.create_car_buttons()
+
     def create_car_buttons(self):
         """Create buttons for car selection."""
         self.buttons = []
+        self.recommended = []
+        recommendation = self.recommendation
 
         if self.state == 0:
             # Car selection buttons
@@ -272,6 +371,8 @@ class CarPurchaseScreen(Screen):
                     action=lambda c=car: self.select_car(c)
                 )
                 self.buttons.append(car_button)
+                if recommendation and recommendation.choice and recommendation.choice[0] == car['name']:
+                    self.recommended.append(mark_recommended(car_button))
 
             # Skip button
             skip_button = Button(
@@ -282,6 +383,8 @@ class CarPurchaseScreen(Screen):
                 action=self.skip_purchase
             )
             self.buttons.append(skip_button)
+            if recommendation and recommendation.choice is None:
+                self.recommended.append(mark_recommended(skip_button))
 
         elif self.state == 1:
             # Payment method buttons
@@ -301,6 +404,8 @@ class CarPurchaseScreen(Screen):
                     action=lambda m=method: self.select_payment_method(m)
                 )
                 self.buttons.append(method_button)
+                if method == recommended_method(recommendation, self.selected_car['name']):
+                    self.recommended.append(mark_recommended(method_button))
 
             # Back button
             back_button = Button(
@@ -364,13 +469,13 @@ class CarPurchaseScreen(Screen):
 
     def skip_purchase(self):
         """Skip car purchase."""
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.stop_recommendation()
+        self.game.gui_manager.return_to_game()
 
     def confirm_purchase(self):
         """Confirm purchase and return to game."""
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.stop_recommendation()
+        self.game.gui_manager.return_to_game()
 
     def draw(self, surface):
         """Draw the car purchase screen."""
@@ -378,9 +483,9 @@ class CarPurchaseScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("CAR PURCHASE OPPORTUNITY", True, BLUE)
+        title_surface = render_text(self.title_font, "CAR PURCHASE OPPORTUNITY", True, BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
         if self.state == 0:
             # Car selection state
@@ -392,9 +497,9 @@ class CarPurchaseScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
-                surface.blit(text_surface, text_rect)
+                draw.blit(surface, text_surface, text_rect)
 
         elif self.state == 1:
             # Payment method selection state
@@ -405,9 +510,9 @@ class CarPurchaseScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
-                surface.blit(text_surface, text_rect)
+                draw.blit(surface, text_surface, text_rect)
 
         elif self.state == 2:
             # Confirmation state
@@ -429,33 +534,37 @@ class CarPurchaseScreen(Screen):
                 ])
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
-                surface.blit(text_surface, text_rect)
+                draw.blit(surface, text_surface, text_rect)
 
             # Draw car image (simple rectangle)
             car_rect = pygame.Rect(SCREEN_WIDTH // 2 - 100, 350, 200, 100)
-            pygame.draw.rect(surface, BLUE, car_rect)
-            pygame.draw.rect(surface, BLACK, car_rect, 2)  # Border
+            draw.rect(surface, BLUE, car_rect)
+            draw.rect(surface, BLACK, car_rect, 2)  # Border
 
             # Draw wheels
-            pygame.draw.circle(surface, BLACK, (SCREEN_WIDTH // 2 - 60, 450), 20)
-            pygame.draw.circle(surface, BLACK, (SCREEN_WIDTH // 2 + 60, 450), 20)
+            draw.circle(surface, BLACK, (SCREEN_WIDTH // 2 - 60, 450), 20)
+            draw.circle(surface, BLACK, (SCREEN_WIDTH // 2 + 60, 450), 20)
 
         # Draw buttons
         for button in self.buttons:
             button.draw(surface)
+        draw_recommended(surface, self.text_font, self.recommended)
+        self.draw_thinking(surface, self.text_font)
 
-class HousingScreen(Screen):
+class HousingScreen(RecommendingScreen):
     """
     Screen for house purchase opportunity.
     """
+    event = "housing"
+
     def __init__(self, game):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # House options
         self.house_options = [
@@ -474,12 +583,21 @@ class HousingScreen(Screen):
         # State (0 = house selection, 1 = payment selection, 2 = confirmation)
         self.state = 0
 
+        # Recommended house and down payment source
+        self.start_recommendation()
+
         # Create house selection buttons
         self.create_house_buttons()
 
+    def show_recommendation(self):
+        """Mark the recommended house or down payment source."""
+        self.create_house_buttons()
+
     def create_house_buttons(self):
         """Create buttons for house selection."""
         self.buttons = []
+        self.recommended = []
+        recommendation = self.recommendation
 
         if self.state == 0:
             # House selection buttons
@@ -492,6 +610,8 @@ class HousingScreen(Screen):
                     action=lambda h=house: self.select_house(h)
                 )
                 self.buttons.append(house_button)
+                if recommendation and recommendation.choice and recommendation.choice[0] == house['name']:
+                    self.recommended.append(mark_recommended(house_button))
 
             # Skip button
             skip_button = Button(
@@ -502,6 +622,8 @@ class HousingScreen(Screen):
                 action=self.skip_purchase
             )
             self.buttons.append(skip_button)
+            if recommendation and recommendation.choice is None:
+                self.recommended.append(mark_recommended(skip_button))
 
         elif self.state == 1:
             # Payment method buttons for down payment
@@ -530,6 +652,8 @@ class HousingScreen(Screen):
                     action=lambda m=method: self.select_payment_method(m)
                 )
                 self.buttons.append(method_button)
+                if method == recommended_method(recommendation, self.selected_house['name']):
+                    self.recommended.append(mark_recommended(method_button))
 
             # Back button
             back_button = Button(
@@ -619,13 +743,13 @@ class HousingScreen(Screen):
 
     def skip_purchase(self):
         """Skip house purchase."""
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.stop_recommendation()
+        self.game.gui_manager.return_to_game()
 
     def confirm_purchase(self):
         """Confirm purchase and return to game."""
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.stop_recommendation()
+        self.game.gui_manager.return_to_game()
 
     def draw(self, surface):
         """Draw the housing screen."""
@@ -633,9 +757,9 @@ class HousingScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("HOUSE PURCHASE OPPORTUNITY", True, BLUE)
+        title_surface = render_text(self.title_font, "HOUSE PURCHASE OPPORTUNITY", True, BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
         if self.state == 0:
             # House selection state
@@ -647,9 +771,9 @@ class HousingScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
-                surface.blit(text_surface, text_rect)
+                draw.blit(surface, text_surface, text_rect)
 
         elif self.state == 1:
             # Payment method selection state
@@ -663,9 +787,9 @@ class HousingScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
-                surface.blit(text_surface, text_rect)
+                draw.blit(surface, text_surface, text_rect)
 
         elif self.state == 2:
             # Confirmation state
@@ -685,16 +809,16 @@ class HousingScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
-                surface.blit(text_surface, text_rect)
+                draw.blit(surface, text_surface, text_rect)
 
             # Draw house image (simple house shape)
             house_rect = pygame.Rect(SCREEN_WIDTH // 2 - 75, 400, 150, 100)
-            pygame.draw.rect(surface, LIGHT_BLUE, house_rect)
+            draw.rect(surface, LIGHT_BLUE, house_rect)
 
             # Draw roof
-            pygame.draw.polygon(surface, RED, [
+            draw.polygon(surface, RED, [
                 (SCREEN_WIDTH // 2 - 85, 400),
                 (SCREEN_WIDTH // 2 + 85, 400),
                 (SCREEN_WIDTH // 2, 350)
@@ -702,16 +826,16 @@ class HousingScreen(Screen):
 
             # Draw door
             door_rect = pygame.Rect(SCREEN_WIDTH // 2 - 15, 450, 30, 50)
-            pygame.draw.rect(surface, BROWN, door_rect)
+            draw.rect(surface, BROWN, door_rect)
 
             # Draw window
             window_rect = pygame.Rect(SCREEN_WIDTH // 2 - 50, 420, 25, 25)
-            pygame.draw.rect(surface, WHITE, window_rect)
-            pygame.draw.rect(surface, BLACK, window_rect, 2)  # Border
+            draw.rect(surface, WHITE, window_rect)
+            draw.rect(surface, BLACK, window_rect, 2)  # Border
 
             window_rect2 = pygame.Rect(SCREEN_WIDTH // 2 + 25, 420, 25, 25)
-            pygame.draw.rect(surface, WHITE, window_rect2)
-            pygame.draw.rect(surface, BLACK, window_rect2, 2)  # Border
+            draw.rect(surface, WHITE, window_rect2)
+            draw.rect(surface, BLACK, window_rect2, 2)  # Border
 
         elif self.state == 3:
             # Not enough money state
@@ -728,13 +852,15 @@ class HousingScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
-                surface.blit(text_surface, text_rect)
+                draw.blit(surface, text_surface, text_rect)
 
         # Draw buttons
         for button in self.buttons:
             button.draw(surface)
+        draw_recommended(surface, self.text_font, self.recommended)
+        self.draw_thinking(surface, self.text_font)
 
 class FamilyPlanningScreen(Screen):
     """
@@ -744,12 +870,15 @@ class FamilyPlanningScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # State (0 = initial, 1 = spouse added, 2 = children question, 3 = confirmation)
         self.state = 0
 
+        # Artwork and text for the current state
+        self.background = Layer(self.draw_background)
+
         # Spouse info
         self.spouse_age = self.game.player.age - random.randint(-3, 3)  # Spouse age is close to player age
         self.spouse_has_job = random.random() < 0.7  # 70% chance of spouse having a job
@@ -854,23 +983,27 @@ class FamilyPlanningScreen(Screen):
 
     def skip_family(self):
         """Skip family planning for now."""
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def continue_to_game(self):
         """Continue to game after family planning."""
-        from moneySmartz.screens.game_screen import GameScreen
-        self.game.gui_manager.set_screen(GameScreen(self.game))
+        self.game.gui_manager.return_to_game()
 
     def draw(self, surface):
         """Draw the family planning screen."""
-        # Background
-        surface.fill(WHITE)
+        # Static artwork and text (repainted when the state changes)
+        self.background.draw(surface, key=(self.state, self.num_children))
 
+        # Draw buttons
+        for button in self.buttons:
+            button.draw(surface)
+
+    def draw_background(self, surface):
+        """Draw the background layer for the current state."""
         # Title
-        title_surface = self.title_font.render("FAMILY PLANNING", True, BLUE)
+        title_surface = render_text(self.title_font, "FAMILY PLANNING", True, BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        surface.blit(title_surface, title_rect)
+        draw.blit(surface, title_surface, title_rect)
 
         if self.state == 0:
             # Initial state
@@ -882,9 +1015,9 @@ class FamilyPlanningScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
-                surface.blit(text_surface, text_rect)
+                draw.blit(surface, text_surface, text_rect)
 
             # Draw family image (simple stick figures)
             self.draw_stick_figure(surface, SCREEN_WIDTH // 2 - 50, 300, 40, is_male=True)
@@ -911,9 +1044,9 @@ class FamilyPlanningScreen(Screen):
             ])
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
-                surface.blit(text_surface, text_rect)
+                draw.blit(surface, text_surface, text_rect)
 
             # Draw family image (simple stick figures)
             self.draw_stick_figure(surface, SCREEN_WIDTH // 2 - 50, 300, 40, is_male=True)
@@ -929,9 +1062,9 @@ class FamilyPlanningScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
-                surface.blit(text_surface, text_rect)
+                draw.blit(surface, text_surface, text_rect)
 
             # Draw family image (simple stick figures)
             self.draw_stick_figure(surface, SCREEN_WIDTH // 2 - 100, 300, 40, is_male=True)
@@ -950,40 +1083,36 @@ class FamilyPlanningScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, True, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
-                surface.blit(text_surface, text_rect)
+                draw.blit(surface, text_surface, text_rect)
 
             # Draw family image (simple stick figures)
             self.draw_stick_figure(surface, SCREEN_WIDTH // 2 - 50, 300, 40, is_male=True)
             self.draw_stick_figure(surface, SCREEN_WIDTH // 2 + 50, 300, 40, is_male=False)
 
-        # Draw buttons
-        for button in self.buttons:
-            button.draw(surface)
-
     def draw_stick_figure(self, surface, x, y, size, is_male=True, is_child=False):
         """Draw a simple stick figure."""
         # Head
         head_radius = size // 4
-        pygame.draw.circle(surface, BLACK, (x, y - size // 2 + head_radius), head_radius, 2)
+        draw.circle(surface, BLACK, (x, y - size // 2 + head_radius), head_radius, 2)
 
         # Body
         body_length = size // 2
-        pygame.draw.line(surface, BLACK, (x, y - size // 2 + head_radius * 2), (x, y - size // 2 + head_radius * 2 + body_length), 2)
+        draw.line(surface, BLACK, (x, y - size // 2 + head_radius * 2), (x, y - size // 2 + head_radius * 2 + body_length), 2)
 
         # Arms
         arm_length = size // 3
-        pygame.draw.line(surface, BLACK, (x, y - size // 2 + head_radius * 2 + body_length // 3), 
+        draw.line(surface, BLACK, (x, y - size // 2 + head_radius * 2 + body_length // 3), 
                          (x - arm_length, y - size // 2 + head_radius * 2 + body_length // 3), 2)
-        pygame.draw.line(surface, BLACK, (x, y - size // 2 + head_radius * 2 + body_length // 3), 
+        draw.line(surface, BLACK, (x, y - size // 2 + head_radius * 2 + body_length // 3), 
                          (x + arm_length, y - size // 2 + head_radius * 2 + body_length // 3), 2)
 
         # Legs
         leg_length = size // 2
-        pygame.draw.line(surface, BLACK, (x, y - size // 2 + head_radius * 2 + body_length), 
+        draw.line(surface, BLACK, (x, y - size // 2 + head_radius * 2 + body_length), 
                          (x - arm_length // 2, y - size // 2 + head_radius * 2 + body_length + leg_length), 2)
-        pygame.draw.line(surface, BLACK, (x, y - size // 2 + head_radius * 2 + body_length), 
+        draw.line(surface, BLACK, (x, y - size // 2 + head_radius * 2 + body_length), 
                          (x + arm_length // 2, y - size // 2 + head_radius * 2 + body_length + leg_length), 2)
 
         # Gender/age specific details
@@ -992,10 +1121,10 @@ class FamilyPlanningScreen(Screen):
             pass
         elif is_male:
             # Bow tie for male
-            pygame.draw.circle(surface, RED, (x, y - size // 2 + head_radius * 2 + body_length // 6), 3)
+            draw.circle(surface, RED, (x, y - size // 2 + head_radius * 2 + body_length // 6), 3)
         else:
             # Skirt for female
-            pygame.draw.polygon(surface, PURPLE, [
+            draw.polygon(surface, PURPLE, [
                 (x, y - size // 2 + head_radius * 2 + body_length),
                 (x - arm_length, y - size // 2 + head_radius * 2 + body_length + leg_length // 2),
                 (x + arm_length, y - size // 2 + head_radius * 2 + body_length + leg_length // 2)
@@ -1,7 +1,8 @@
 import pygame
 from pygame.locals import *
 from moneySmartz.constants import *
-from moneySmartz.ui import Screen, Button
+from moneySmartz.ui import Screen, Button, get_font, render_text
+from moneySmartz import draw
 
 class RandomEventScreen(Screen):
     """
@@ -10,31 +11,9 @@ class RandomEventScreen(Screen):
     """
     def __init__(self, game, event, cash_effect):
         super().__init__(game)
-        self.event = event
-        self.cash_effect = cash_effect
-        self.font = pygame.font.SysFont('Arial', FONT_MEDIUM)
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE, bold=True)
-        
-        # Process the event
-        if cash_effect > 0:
-            self.game.player.cash += cash_effect
-            self.result_message = f"You received ${cash_effect}!"
-        else:
-            self.result_message = f"This costs you ${abs(cash_effect)}."
-            
-            # Handle payment
-            if self.game.player.cash >= abs(cash_effect):
-                self.game.player.cash -= abs(cash_effect)
-                self.payment_message = "You paid in cash."
-            elif self.game.player.bank_account and self.game.player.bank_account.balance >= abs(cash_effect):
-                self.game.player.bank_account.withdraw(abs(cash_effect))
-                self.payment_message = "You paid using your bank account."
-            elif self.game.player.credit_card and (self.game.player.credit_card.balance + abs(cash_effect)) <= self.game.player.credit_card.limit:
-                self.game.player.credit_card.charge(abs(cash_effect))
-                self.payment_message = "You paid using your credit card."
-            else:
-                self.game.player.credit_score -= 15
-                self.payment_message = "You couldn't afford this expense! Your credit score has been affected."
+        self.font = get_font(FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE, bold=True)
+        self.show_event(event, cash_effect)
         
         # Continue button
         continue_button = Button(
@@ -42,10 +21,24 @@ class RandomEventScreen(Screen):
             SCREEN_HEIGHT - 100, 
             200, 60, 
             "Continue", 
-            action=lambda: self.game.gui_manager.set_screen(self.game.gui_manager.current_screen)
+            action=self.game.gui_manager.pop_screen
         )
         
         self.buttons = [continue_button]
+
+    def show_event(self, event, cash_effect):
+        """Apply an event's cash effect and show it (the screen is reused for every event)."""
+        self.event = event
+        self.cash_effect = cash_effect
+
+        # Process the event
+        if cash_effect > 0:
+            self.result_message = f"You received ${cash_effect}!"
+        else:
+            self.result_message = f"This costs you ${abs(cash_effect)}."
+
+        # Handle payment
+        self.payment_message = self.game.apply_event_effect(cash_effect)
     
     def draw(self, surface):
         """Draw the random event screen."""
@@ -54,27 +47,27 @@ class RandomEventScreen(Screen):
         # Draw event header
         header_rect = pygame.Rect(0, 0, SCREEN_WIDTH, 80)
         event_color = GREEN if self.cash_effect > 0 else RED
-        pygame.draw.rect(surface, event_color, header_rect)
+        draw.rect(surface, event_color, header_rect)
         
-        header_text = self.title_font.render(f"LIFE EVENT: {self.event['name']}", True, WHITE)
+        header_text = render_text(self.title_font, f"LIFE EVENT: {self.event['name']}", True, WHITE)
         header_rect = header_text.get_rect(center=(SCREEN_WIDTH // 2, 40))
-        surface.blit(header_text, header_rect)
+        draw.blit(surface, header_text, header_rect)
         
         # Draw event description
-        desc_text = self.font.render(self.event['description'], True, BLACK)
+        desc_text = render_text(self.font, self.event['description'], True, BLACK)
         desc_rect = desc_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        surface.blit(desc_text, desc_rect)
+        draw.blit(surface, desc_text, desc_rect)
         
         # Draw result
-        result_text = self.font.render(self.result_message, True, BLACK)
+        result_text = render_text(self.font, self.result_message, True, BLACK)
         result_rect = result_text.get_rect(center=(SCREEN_WIDTH // 2, 220))
-        surface.blit(result_text, result_rect)
+        draw.blit(surface, result_text, result_rect)
         
         # Draw payment message if applicable
         if self.cash_effect < 0:
-            payment_text = self.font.render(self.payment_message, True, BLACK)
+            payment_text = render_text(self.font, self.payment_message, True, BLACK)
             payment_rect = payment_text.get_rect(center=(SCREEN_WIDTH // 2, 270))
-            surface.blit(payment_text, payment_rect)
+            draw.blit(surface, payment_text, payment_rect)
         
         # Draw buttons
         for button in self.buttons:
@@ -0,0 +1,369 @@
+"""
+Headless life simulation for batch and Monte Carlo runs.
+
+The GUI and text modes stop at every decision point to ask the player.
+This module plays a complete life from age 16 to retirement without any
+input or output, asking a Policy (see moneySmartz.policies) for each
+decision and applying it with the same rules as the screens, so thousands
+of lives and strategies can be simulated and compared.
+"""
+
+import random
+from moneySmartz import metrics
+from moneySmartz.models import Player, BankAccount, Card, Loan, Asset
+from moneySmartz.game import Game
+from moneySmartz.policies import StateView, get_policy
+
+RETIREMENT_AGE = 65
+EVENT_CHANCE = 0.3  # 30% chance of a random event each month
+BETTER_JOB_CHANCE = 0.1  # 10% chance of a job opportunity each month
+PARENTS_DEPOSIT = 50  # The parents' gift when the first bank account is opened
+
+# Rules a life can be simulated with (see simulate_life's params)
+DEFAULT_PARAMS = {
+    "college_cost": 20000,  # Per year; a student loan covers all four years
+    "trade_school_cost": 10000,
+    "student_loan_rate": 0.05,
+    "mortgage_rates": (0.035, 0.04, 0.045, 0.055),  # Credit score 750+, 700+, 650+, below
+    "event_chance": EVENT_CHANCE,
+    "auto_deposit_share": 0.8,  # Share of income deposited in the bank automatically
+    "inflation_rate": 0.02,
+}
+
+# The choices offered by the life event screens
+CAR_OPTIONS = [
+    {"name": "Used Economy Car", "value": 5000},
+    {"name": "New Economy Car", "value": 18000},
+    {"name": "Used Luxury Car", "value": 15000},
+    {"name": "New Luxury Car", "value": 35000},
+]
+HOUSE_OPTIONS = [
+    {"name": "Small Starter Home", "value": 150000},
+    {"name": "Mid-size Family Home", "value": 250000},
+    {"name": "Large Luxury Home", "value": 500000},
+    {"name": "Urban Condo", "value": 200000},
+]
+
+def simulate_life(seed, policy="default", on_month=None, recorder=None, life_id=None, params=None):
+    """
+    Simulate a complete life headlessly.
+
+    seed seeds the random number generator so runs are reproducible.
+    policy is a name in moneySmartz.policies.POLICIES or a Policy; it
+    makes every decision.
+    params overrides some of DEFAULT_PARAMS for this life.
+    on_month, if given, is added to the game's monthly hooks and is called
+    with the game at the end of every month, after its random event and the
+    policy's decisions.
+    recorder, if given, is a TraceRecorder that records this life's
+    per-month state under life_id.
+    Returns the finished Game.
+    """
+    policy = get_policy(policy)
+    params = life_params(params)
+    random.seed(seed)
+
+    game = Game()
+    game.verbose = False
+    game.auto_deposit_share = params["auto_deposit_share"]
+    game.inflation_rate = params["inflation_rate"]
+    game.player = Player("Player")
+    if on_month:
+        game.monthly_hooks.append(on_month)
+    if recorder:
+        recorder.start_life(game, life_id)
+
+    open_bank_account(game, policy)
+    play_out(game, policy, params)
+
+    if recorder:
+        recorder.end_life()
+    if metrics.registry.enabled:
+        metrics.lives.inc()
+
+    game.game_over = True
+    return game
+
+def play_out(game, policy, params=DEFAULT_PARAMS):
+    """Play a game on from its current month to retirement, the policy making every decision."""
+    while game.player.age < RETIREMENT_AGE:
+        game.advance_month()
+
+        # Random events
+        if random.random() < params["event_chance"]:
+            event, cash_effect = game.roll_random_event()
+            if cash_effect != 0:
+                game.apply_event_effect(cash_effect)
+
+        decide_month(game, policy, game.due_life_stage_event(), params)
+        game.end_month()
+
+def life_params(params=None):
+    """Get DEFAULT_PARAMS with params' overrides. Raises ValueError for an unknown name."""
+    unknown = set(params or ()) - set(DEFAULT_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+    return dict(DEFAULT_PARAMS, **(params or {}))
+
+def run_summary(game):
+    """Get the end-of-game summary row for a finished simulation."""
+    summary = game.get_financial_summary()
+    summary["years"] = game.current_year
+    return summary
+
+def open_bank_account(game, policy):
+    """Let the policy open the first bank account (with the parents' deposit) and get a debit card."""
+    state = StateView(game)
+    account_type = policy.open_bank_account(state)
+    if not account_type:
+        return False
+
+    game.player.bank_account = BankAccount(account_type)
+    game.player.bank_account.deposit(PARENTS_DEPOSIT)
+    if account_type == "Checking" and policy.get_debit_card(state):
+        game.player.debit_card = Card("Debit")
+    return True
+
+def decide_month(game, policy, event, params=DEFAULT_PARAMS):
+    """
+    Make the policy's decisions after a monthly tick: the life stage event
+    (from Game.due_life_stage_event) if one is due, otherwise job hunting,
+    then the month's deposit and extra loan payment.
+    """
+    state = StateView(game)
+    player = game.player
+
+    if not handle_life_stage_event(game, policy, event, state, params):
+        if player.job:
+            # Occasional better job opportunity
+            if random.random() < BETTER_JOB_CHANCE:
+                look_for_job(game, policy, state)
+        elif player.education != "College (In Progress)" and policy.look_for_work(state):
+            look_for_job(game, policy, state)
+
+    manage_money(game, policy, state)
+
+def handle_life_stage_event(game, policy, event, state, params=DEFAULT_PARAMS):
+    """
+    Apply the policy's choices for a life stage event (None for no event).
+    Returns True if an event was handled.
+    """
+    player = game.player
+
+    # High school graduation: college, trade school or work
+    if event == "high_school_graduation":
+        choice = policy.education(state)
+        if choice == "College":
+            go_to_college(game, params)
+        elif choice == "Trade School":
+            go_to_trade_school(game, params)
+        else:
+            player.education = "High School Graduate"
+            look_for_job(game, policy, state)
+
+    # College graduation
+    elif event == "college_graduation":
+        player.education = "College Graduate"
+        player.credit_score += 20  # Education boosts credit score
+        look_for_job(game, policy, state)
+
+    # First full-time job opportunity
+    elif event == "job_search":
+        look_for_job(game, policy, state)
+
+    # Car purchase opportunity
+    elif event == "car_purchase":
+        car = policy.choose_car(state, CAR_OPTIONS)
+        if car:
+            buy_car(game, car, policy.car_payment(state, car, car_payment_methods(game, car)))
+
+    # House purchase opportunity: only if the down payment is affordable
+    elif event == "housing":
+        house = policy.choose_house(state, HOUSE_OPTIONS)
+        if house:
+            sources = down_payment_sources(game, house)
+            if sources:
+                buy_house(game, house, policy.down_payment_source(state, house, sources), params)
+
+    # Family planning opportunity
+    elif event == "family_planning":
+        plan_family(game, policy, state)
+
+    return event is not None
+
+def go_to_college(game, params=DEFAULT_PARAMS):
+    """Pay the first year of college (or take a student loan for all four) and enroll."""
+    player = game.player
+    annual_cost = params["college_cost"]
+    if player.cash >= annual_cost:
+        player.cash -= annual_cost
+    elif player.bank_account and player.bank_account.balance >= annual_cost:
+        player.bank_account.withdraw(annual_cost)
+    else:
+        player.loans.append(Loan("Student", annual_cost * 4, params["student_loan_rate"], 20))  # 4 years over 20 years
+    player.education = "College (In Progress)"
+
+def go_to_trade_school(game, params=DEFAULT_PARAMS):
+    """Pay for trade school (or take a student loan)."""
+    player = game.player
+    cost = params["trade_school_cost"]
+    if player.cash >= cost:
+        player.cash -= cost
+    elif player.bank_account and player.bank_account.balance >= cost:
+        player.bank_account.withdraw(cost)
+    else:
+        player.loans.append(Loan("Student", cost, params["student_loan_rate"], 10))  # 10-year term
+    player.education = "Trade School"
+
+def look_for_job(game, policy, state):
+    """Apply for the job the policy picks from the options on offer."""
+    job_options = game.generate_job_options()
+    if not job_options:
+        return False
+
+    job = policy.choose_job(state, job_options)
+    if job is None:
+        return False
+    if random.random() < game.get_job_success_chance():
+        game.player.job = job["title"]
+        game.player.salary = job["salary"]
+        return True
+    return False
+
+def car_payment_methods(game, car):
+    """Get the ways the car can be paid for, as offered by CarPurchaseScreen."""
+    player = game.player
+    methods = ["Cash"]
+    if player.bank_account and player.bank_account.balance >= car["value"]:
+        methods.append("Bank Account")
+    methods.append("Auto Loan")
+    return methods
+
+def buy_car(game, car, method):
+    """
+    Buy a car with cash, the bank account, or an auto loan (also used when the cash falls short).
+    Raises ValueError for a method car_payment_methods doesn't offer.
+    """
+    player = game.player
+    if method not in car_payment_methods(game, car):
+        raise ValueError(f"Payment method not offered for {car['name']}: {method}")
+
+    if method == "Cash" and player.cash >= car["value"]:
+        player.cash -= car["value"]
+    elif method == "Bank Account":
+        player.bank_account.withdraw(car["value"])
+    else:
+        # Determine loan terms based on credit score
+        if player.credit_score >= 700:
+            interest_rate = 0.03  # 3%
+        elif player.credit_score >= 650:
+            interest_rate = 0.05  # 5%
+        else:
+            interest_rate = 0.08  # 8%
+
+        player.loans.append(Loan("Auto", car["value"], interest_rate, 5))  # 5-year auto loan
+
+    player.assets.append(Asset("Car", car["name"], car["value"]))
+
+def down_payment_sources(game, house):
+    """Get where the 20% down payment can come from, as offered by HousingScreen (empty if unaffordable)."""
+    player = game.player
+    down_payment = house["value"] * 0.2
+    sources = []
+    if player.cash >= down_payment:
+        sources.append("Cash")
+    if player.bank_account and player.bank_account.balance >= down_payment:
+        sources.append("Bank Account")
+    return sources
+
+def buy_house(game, house, source, params=DEFAULT_PARAMS):
+    """
+    Buy a house with a 20% down payment from source and a 30-year mortgage.
+    Raises ValueError for a source down_payment_sources doesn't offer.
+    """
+    player = game.player
+    if source not in down_payment_sources(game, house):
+        raise ValueError(f"Down payment source not offered for {house['name']}: {source}")
+    down_payment = house["value"] * 0.2
+    loan_amount = house["value"] - down_payment
+
+    if source == "Cash":
+        player.cash -= down_payment
+    else:
+        player.bank_account.withdraw(down_payment)
+
+    # Determine mortgage terms based on credit score
+    excellent, good, fair, poor = params["mortgage_rates"]
+    if player.credit_score >= 750:
+        interest_rate = excellent
+    elif player.credit_score >= 700:
+        interest_rate = good
+    elif player.credit_score >= 650:
+        interest_rate = fair
+    else:
+        interest_rate = poor
+
+    player.loans.append(Loan("Mortgage", loan_amount, interest_rate, 30))  # 30-year mortgage
+    player.assets.append(Asset("House", house["name"], house["value"]))
+    return True
+
+def plan_family(game, policy, state):
+    """
+    Offer a family: the spouse and the children are rolled first, as
+    FamilyPlanningScreen does, then the policy decides.
+    """
+    player = game.player
+
+    # Spouse age is close to player age
+    spouse_age = player.age - random.randint(-3, 3)
+
+    # 70% chance of spouse having a job
+    spouse_income = 0
+    if random.random() < 0.7:
+        spouse_income = int(player.salary * random.uniform(0.5, 1.5))
+
+    children = random.randint(1, 3)
+
+    if not policy.start_family(state, spouse_income):
+        return False
+    player.family.append({"relation": "Spouse", "age": spouse_age})
+    player.salary += spouse_income
+
+    if policy.have_children(state, children):
+        for i in range(children):
+            player.family.append({"relation": "Child", "name": f"Child {i+1}", "age": 0})
+    return True
+
+def manage_money(game, policy, state):
+    """
+    Make the policy's deposit and extra loan payment for the month.
+    The extra payment goes entirely to principal (the month's interest is
+    already in the loan's regular payment), and a loan it pays off is removed
+    so its regular payment stops.
+    """
+    player = game.player
+
+    amount = min(policy.deposit(state), player.cash)
+    if amount > 0 and player.bank_account:
+        player.cash -= amount
+        player.bank_account.deposit(amount)
+
+    payment = policy.extra_loan_payment(state)
+    if payment:
+        index, amount = payment
+        loan = player.loans[index]
+        amount = min(amount, loan.current_balance)
+        if amount <= 0:
+            return
+        if player.cash >= amount:
+            player.cash -= amount
+        elif player.bank_account and player.bank_account.balance >= amount:
+            player.bank_account.withdraw(amount)
+        else:
+            return
+        loan.make_extra_payment(amount)
+
+        # A paid off loan is removed, as make_extra_loan_payment does
+        if loan.current_balance <= 0:
+            player.loans.remove(loan)
+            player.credit_score += max(0, min(20, 850 - player.credit_score))
@@ -0,0 +1,355 @@
+"""
+Expectimax solver for life stage decisions.
+
+Finds the choice with the highest expected net worth at retirement for the
+decisions the life event screens offer: college, trade school or work; which
+car and how to pay; which house and where the down payment comes from; and
+whether to start a family. The decision tree alternates the player's choices
+(max nodes) with the game's randomness (chance nodes):
+
+- every choice is applied to a copy of the game with the engine's rules
+  (moneySmartz.simulation), and its chance node is estimated by sampled
+  headless rollouts to retirement;
+- every choice is rolled out with the same seeds (common random numbers),
+  so choices are compared on the same lives;
+- rollouts run in rounds, and once every choice has PRUNE_AFTER of them,
+  choices that are worse than the best by a clear margin (paired
+  difference below zero by Z_SCORE standard errors) are pruned, as are
+  choices that play out the same as another (paying cash for a car
+  without the cash takes a loan);
+- later decisions inside a rollout are solved the same way with fewer
+  samples while depth lasts, and otherwise follow earlier solutions of the
+  same state or the base policy;
+- one deadline (time_limit after the top-level call) bounds the whole
+  tree: nested solves stop their rounds at it, and once it has passed,
+  later decisions follow earlier solutions or the base policy;
+- solutions are memoized on a canonical state (rounded money amounts), so
+  coming back to a decision or meeting it again in another rollout is free;
+  a solve the deadline cut short is only reused where the base policy
+  would be the alternative, never in place of a full solve.
+
+Screens solve on a background thread with a RecommendationWorker, so the
+window stays responsive while the rollouts run.
+
+Usage:
+    from moneySmartz.solver import solver
+    recommendation = solver.recommend(game, "car_purchase")
+    recommendation.choice  # ("Used Economy Car", "Cash")
+"""
+
+import math
+import random
+import threading
+import time
+from collections import namedtuple
+from moneySmartz.constants import SOLVER_ROLLOUTS, SOLVER_TIME_LIMIT
+from moneySmartz.game import Game
+from moneySmartz.models import Player
+from moneySmartz.policies import Policy, StateView, get_policy
+from moneySmartz.simulation import (
+    CAR_OPTIONS, HOUSE_OPTIONS, life_params, play_out, handle_life_stage_event,
+    car_payment_methods, down_payment_sources,
+)
+
+ROUND_ROLLOUTS = 4  # Rollouts per choice between pruning passes
+NESTED_ROLLOUTS = 4  # Rollouts per choice for decisions inside a rollout
+PRUNE_AFTER = 12  # Rollouts per choice before any is pruned
+Z_SCORE = 3.0  # Standard errors by which a pruned choice must trail the best
+MONEY_ROUNDING = -3  # Money amounts are rounded to the nearest $1000 for memoization
+MEMO_SIZE = 10000
+
+# The best choice and, for every choice rolled out, (mean net worth at retirement, rollouts)
+Recommendation = namedtuple("Recommendation", ["choice", "values"])
+
+class SolveCancelled(Exception):
+    """Raised out of a solve whose cancel event was set."""
+
+def decision_options(game, event):
+    """
+    Get the choices for a life stage event, as offered by its screen:
+    education names, (car name, payment method) or None to skip,
+    (house name, down payment source) or None to skip, or whether to start a family.
+    """
+    player = game.player
+    if event == "high_school_graduation":
+        return ["College", "Trade School", "Work"]
+    if event == "car_purchase":
+        options = []
+        for car in CAR_OPTIONS:
+            for method in car_payment_methods(game, car):
+                if method == "Cash" and player.cash < car["value"]:
+                    continue  # Takes an auto loan, the same as choosing one
+                options.append((car["name"], method))
+        return options + [None]
+    if event == "housing":
+        options = [(house["name"], source) for house in HOUSE_OPTIONS for source in down_payment_sources(game, house)]
+        return options + [None]
+    if event == "family_planning":
+        return [True, False]
+    raise ValueError(f"No decision for life stage event: {event}")
+
+def canonical_state(game):
+    """Get the state the solver memoizes on: the player's situation with money amounts rounded."""
+    player = game.player
+    debt = sum(loan.current_balance for loan in player.loans)
+    if player.credit_card:
+        debt += player.credit_card.balance
+    return (
+        game.current_year, player.age, player.education, player.job,
+        round(player.salary, MONEY_ROUNDING), round(player.cash, MONEY_ROUNDING),
+        round(player.bank_account.balance if player.bank_account else 0, MONEY_ROUNDING),
+        round(debt, MONEY_ROUNDING), player.credit_score // 10,
+        tuple(sorted(asset.asset_type for asset in player.assets)), len(player.family),
+    )
+
+def clone_game(game):
+    """Copy a game's state into a new headless game for a rollout (transaction histories are left out)."""
+    clone = Game()
+    clone.verbose = False
+    clone.current_month = game.current_month
+    clone.current_year = game.current_year
+    clone.auto_deposit_share = game.auto_deposit_share
+    clone.inflation_rate = game.inflation_rate
+
+    # from_dict shares the lists it is given, so the mutable ones are replaced
+    player = clone.player = Player.from_dict(game.player.to_dict())
+    player.family = [dict(member) for member in player.family]
+    for record in (player.bank_account, player.debit_card, player.credit_card):
+        if record:
+            record.transaction_history = []
+    for loan in player.loans:
+        loan.payment_history = []
+    return clone
+
+class SolverPolicy(Policy):
+    """
+    Makes the life stage decisions of a rollout with the solver (or fixed
+    choices for the decision being evaluated) and the rest like the base policy.
+    """
+    def __init__(self, solver, game, depth, deadline, cancel=None, fixed=None):
+        self.solver = solver
+        self.game = game
+        self.depth = depth
+        self.deadline = deadline  # perf_counter time after which nothing more is solved
+        self.cancel = cancel  # threading.Event that stops the whole solve
+        self.fixed = dict(fixed or {})  # Event -> choice, used once
+        self.base = solver.policy
+        self.pending = None  # The (name, method) chosen with a car or house
+
+    def decide(self, event):
+        """Get (found, choice) for a life stage event; not found leaves it to the base policy."""
+        if event in self.fixed:
+            return True, self.fixed.pop(event)
+        return self.solver.choose(self.game, event, self.depth, self.deadline, self.cancel)
+
+    def education(self, state):
+        found, choice = self.decide("high_school_graduation")
+        return choice if found else self.base.education(state)
+
+    def choose_car(self, state, car_options):
+        found, self.pending = self.decide("car_purchase")
+        if not found:
+            return self.base.choose_car(state, car_options)
+        return next((car for car in car_options if self.pending and car["name"] == self.pending[0]), None)
+
+    def car_payment(self, state, car, methods):
+        if self.pending and self.pending[0] == car["name"] and self.pending[1] in methods:
+            return self.pending[1]
+        return self.base.car_payment(state, car, methods)
+
+    def choose_house(self, state, house_options):
+        found, self.pending = self.decide("housing")
+        if not found:
+            return self.base.choose_house(state, house_options)
+        return next((house for house in house_options if self.pending and house["name"] == self.pending[0]), None)
+
+    def down_payment_source(self, state, house, sources):
+        if self.pending and self.pending[0] == house["name"] and self.pending[1] in sources:
+            return self.pending[1]
+        return self.base.down_payment_source(state, house, sources)
+
+    def start_family(self, state, spouse_income):
+        found, choice = self.decide("family_planning")
+        return choice if found else self.base.start_family(state, spouse_income)
+
+    # Everything else is the base policy's
+    def open_bank_account(self, state):
+        return self.base.open_bank_account(state)
+
+    def get_debit_card(self, state):
+        return self.base.get_debit_card(state)
+
+    def look_for_work(self, state):
+        return self.base.look_for_work(state)
+
+    def choose_job(self, state, job_options):
+        return self.base.choose_job(state, job_options)
+
+    def have_children(self, state, children):
+        return self.base.have_children(state, children)
+
+    def deposit(self, state):
+        return self.base.deposit(state)
+
+    def extra_loan_payment(self, state):
+        return self.base.extra_loan_payment(state)
+
+class Solver:
+    """
+    Recommends life stage decisions by memoized expectimax over sampled rollouts.
+    """
+    def __init__(self, rollouts=SOLVER_ROLLOUTS, time_limit=SOLVER_TIME_LIMIT, depth=1, seed=0, policy="default", params=None):
+        self.rollouts = rollouts
+        self.time_limit = time_limit
+        self.depth = depth  # Decisions optimized along a path (1: only the one asked about)
+        self.seed = seed
+        self.policy = get_policy(policy)  # Makes the other decisions
+        self.params = life_params(params)
+        self.memo = {}  # (event, canonical state) -> (depth, complete, Recommendation)
+
+    def recommend(self, game, event, depth=None, deadline=None, cancel=None):
+        """
+        Get the Recommendation for the life stage event due in game.
+        deadline is the perf_counter time a nested solve shares with its
+        top-level call (default: time_limit from now).
+        cancel, if given, is a threading.Event; once it is set the solve
+        stops with SolveCancelled (before its next rollout).
+        The game and the random number generator's state are left untouched.
+        """
+        depth = self.depth if depth is None else depth
+        key = (event, canonical_state(game))
+        cached = self.memo.get(key)
+        if cached and cached[0] >= depth and cached[1]:
+            return cached[2]
+
+        options = decision_options(game, event)
+        if len(options) == 1:
+            return Recommendation(options[0], {})  # Nothing to compare (e.g. no affordable house)
+        nested = depth < self.depth
+        rollouts = min(self.rollouts, NESTED_ROLLOUTS) if nested else self.rollouts
+        if deadline is None:
+            deadline = time.perf_counter() + self.time_limit
+
+        samples = {option: [] for option in options}
+        live = list(options)
+        saved = random.getstate()
+        try:
+            done = 0
+            while done < rollouts and len(live) > 1:
+                for index in range(done, min(done + ROUND_ROLLOUTS, rollouts)):
+                    seed = self.seed * 1000003 + index  # The same lives for every choice
+                    for option in live:
+                        if cancel and cancel.is_set():
+                            raise SolveCancelled()
+                        samples[option].append(self.rollout(game, event, option, seed, depth, deadline, cancel))
+                done = min(done + ROUND_ROLLOUTS, rollouts)
+                live = self.prune(live, samples)
+                if time.perf_counter() > deadline:
+                    break
+        finally:
+            random.setstate(saved)
+
+        best = max(live, key=lambda option: sum(samples[option]))
+        recommendation = Recommendation(best, self.estimates(samples, best))
+        complete = done >= rollouts or len(live) == 1  # Not cut short by the deadline
+
+        if len(self.memo) >= MEMO_SIZE:
+            self.memo.clear()
+        if not (cached and cached[1]) or complete:  # A truncated solve never replaces a full one
+            self.memo[key] = (depth, complete, recommendation)
+        return recommendation
+
+    def choose(self, game, event, depth, deadline, cancel=None):
+        """
+        Get (found, choice) for a decision inside a rollout: solved while
+        depth and time last, else an earlier solution of the same state if
+        there is one.
+        """
+        if depth > 0 and time.perf_counter() <= deadline:
+            return True, self.recommend(game, event, depth, deadline, cancel).choice
+        cached = self.memo.get((event, canonical_state(game)))
+        if cached:
+            return True, cached[2].choice
+        return False, None
+
+    def rollout(self, game, event, option, seed, depth, deadline, cancel=None):
+        """Apply a choice to a copy of the game and play it out; returns the net worth at retirement."""
+        clone = clone_game(game)
+        random.seed(seed)
+        policy = SolverPolicy(self, clone, depth - 1, deadline, cancel, fixed={event: option})
+        handle_life_stage_event(clone, policy, event, StateView(clone), self.params)
+        play_out(clone, policy, self.params)
+        return clone.get_financial_summary()["net_worth"]
+
+    def estimates(self, samples, best):
+        """
+        Get (mean net worth, rollouts) for every choice rolled out. Pruned
+        choices have fewer rollouts, so each is estimated as the best's mean
+        plus its mean difference from the best on the seeds they share.
+        """
+        best_mean = sum(samples[best]) / len(samples[best])
+        estimates = {}
+        for option, values in samples.items():
+            if values:
+                difference = sum(value - best_value for value, best_value in zip(values, samples[best])) / len(values)
+                estimates[option] = (best_mean + difference, len(values))
+        return estimates
+
+    def prune(self, live, samples):
+        """Drop the choices whose paired difference from the best is clearly below zero."""
+        best = max(live, key=lambda option: sum(samples[option]))
+        kept = []
+        for option in live:
+            differences = [value - best_value for value, best_value in zip(samples[option], samples[best])]
+            n = len(differences)
+            if option is not best and n >= PRUNE_AFTER:
+                mean = sum(differences) / n
+                variance = sum((difference - mean) ** 2 for difference in differences) / (n - 1)
+                if mean + Z_SCORE * math.sqrt(variance / n) < 0:
+                    continue
+            kept.append(option)
+        return kept
+
+class RecommendationWorker:
+    """
+    Solves a life stage decision on a background thread, so a screen can
+    show its choices at once and mark the recommended one when it arrives.
+    The solve runs on a copy of the game, but it seeds the global random
+    number generator (restoring it when done), so cancel() it before the
+    game draws random numbers again.
+    """
+    def __init__(self, solver, game, event):
+        self.solver = solver
+        self.game = clone_game(game)  # The player can change the real game meanwhile
+        self.event = event
+        self.recommendation = None  # Set when the solve finishes
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self.run, name="RecommendationWorker", daemon=True)
+
+    def start(self):
+        """Start solving on a new thread."""
+        self._thread.start()
+        return self
+
+    def run(self):
+        """Solve the decision (worker thread)."""
+        try:
+            self.recommendation = self.solver.recommend(self.game, self.event, cancel=self._cancel)
+        except SolveCancelled:
+            pass
+
+    def done(self):
+        """Whether the solve has finished or been cancelled."""
+        return not self._thread.is_alive()
+
+    def join(self, timeout=None):
+        """Wait for the solve to finish."""
+        self._thread.join(timeout)
+
+    def cancel(self):
+        """Stop the solve and wait for the thread (one rollout at most)."""
+        self._cancel.set()
+        self.join()
+
+# The solver the screens use
+solver = Solver()
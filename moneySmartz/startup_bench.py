@@ -0,0 +1,143 @@
+"""
+Startup benchmark.
+
+Starts fresh interpreters with `python -X importtime` and measures:
+- headless: importing the headless engine (moneySmartz.simulation), which
+  must not import pygame;
+- title: a cold start up to the first rendered TitleScreen (imports,
+  pygame.init, the window, one frame drawn and flipped), using SDL's dummy
+  video driver.
+
+Wall times are measured by the parent from process start to the child's
+"ready" line, so interpreter startup is included. The median over --repeat
+runs is reported as JSON together with the slowest imports (self time)
+of the last run.
+
+Usage:
+    python -m moneySmartz.startup_bench
+    python -m moneySmartz.startup_bench --repeat 10 --target 800
+
+The exit status is 1 if the median title start is slower than --target ms
+or the headless import pulled in pygame.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+STARTUP_TARGET_MS = 500  # Cold start to the first rendered TitleScreen
+
+HEADLESS_CHILD = """
+import sys
+import moneySmartz.simulation
+print("ready", "pygame" in sys.modules, flush=True)
+"""
+
+TITLE_CHILD = """
+import sys
+import pygame
+from moneySmartz import Game, GUIManager
+from moneySmartz.screens import TitleScreen
+pygame.init()
+game = Game()
+gui_manager = GUIManager(game)
+game.gui_manager = gui_manager
+gui_manager.set_screen(TitleScreen(game))
+gui_manager.current_screen.draw(gui_manager.screen)
+pygame.display.flip()
+print("ready", "pygame" in sys.modules, flush=True)
+pygame.quit()
+"""
+
+def parse_importtime(stderr, top=10):
+    """Get the slowest imports by self time from -X importtime output as (module, self_ms, cumulative_ms)."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        imports.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    imports.sort(key=lambda record: record[1], reverse=True)
+    return imports[:top]
+
+def run_child(code):
+    """Start a fresh interpreter running code. Returns (wall_ms, pygame_loaded, importtime stderr)."""
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env,
+    )
+    line = process.stdout.readline()
+    wall_ms = (time.perf_counter() - start) * 1000
+    _, stderr = process.communicate()
+
+    if not line.startswith("ready"):
+        raise RuntimeError(f"startup child failed:\n{stderr[-2000:]}")
+    return wall_ms, line.split()[1] == "True", stderr
+
+def measure(code, repeat):
+    """Run a child repeat times. Returns its results dict."""
+    times = []
+    for _ in range(repeat):
+        wall_ms, pygame_loaded, stderr = run_child(code)
+        times.append(wall_ms)
+    return {
+        "median_ms": statistics.median(times),
+        "min_ms": min(times),
+        "max_ms": max(times),
+        "pygame_loaded": pygame_loaded,
+        "slowest_imports": [
+            {"module": name, "self_ms": self_ms, "cumulative_ms": cumulative_ms}
+            for name, self_ms, cumulative_ms in parse_importtime(stderr)
+        ],
+    }
+
+def run(repeat=5, target=STARTUP_TARGET_MS):
+    """Run the benchmark and return the results dict."""
+    return {
+        "repeat": repeat,
+        "target_ms": target,
+        "python": sys.version.split()[0],
+        "headless": measure(HEADLESS_CHILD, repeat),
+        "title": measure(TITLE_CHILD, repeat),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold start benchmark for the headless engine and the TitleScreen.")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per measurement")
+    parser.add_argument("--target", type=float, default=STARTUP_TARGET_MS, help="allowed median cold start to the first TitleScreen frame (ms)")
+    parser.add_argument("--output", help="write the results JSON here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat, args.target)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    status = 0
+    if results["headless"]["pygame_loaded"]:
+        print("FAIL importing moneySmartz.simulation imported pygame", file=sys.stderr)
+        status = 1
+    title_ms = results["title"]["median_ms"]
+    if title_ms > args.target:
+        print(f"FAIL cold start to TitleScreen {title_ms:.0f} ms > target {args.target:.0f} ms", file=sys.stderr)
+        status = 1
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""
+Parameter sweeps over the game's rules and policies.
+
+Balance tuning asks how outcomes move with the game's constants: college
+cost, the student loan rate, the mortgage rate tiers, the chance of a random
+event, the share of income auto-deposited and inflation (see
+moneySmartz.simulation.DEFAULT_PARAMS). A sweep spec lists the policies and
+either a grid of parameter values (every combination is a cell) or a random
+search (cells sampled from ranges or choices):
+
+    {
+        "policies": ["default", "frugal"],
+        "lives": 200,
+        "grid": {"college_cost": [10000, 20000, 30000], "inflation_rate": [0.01, 0.02, 0.03]}
+    }
+
+    {
+        "policies": ["default"],
+        "lives": 200,
+        "random": {
+            "samples": 50,
+            "seed": 1,
+            "params": {
+                "event_chance": {"low": 0.1, "high": 0.5},
+                "mortgage_rates": {"choices": [[0.035, 0.04, 0.045, 0.055], [0.05, 0.06, 0.07, 0.08]]}
+            }
+        }
+    }
+
+Each cell simulates the same seeds (0 to lives - 1) under one policy and set
+of parameters, so cells differ only by their rules. Cells are handed out one
+at a time to a process pool, so a worker that finishes early takes the next
+cell. Each finished cell is appended to the output as one JSON line; the
+output is also the checkpoint: running the same spec again skips the cells
+already in it. A cell is keyed by its policy, parameters and number of
+lives, so changing "lives" reruns every cell (the old records stay in the
+file, marked by their "lives").
+
+Usage:
+    python -m moneySmartz.sweep spec.json --output sweep.jsonl
+    python -m moneySmartz.sweep spec.json --output sweep.jsonl --processes 8
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from functools import partial
+
+def expand(spec):
+    """Get the cells of a sweep spec as a list of {"policy", "params"} dicts."""
+    from moneySmartz.policies import POLICIES
+    from moneySmartz.simulation import life_params
+
+    policies = spec.get("policies", ["default"])
+    for policy in policies:
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy: {policy}")
+
+    if "grid" in spec and "random" in spec:
+        raise ValueError("A sweep has either a grid or a random search, not both")
+
+    if "random" in spec:
+        search = spec["random"]
+        rng = random.Random(search.get("seed", 0))
+        param_sets = [
+            {name: sample(rng, values) for name, values in sorted(search["params"].items())}
+            for _ in range(search["samples"])
+        ]
+    else:
+        grid = spec.get("grid", {})
+        names = sorted(grid)
+        param_sets = [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+    for params in param_sets:
+        life_params(params)  # Check the names
+    return [{"policy": policy, "params": params} for policy in policies for params in param_sets]
+
+def sample(rng, values):
+    """Draw one value of a random search parameter: {"low", "high"} or {"choices"}."""
+    if "choices" in values:
+        return rng.choice(values["choices"])
+    low, high = values["low"], values["high"]
+    if isinstance(low, int) and isinstance(high, int):
+        return rng.randint(low, high)
+    return rng.uniform(low, high)
+
+def cell_key(cell, lives):
+    """Get the canonical key a cell run with a number of lives is checkpointed under."""
+    return json.dumps({"policy": cell["policy"], "params": cell["params"], "lives": lives}, sort_keys=True)
+
+def percentile(values, fraction):
+    """Get the value at a fraction (0 to 1) of the sorted values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def run_cell(cell, lives):
+    """Simulate a cell's lives (in a worker) and get its result record."""
+    from moneySmartz.simulation import simulate_life, run_summary
+
+    start = time.perf_counter()
+    summaries = [run_summary(simulate_life(seed, cell["policy"], params=cell["params"])) for seed in range(lives)]
+    net_worths = [summary["net_worth"] for summary in summaries]
+
+    ratings = {}
+    for summary in summaries:
+        ratings[summary["rating"]] = ratings.get(summary["rating"], 0) + 1
+
+    return {
+        "key": cell_key(cell, lives),
+        "policy": cell["policy"],
+        "params": cell["params"],
+        "lives": lives,
+        "net_worth_mean": sum(net_worths) / lives,
+        "net_worth_p10": percentile(net_worths, 0.1),
+        "net_worth_median": percentile(net_worths, 0.5),
+        "net_worth_p90": percentile(net_worths, 0.9),
+        "debt_mean": sum(summary["credit_card_debt"] + summary["loan_debt"] for summary in summaries) / lives,
+        "credit_score_mean": sum(summary["credit_score"] for summary in summaries) / lives,
+        "ratings": ratings,
+        "seconds": time.perf_counter() - start,
+    }
+
+def read_results(path):
+    """
+    Read the cell records of a sweep output. A line cut off by an
+    interrupted write is dropped from the file, so appending can carry on.
+    """
+    if not os.path.exists(path):
+        return []
+
+    with open(path, "rb+") as f:
+        data = f.read()
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            f.truncate(complete)
+    return [json.loads(line) for line in data[:complete].decode().splitlines() if line.strip()]
+
+def sweep(spec, output, processes=None, progress=None):
+    """
+    Run the cells of a sweep spec that aren't in output yet, appending each
+    result to output as it finishes. progress, if given, is called with
+    (cells done, cells total) after every cell.
+    Returns the number of cells run.
+    """
+    cells = expand(spec)
+    lives = spec.get("lives", 100)
+    done = {record["key"] for record in read_results(output)}
+    todo = [cell for cell in cells if cell_key(cell, lives) not in done]
+    finished = len(cells) - len(todo)
+    if progress:
+        progress(finished, len(cells))
+    if not todo:
+        return 0
+
+    with open(output, "a") as f, multiprocessing.Pool(processes) as pool:
+        # chunksize=1: idle workers pull the next cell, so slow cells don't hold others up
+        for record in pool.imap_unordered(partial(run_cell, lives=lives), todo, chunksize=1):
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+            finished += 1
+            if progress:
+                progress(finished, len(cells))
+    return len(todo)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parameter sweeps over the game's rules and policies.")
+    parser.add_argument("spec", help="sweep spec JSON file")
+    parser.add_argument("--output", default="sweep.jsonl", help="results JSON lines file, also the checkpoint (default: sweep.jsonl)")
+    parser.add_argument("--processes", type=int, help="worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    with open(args.spec) as f:
+        spec = json.load(f)
+
+    def progress(done, total):
+        print(f"\r{done}/{total} cells", end="", file=sys.stderr, flush=True)
+
+    try:
+        ran = sweep(spec, args.output, args.processes, progress)
+    except KeyboardInterrupt:
+        print(f"\nInterrupted; run again to resume from {args.output}", file=sys.stderr)
+        return 130
+    print(f"\nRan {ran} cells into {args.output}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,70 +1,200 @@
+import bisect
+import math
 import pygame
+import time
+from collections import OrderedDict, deque
 from pygame.locals import *
 from moneySmartz.constants import *
+from moneySmartz.profiler import FrameProfiler, counters
+from moneySmartz.layout import layout, scaled_text
+from moneySmartz import draw, metrics
 
-class Button:
+# Fonts shared by every screen and widget, keyed by (family, size, bold)
+_fonts = {}
+
+# pygame fonts at window scale, keyed by (family, pixel size, bold)
+_scaled_fonts = {}
+
+class ScaledFont:
+    """
+    A font with a logical size. It renders with the pygame font of that size
+    scaled to the window, loaded once per scale, and returns text that is
+    laid out in logical pixels.
+    """
+    def __init__(self, size, bold=False, family=FONT_FAMILY):
+        self.size = size
+        self.bold = bold
+        self.family = family
+
+    def font(self):
+        """Get the pygame font for the current layout."""
+        key = (self.family, layout.font_size(self.size), self.bold)
+        font = _scaled_fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(self.family, key[1], bold=self.bold)
+            _scaled_fonts[key] = font
+        return font
+
+    def render(self, text, antialias, color, background=None):
+        """Render text at the window scale (same arguments as Font.render)."""
+        return scaled_text(self.font().render(text, antialias, color, background))
+
+def get_font(size, bold=False, family=FONT_FAMILY):
+    """Get a shared font, creating it on first use."""
+    key = (family, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        font = ScaledFont(size, bold, family)
+        _fonts[key] = font
+    return font
+
+def surface_bytes(surface):
+    """Get the pixel memory of a surface."""
+    return surface.get_pitch() * pygame.Surface.get_height(surface)
+
+class TextCache:
+    """
+    A bounded LRU cache of rendered text surfaces, keyed by
+    (text, font, color, antialias) and the layout version. When the cached
+    surfaces take more than max_bytes of pixel memory, the least recently
+    used ones are evicted.
+    """
+    def __init__(self, max_bytes=TEXT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """Get a rendered text surface, rendering it only on a cache miss."""
+        key = (text, font, tuple(color), antialias, layout.version)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        counters["font_renders"] += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        self.bytes += surface_bytes(surface)
+
+        # Evict least recently used surfaces until under budget
+        while self.bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, old_surface = self.surfaces.popitem(last=False)
+            self.bytes -= surface_bytes(old_surface)
+
+        return surface
+
+    def hit_rate(self):
+        """Get the fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        """Drop all cached surfaces and reset the counters."""
+        self.surfaces.clear()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+# Rendered text shared by every screen and widget
+text_cache = TextCache()
+
+def render_text(font, text, antialias, color):
+    """Render text through the shared text cache (same arguments as Font.render)."""
+    return text_cache.render(font, text, antialias, color)
+
+class Widget:
+    """
+    Base class for widgets. rect is in logical coordinates; window_rect is
+    where the widget is on the window, recomputed once per layout.
+    """
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+        self._window_rect = None
+        self._layout_version = None
+
+    @property
+    def window_rect(self):
+        """Get the widget's rect on the window."""
+        if self._layout_version != layout.version:
+            self._window_rect = layout.rect(self.rect)
+            self._layout_version = layout.version
+        return self._window_rect
+
+class Button(Widget):
     """
     A button UI element that can be clicked to trigger an action.
     """
     def __init__(self, x, y, width, height, text, color=BLUE, hover_color=LIGHT_BLUE, text_color=WHITE, font_size=FONT_MEDIUM, action=None):
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__(x, y, width, height)
         self.text = text
         self.color = color
         self.hover_color = hover_color
         self.text_color = text_color
-        self.font = pygame.font.SysFont('Arial', font_size)
+        self.font = get_font(font_size)
         self.action = action
         self.hovered = False
+        self.dirty = True  # Needs to be redrawn
 
     def draw(self, surface):
         """Draw the button on the given surface."""
         color = self.hover_color if self.hovered else self.color
-        pygame.draw.rect(surface, color, self.rect)
-        pygame.draw.rect(surface, BLACK, self.rect, 2)  # Border
+        pygame.draw.rect(surface, color, self.window_rect)
+        draw.rect(surface, BLACK, self.rect, 2)  # Border
 
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = render_text(self.font, self.text, True, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        draw.blit(surface, text_surface, text_rect)
 
     def update(self, mouse_pos, mouse_click):
         """
         Update the button state based on mouse position and click.
         Returns the action if the button is clicked, None otherwise.
         """
-        self.hovered = self.rect.collidepoint(mouse_pos)
+        hovered = self.window_rect.collidepoint(mouse_pos)
+        if hovered != self.hovered:
+            self.hovered = hovered
+            self.dirty = True
         if self.hovered and mouse_click and self.action:
             return self.action
         return None
 
-class TextInput:
+class TextInput(Widget):
     """
     A text input field that allows the user to enter text.
     """
     def __init__(self, x, y, width, height, font_size=FONT_MEDIUM, max_length=20, initial_text=""):
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__(x, y, width, height)
         self.text = initial_text
-        self.font = pygame.font.SysFont('Arial', font_size)
+        self.font = get_font(font_size)
         self.active = False
         self.max_length = max_length
+        self.dirty = True  # Needs to be redrawn
 
     def draw(self, surface):
         """Draw the text input field on the given surface."""
         color = LIGHT_BLUE if self.active else WHITE
-        pygame.draw.rect(surface, color, self.rect)
-        pygame.draw.rect(surface, BLACK, self.rect, 2)  # Border
+        pygame.draw.rect(surface, color, self.window_rect)
+        draw.rect(surface, BLACK, self.rect, 2)  # Border
 
-        text_surface = self.font.render(self.text, True, BLACK)
+        text_surface = render_text(self.font, self.text, True, BLACK)
         text_rect = text_surface.get_rect(midleft=(self.rect.left + 10, self.rect.centery))
-        surface.blit(text_surface, text_rect)
+        draw.blit(surface, text_surface, text_rect)
 
     def update(self, events):
         """
         Update the text input field based on user input.
         Returns the current text.
         """
+        old_state = (self.text, self.active)
+
         for event in events:
             if event.type == MOUSEBUTTONDOWN:
-                self.active = self.rect.collidepoint(event.pos)
+                self.active = self.window_rect.collidepoint(event.pos)
 
             if event.type == KEYDOWN and self.active:
                 if event.key == K_BACKSPACE:
@@ -74,8 +204,300 @@ class TextInput:
                 elif len(self.text) < self.max_length:
                     self.text += event.unicode
 
+        if (self.text, self.active) != old_state:
+            self.dirty = True
+
         return self.text
 
+class ScrollList(Widget):
+    """
+    A scrollable list that only draws the rows in view.
+    format_row(item) returns the (text, color) of a row. Rendered rows are
+    cached by index, so drawing costs O(visible rows) however long the list
+    is. Scrolling is by logical pixels, with the mouse wheel or scroll_by;
+    scroll_to, scroll_to_end and scroll_to_item jump. set_filter shows only
+    the items a predicate accepts. numbered rows start with their item's
+    number, which stays the same when the list is filtered.
+    """
+    def __init__(self, x, y, width, height, items, format_row, row_height=30, font_size=FONT_MEDIUM, max_cached_rows=200, numbered=False):
+        super().__init__(x, y, width, height)
+        self.items = items
+        self.format_row = format_row
+        self.numbered = numbered
+        self.row_height = row_height
+        self.font = get_font(font_size)
+        self.max_cached_rows = max_cached_rows
+        self.scroll_y = 0  # Pixels scrolled from the top
+        self.row_cache = OrderedDict()  # Item index -> rendered surface
+        self.row_cache_version = layout.version  # Rows are rendered for one layout
+        self.filter = None  # Predicate on items, or None to show every item
+        self.shown = []  # Indices of the items the filter accepted
+        self.filtered_count = 0  # Items the filter has been run on (items only grow)
+        self.dirty = True  # Needs to be redrawn
+
+    def rows(self):
+        """Get the indices of the items shown, in order."""
+        if self.filter is None:
+            return range(len(self.items))
+        if self.filtered_count < len(self.items):
+            self.shown.extend(index for index in range(self.filtered_count, len(self.items)) if self.filter(self.items[index]))
+            self.filtered_count = len(self.items)
+        return self.shown
+
+    def set_filter(self, predicate):
+        """Show only the items predicate accepts (None shows them all) and scroll to the top."""
+        self.filter = predicate
+        self.shown = []
+        self.filtered_count = 0
+        self.scroll_y = 0
+        self.dirty = True
+
+    def max_scroll(self):
+        """Get the largest scroll offset in pixels."""
+        return max(0, len(self.rows()) * self.row_height - self.rect.height)
+
+    def scroll_by(self, pixels):
+        """Scroll by a number of pixels (positive scrolls down)."""
+        scroll_y = min(max(self.scroll_y + pixels, 0), self.max_scroll())
+        if scroll_y != self.scroll_y:
+            self.scroll_y = scroll_y
+            self.dirty = True
+
+    def scroll_to(self, index):
+        """Scroll so a row is at the top (or as close as possible)."""
+        self.scroll_by(index * self.row_height - self.scroll_y)
+
+    def scroll_to_end(self):
+        """Scroll to the last row."""
+        self.scroll_by(self.max_scroll() - self.scroll_y)
+
+    def scroll_to_item(self, number):
+        """Scroll to the first row shown at or after an item number (counted from 1)."""
+        self.scroll_to(bisect.bisect_left(self.rows(), number - 1))
+
+    def update(self, events):
+        """Scroll with the mouse wheel while the pointer is over the list."""
+        for event in events:
+            if event.type == MOUSEWHEEL and self.window_rect.collidepoint(pygame.mouse.get_pos()):
+                self.scroll_by(-event.y * SCROLL_STEP)
+
+    def row_surface(self, index):
+        """Get the rendered surface of an item's row, rendering it on first use."""
+        if self.row_cache_version != layout.version:
+            self.row_cache.clear()
+            self.row_cache_version = layout.version
+
+        surface = self.row_cache.get(index)
+        if surface is None:
+            text, color = self.format_row(self.items[index])
+            if self.numbered:
+                text = f"{index + 1}. {text}"
+            counters["font_renders"] += 1
+            surface = self.font.render(text, True, color)
+            self.row_cache[index] = surface
+            if len(self.row_cache) > self.max_cached_rows:
+                self.row_cache.popitem(last=False)
+        else:
+            self.row_cache.move_to_end(index)
+        return surface
+
+    def draw(self, surface):
+        """Draw the visible rows, clipped to the list area."""
+        pygame.draw.rect(surface, LIGHT_GRAY, self.window_rect)
+
+        previous_clip = surface.get_clip()
+        surface.set_clip(self.window_rect)
+
+        rows = self.rows()
+        first = self.scroll_y // self.row_height
+        last = min(len(rows), (self.scroll_y + self.rect.height) // self.row_height + 1)
+        for index in range(first, last):
+            row = self.row_surface(rows[index])
+            y = self.rect.top + index * self.row_height - self.scroll_y
+            draw.blit(surface, row, (self.rect.left + 20, y + (self.row_height - row.get_height()) // 2))
+
+        surface.set_clip(previous_clip)
+
+        # Scroll bar
+        if self.max_scroll() > 0:
+            content_height = len(rows) * self.row_height
+            thumb_height = max(20, self.rect.height * self.rect.height // content_height)
+            thumb_y = self.rect.top + (self.rect.height - thumb_height) * self.scroll_y // self.max_scroll()
+            draw.rect(surface, DARK_GRAY, (self.rect.right - 10, thumb_y, 8, thumb_height))
+
+        draw.rect(surface, BLACK, self.rect, 2)  # Border
+
+def format_money_short(value):
+    """Format an amount compactly for chart labels (e.g. $1.2M, -$35k)."""
+    sign = "-" if value < 0 else ""
+    value = abs(value)
+    if value >= 1000000:
+        return f"{sign}${value / 1000000:.1f}M"
+    if value >= 1000:
+        return f"{sign}${value / 1000:.0f}k"
+    return f"{sign}${value:.0f}"
+
+def nice_ceiling(value):
+    """Get the smallest of 1, 2 or 5 times a power of ten that is at least value (> 0)."""
+    power = 10 ** math.floor(math.log10(value))
+    for step in (1, 2, 5, 10):
+        if step * power >= value:
+            return step * power
+
+class TimeSeriesChart(Widget):
+    """
+    A line chart of monthly values, one point per month for each series.
+    Points are kept in ring buffers of capacity months, and the plot is kept
+    on a persistent surface: appending a month draws one new segment per
+    series. The whole plot is redrawn only when a value leaves the y range
+    (which then grows with headroom), when a full buffer drops its oldest
+    month and the plot scrolls, or when the layout changes.
+    series is a list of (label, color).
+    """
+    def __init__(self, x, y, width, height, series, capacity=HISTORY_MONTHS, font_size=FONT_SMALL):
+        super().__init__(x, y, width, height)
+        self.series = series
+        self.capacity = capacity
+        self.points = [deque(maxlen=capacity) for _ in series]
+        self.font = get_font(font_size)
+        self.low = 0.0  # y range
+        self.high = 0.0
+        self.plot = None  # Persistent plot surface in window pixels
+        self.replots = 0
+        self.dirty = True  # Needs to be redrawn
+
+    def __len__(self):
+        return len(self.points[0])
+
+    def clear(self):
+        """Remove all points."""
+        for points in self.points:
+            points.clear()
+        self.low = self.high = 0.0
+        self.plot = None
+        self.dirty = True
+
+    def append(self, values):
+        """Add one month's values (one per series) and draw the new segment."""
+        scrolled = len(self) == self.capacity
+        for points, value in zip(self.points, values):
+            points.append(value)
+
+        if self.expand_range(values) or scrolled:
+            self.plot = None  # Redrawn in full on the next draw
+        elif self.plot is not None:
+            self.draw_segment(len(self) - 1)
+        self.dirty = True
+
+    def extend(self, rows):
+        """Add many months at once; the plot is redrawn once on the next draw."""
+        for values in rows:
+            for points, value in zip(self.points, values):
+                points.append(value)
+            self.expand_range(values)
+        self.plot = None
+        self.dirty = True
+
+    def expand_range(self, values):
+        """Grow the y range to include values (always including 0). Returns whether it changed."""
+        low = min(self.low, min(values))
+        high = max(self.high, max(values))
+        if low >= self.low and high <= self.high:
+            return False
+
+        # Round out to 1, 2 or 5 times a power of ten with headroom, so a
+        # growing series only redraws the plot a few times per tenfold growth
+        if low < self.low:
+            self.low = -nice_ceiling(-low * 1.25)
+        if high > self.high:
+            self.high = nice_ceiling(high * 1.25)
+        return True
+
+    def pixel(self, index, value, size):
+        """Get the plot surface position of a point."""
+        width, height = size
+        x = index * (width - 1) / max(1, self.capacity - 1)
+        y = (height - 1) - (value - self.low) * (height - 1) / ((self.high - self.low) or 1.0)
+        return (x, y)
+
+    def draw_segment(self, index):
+        """Draw the segments ending at a point onto the plot surface."""
+        if index == 0:
+            return
+        size = self.plot.get_size()
+        line_width = layout.length(2)
+        for (label, color), points in zip(self.series, self.points):
+            start = self.pixel(index - 1, points[index - 1], size)
+            end = self.pixel(index, points[index], size)
+            pygame.draw.line(self.plot, color, start, end, line_width)
+
+    def replot(self, size):
+        """Redraw the whole plot surface."""
+        self.plot = pygame.Surface(size)
+        self.plot.fill(WHITE)
+        self.replots += 1
+
+        if self.low < 0 < self.high:
+            zero_y = self.pixel(0, 0, size)[1]
+            pygame.draw.line(self.plot, GRAY, (0, zero_y), (size[0] - 1, zero_y))
+
+        line_width = layout.length(2)
+        for (label, color), points in zip(self.series, self.points):
+            if len(points) > 1:
+                pygame.draw.lines(self.plot, color, False, [self.pixel(i, value, size) for i, value in enumerate(points)], line_width)
+
+    def draw(self, surface):
+        """Draw the chart: the cached plot, the y range labels and the legend."""
+        window_rect = self.window_rect
+        if self.plot is None or self.plot.get_size() != window_rect.size:
+            self.replot(window_rect.size)
+        surface.blit(self.plot, window_rect)
+        draw.rect(surface, BLACK, self.rect, 1)  # Border
+
+        high_surface = render_text(self.font, format_money_short(self.high), True, DARK_GRAY)
+        draw.blit(surface, high_surface, (self.rect.left + 4, self.rect.top + 2))
+        low_surface = render_text(self.font, format_money_short(self.low), True, DARK_GRAY)
+        draw.blit(surface, low_surface, low_surface.get_rect(bottomleft=(self.rect.left + 4, self.rect.bottom - 2)))
+
+        right = self.rect.right - 4
+        for label, color in reversed(self.series):
+            label_surface = render_text(self.font, label, True, color)
+            label_rect = label_surface.get_rect(topright=(right, self.rect.top + 2))
+            draw.blit(surface, label_surface, label_rect)
+            right = label_rect.left - 10
+
+class Layer:
+    """
+    A cached surface for artwork that rarely changes.
+    The paint function draws the layer on a new surface; it runs again only
+    when the key passed to draw changes, the target size changes, or the
+    layer is invalidated. Dynamic text and buttons are drawn on top.
+    """
+    def __init__(self, paint, background=WHITE):
+        self.paint = paint
+        self.background = background  # None for a transparent layer
+        self.surface = None
+        self.key = None
+        self.renders = 0
+
+    def invalidate(self):
+        """Repaint the layer the next time it is drawn."""
+        self.surface = None
+
+    def draw(self, surface, key=None):
+        """Blit the layer onto a surface, repainting it first if it is stale."""
+        size = surface.get_size()
+        if self.surface is None or self.surface.get_size() != size or key != self.key:
+            if self.background is None:
+                self.surface = pygame.Surface(size, pygame.SRCALPHA)
+            else:
+                self.surface = pygame.Surface(size, 0, surface)
+                self.surface.fill(self.background)
+            self.paint(self.surface)
+            self.key = key
+            self.renders += 1
+        surface.blit(self.surface, (0, 0))
+
 class Screen:
     """
     Base class for all screens in the game.
@@ -83,8 +505,13 @@ class Screen:
     def __init__(self, game):
         self.game = game
         self.buttons = []
+        self.widgets = []  # Widgets other than buttons (text inputs, lists), so their changes are redrawn
         self.next_screen = None
 
+        # Regions changed since the last frame
+        self.dirty_rects = []
+        self.full_redraw = True
+
     def handle_events(self, events):
         """Handle pygame events for this screen."""
         mouse_pos = pygame.mouse.get_pos()
@@ -97,6 +524,7 @@ class Screen:
         for button in self.buttons:
             action = button.update(mouse_pos, mouse_click)
             if action:
+                self.mark_dirty()  # Actions can change anything on screen
                 action()
                 return
 
@@ -104,42 +532,301 @@ class Screen:
         """Update the screen state."""
         pass
 
+    def on_resume(self):
+        """Called when the screen is shown again after another screen."""
+        pass
+
+    def clear_hover(self):
+        """Forget the buttons' hover from an earlier visit (the next frame recomputes it)."""
+        for button in self.buttons:
+            if button.hovered:
+                button.hovered = False
+                button.dirty = True
+
+    def is_animating(self):
+        """Whether the screen changes every frame without any input."""
+        return False
+
+    def mark_dirty(self, rect=None):
+        """Report a changed region of the screen in logical coordinates (the whole screen if rect is None)."""
+        if rect is None:
+            self.full_redraw = True
+        else:
+            self.dirty_rects.append(layout.rect(rect))
+
+    def collect_dirty(self):
+        """
+        Get the regions changed since the last call, including widgets whose
+        state changed. Returns None if the whole screen must be redrawn.
+        """
+        for widget in self.buttons + self.widgets:
+            if widget.dirty:
+                self.dirty_rects.append(widget.window_rect.copy())
+                widget.dirty = False
+
+        if self.full_redraw or self.is_animating():
+            dirty = None
+        else:
+            dirty = self.dirty_rects
+
+        self.dirty_rects = []
+        self.full_redraw = False
+        return dirty
+
     def draw(self, surface):
         """Draw the screen on the given surface."""
         surface.fill(WHITE)
         for button in self.buttons:
             button.draw(surface)
 
+class FrameStats:
+    """
+    Frame statistics measured by the GUI manager.
+    Frame times cover event handling, updating and drawing, not sleeping.
+    """
+    def __init__(self, window=120):
+        self.frame_times = deque(maxlen=window)
+        self.idle_cpu_times = deque(maxlen=window)  # CPU seconds per idle wait, including the wait itself
+        self.reset()
+
+    def reset(self):
+        """Start measuring from now."""
+        self.frame_times.clear()
+        self.idle_cpu_times.clear()
+        self.frames = 0
+        self.idle_waits = 0
+        self.cpu_start = time.process_time()
+        self.wall_start = time.perf_counter()
+
+    def add_frame(self, seconds):
+        """Record the time spent on one frame."""
+        self.frame_times.append(seconds)
+        self.frames += 1
+
+    def add_idle_wait(self, cpu_seconds):
+        """Record the CPU time used by one idle wait."""
+        self.idle_cpu_times.append(cpu_seconds)
+        self.idle_waits += 1
+
+    def average_idle_cpu(self):
+        """Get the average CPU time of recent idle waits in seconds."""
+        return sum(self.idle_cpu_times) / len(self.idle_cpu_times) if self.idle_cpu_times else 0.0
+
+    def average_frame_time(self):
+        """Get the average time of recent frames in seconds."""
+        return sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+
+    def fps(self):
+        """Get the average frames per second since the last reset."""
+        elapsed = time.perf_counter() - self.wall_start
+        return self.frames / elapsed if elapsed > 0 else 0.0
+
+    def cpu_usage(self):
+        """Get the fraction of a CPU used by the process since the last reset."""
+        elapsed = time.perf_counter() - self.wall_start
+        return (time.process_time() - self.cpu_start) / elapsed if elapsed > 0 else 0.0
+
+    def summary(self):
+        """Get the statistics as a dict."""
+        return {
+            "frames": self.frames,
+            "idle_waits": self.idle_waits,
+            "fps": self.fps(),
+            "average_frame_ms": self.average_frame_time() * 1000,
+            "cpu_usage": self.cpu_usage(),
+        }
+
 class GUIManager:
     """
     Manages the GUI and screen transitions.
     """
     def __init__(self, game):
         self.game = game
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), RESIZABLE)
+        layout.resize(*self.screen.get_size())
         pygame.display.set_caption("Money Smartz: Financial Life Simulator")
         self.clock = pygame.time.Clock()
         self.current_screen = None
         self.running = True
+        self.full_redraw = True
+
+        # Screens kept alive to return to
+        self.screen_stack = []
+        self.game_screen = None  # One GameScreen reused for the whole game
+        self.screen_cache = {}  # Screen class -> (state it shows, screen), see push_cached_screen
+
+        # Idle scheduling: block on input instead of ticking at full FPS
+        self.idle_cpu_target = IDLE_CPU_TARGET
+        self.last_activity = time.perf_counter()
+        self.frame_stats = FrameStats()
+
+        # Frame profiler overlay (toggled with F3), drawn at its native size whatever the window size
+        self.profiler = FrameProfiler(pygame.font.SysFont(FONT_FAMILY, FONT_SMALL))
 
     def set_screen(self, screen):
         """Set the current screen to be displayed."""
         self.current_screen = screen
+        self.full_redraw = True  # Transitions always repaint the whole window
+        self.last_activity = time.perf_counter()
+        if metrics.registry.enabled:
+            metrics.screen_transitions.inc(type(screen).__name__)
+
+    def push_screen(self, screen):
+        """Show a screen on top of the current one, keeping the current one to return to."""
+        if self.current_screen:
+            self.screen_stack.append(self.current_screen)
+        self.set_screen(screen)
+
+    def push_cached_screen(self, screen_class, state=None):
+        """
+        Push a screen of screen_class, reusing the instance from the last
+        time while the game, its player and state (what the screen was built
+        from, compared with ==) are the same. A reused screen forgets its
+        hover, and its on_resume resets the rest of an earlier visit's state.
+        """
+        key = (self.game, self.game.player, state)
+        cached = self.screen_cache.get(screen_class)
+        if cached and cached[0] == key:
+            screen = cached[1]
+            screen.clear_hover()
+            self.push_screen(screen)
+            screen.on_resume()
+        else:
+            screen = screen_class(self.game)
+            self.screen_cache[screen_class] = (key, screen)
+            self.push_screen(screen)
+        return screen
+
+    def pop_screen(self):
+        """Return to the screen below the current one."""
+        if self.screen_stack:
+            screen = self.screen_stack.pop()
+            self.set_screen(screen)
+            screen.on_resume()
+
+    def return_to_game(self):
+        """Return to the game screen, reusing the same instance every time."""
+        self.screen_stack.clear()
+        if self.game_screen is None:
+            from moneySmartz.screens.game_screen import GameScreen
+            self.game_screen = GameScreen(self.game)
+            self.set_screen(self.game_screen)
+        else:
+            self.set_screen(self.game_screen)
+            self.game_screen.on_resume()
 
     def run(self):
-        """Run the main game loop."""
-        while self.running and not self.game.game_over:
-            events = pygame.event.get()
+        """
+        Run the main game loop until the window is closed or a screen stops
+        it (the end game screen stays up after game_over until Quit).
+        """
+        while self.running:
+            if self.is_idle():
+                # Nothing to animate: sleep until input arrives
+                cpu_start = time.process_time()
+                event = pygame.event.wait(self.idle_timeout())
+                events = [] if event.type == NOEVENT else [event]
+                events += pygame.event.get()
+                self.frame_stats.add_idle_wait(time.process_time() - cpu_start)
+            else:
+                events = pygame.event.get()
+
+            if events:
+                self.last_activity = time.perf_counter()
+
+            frame_start = time.perf_counter()
             for event in events:
                 if event.type == QUIT:
                     self.running = False
+                elif event.type in (VIDEOEXPOSE, WINDOWEXPOSED):
+                    self.full_redraw = True
+                elif event.type == VIDEORESIZE:
+                    self.resize()
+                elif event.type == KEYDOWN and event.key == K_F3:
+                    self.profiler.toggle()
+                    self.full_redraw = True
 
-            if self.current_screen:
+            if self.current_screen and self.profiler.visible:
+                self.run_profiled_frame(events)
+            elif self.current_screen:
                 self.current_screen.handle_events(events)
                 self.current_screen.update()
-                self.current_screen.draw(self.screen)
+                self.render()
 
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            frame_time = time.perf_counter() - frame_start
+            self.frame_stats.add_frame(frame_time)
+            if metrics.registry.enabled:
+                metrics.frame_seconds.observe(frame_time)
+            if not self.is_idle():
+                self.clock.tick(FPS)
+
+        pygame.quit()
 
-        pygame.quit()
\ No newline at end of file
+    def resize(self):
+        """
+        Lay the screens out for the new window size. This is the only work a
+        resize costs: widget rects, fonts and text are redone once for the new
+        layout, not scaled every frame.
+        """
+        self.screen = pygame.display.get_surface()
+        if self.screen.get_size() != layout.size:
+            layout.resize(*self.screen.get_size())
+            _scaled_fonts.clear()  # Text rendered at the old size ages out of the text cache
+        self.full_redraw = True
+
+    def is_idle(self):
+        """Whether the loop can sleep until input: no animation, no pending redraw, no recent input."""
+        screen = self.current_screen
+        if screen is None or screen.is_animating() or self.full_redraw or self.profiler.visible:
+            return False
+        return time.perf_counter() - self.last_activity > IDLE_DELAY
+
+    def idle_timeout(self):
+        """
+        Get how long to wait for input between idle frames (in ms), so that
+        idle frames use about idle_cpu_target of a CPU.
+        """
+        idle_cpu = self.frame_stats.average_idle_cpu() + self.frame_stats.average_frame_time()
+        timeout = idle_cpu * (1 - self.idle_cpu_target) / self.idle_cpu_target * 1000
+        return int(min(max(timeout, 1000 / FPS), IDLE_MAX_WAIT_MS))
+
+    def run_profiled_frame(self, events):
+        """
+        Run one frame with the profiler overlay: time each phase, count
+        blits and text renders, and redraw the whole window with the overlay.
+        """
+        self.profiler.begin_frame(text_cache)
+        screen = self.current_screen
+
+        start = time.perf_counter()
+        screen.handle_events(events)
+        events_done = time.perf_counter()
+        self.current_screen.update()
+        update_done = time.perf_counter()
+
+        target = self.profiler.target(self.screen)
+        self.current_screen.collect_dirty()
+        self.current_screen.draw(target)
+        draw_done = time.perf_counter()
+
+        self.profiler.end_frame(events_done - start, update_done - events_done, draw_done - update_done, text_cache)
+
+        self.screen.blit(target, (0, 0))
+        self.profiler.draw(self.screen, type(self.current_screen).__name__)
+        pygame.display.flip()
+        self.full_redraw = False
+
+    def render(self):
+        """
+        Redraw the current screen if anything changed and push only the
+        changed regions to the display.
+        """
+        dirty = self.current_screen.collect_dirty()
+
+        if self.full_redraw or dirty is None:
+            self.current_screen.draw(self.screen)
+            pygame.display.flip()
+            self.full_redraw = False
+        elif dirty:
+            self.current_screen.draw(self.screen)
+            pygame.display.update(dirty)
\ No newline at end of file
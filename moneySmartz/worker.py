@@ -0,0 +1,136 @@
+"""
+Background simulation for fast forwarding.
+
+A SimulationWorker advances a game month by month on its own thread, doing
+what GameScreen.continue_to_next_month does each month (random events
+included) without touching the UI. After every month it publishes an
+immutable Snapshot; the UI thread only reads the latest snapshot while the
+worker runs. When a life stage event is due the worker pauses, so the UI
+can show the event's screen and let the player decide, and resume() carries
+on from there. On autopilot the worker is given a Policy (see
+moneySmartz.policies) that makes those decisions instead, so it never
+pauses. cancel() stops the worker after the current month.
+"""
+
+import random
+import threading
+from collections import namedtuple
+from moneySmartz.constants import FAST_FORWARD_MONTH_DELAY
+from moneySmartz.simulation import decide_month
+
+EVENT_CHANCE = 0.3  # 30% chance of a random event each month
+RETIREMENT_AGE = 65
+RECENT_EVENTS = 5  # Random events kept in a snapshot
+
+# Worker states
+READY = "ready"
+RUNNING = "running"
+PAUSED = "paused"
+DONE = "done"
+CANCELLED = "cancelled"
+
+Snapshot = namedtuple("Snapshot", [
+    "months_done", "months_total", "month", "year", "age",
+    "cash", "bank_balance", "debt", "asset_value", "net_worth",
+    "events",  # Recent random events as (name, cash effect), newest last
+])
+
+class SimulationWorker:
+    """
+    Simulates up to a number of months of a game on a background thread.
+    """
+    def __init__(self, game, months, month_delay=FAST_FORWARD_MONTH_DELAY, policy=None):
+        self.game = game
+        self.months = months
+        self.month_delay = month_delay
+        self.policy = policy  # Makes the player's decisions on autopilot
+        self.months_done = 0
+        self.state = READY
+        self.life_event = None  # The life stage event the worker is paused for
+        self.events = ()
+        self.snapshot = self.take_snapshot()
+
+        self._cancel = threading.Event()
+        self._resume = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start simulating on a new thread."""
+        self.state = RUNNING
+        self._thread = threading.Thread(target=self.run, name="SimulationWorker", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """Stop after the current month (also ends a pause)."""
+        self._cancel.set()
+        self._resume.set()
+
+    def resume(self):
+        """Carry on after the life stage event the worker paused for."""
+        self.life_event = None
+        self.state = RUNNING
+        self._resume.set()
+
+    def join(self, timeout=None):
+        """Wait for the thread to finish."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def finished(self):
+        """Whether the worker has stopped for good."""
+        return self.state in (DONE, CANCELLED)
+
+    def run(self):
+        """Simulate the months (thread target)."""
+        game = self.game
+        while self.months_done < self.months and not self._cancel.is_set():
+            self.simulate_month()
+            self.months_done += 1
+            self.snapshot = self.take_snapshot()
+
+            if game.player.age >= RETIREMENT_AGE:
+                game.end_month()
+                break
+
+            event = game.due_life_stage_event()
+            paused = False
+            if self.policy:
+                decide_month(game, self.policy, event)
+
+            # Hand control back to the UI for life stage decisions
+            elif event:
+                self.life_event = event
+                self.state = PAUSED
+                self._resume.wait()
+                self._resume.clear()
+                paused = True
+
+            game.end_month()
+            if self.policy or paused:
+                self.snapshot = self.take_snapshot()  # The decisions changed the game
+
+            if self.month_delay and not paused:
+                self._cancel.wait(self.month_delay)
+
+        self.state = CANCELLED if self._cancel.is_set() else DONE
+
+    def simulate_month(self):
+        """Advance one month, applying random events like the game screen does."""
+        game = self.game
+        game.advance_month()
+
+        if random.random() < EVENT_CHANCE:
+            event, cash_effect = game.roll_random_event()
+            if cash_effect != 0:
+                game.apply_event_effect(cash_effect)
+                self.events = (self.events + ((event["name"], cash_effect),))[-RECENT_EVENTS:]
+
+    def take_snapshot(self):
+        """Get an immutable snapshot of the game's current state."""
+        game = self.game
+        summary = game.get_financial_summary()
+        return Snapshot(
+            self.months_done, self.months, game.current_month, game.current_year, game.player.age,
+            summary["cash"], summary["bank_balance"], summary["credit_card_debt"] + summary["loan_debt"],
+            summary["asset_value"], summary["net_worth"], self.events,
+        )